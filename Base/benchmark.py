@@ -0,0 +1,247 @@
+#!/usr/bin/python3
+
+"""Micro benchmarks for the Base components
+
+Usage:
+    benchmark.py <mode> < input.asm
+
+Large inputs can be generated with serialize.SynthesizeBenchmark, e.g.:
+    cat ../TestData/nano_jpeg.64.asm | ./serialize.py 100 > benchmark.asm
+
+The reg_alloc mode ignores the input and synthesizes large Bbls instead.
+"""
+
+import collections
+import io
+import os
+import random
+import sys
+import time
+import tracemalloc
+from typing import List, Dict, Callable, TextIO
+
+from Base import cfg
+from Base import ir
+from Base import liveness
+from Base import opcode_tab as o
+from Base import optimize
+from Base import parallel
+from Base import reaching_defs
+from Base import reg_alloc
+from Base import serialize
+from Util import parse
+
+
+def _NormalFuns(unit: ir.Unit) -> List[ir.Fun]:
+    return [fun for fun in unit.funs if fun.kind is o.FUN_KIND.NORMAL]
+
+
+def _TimeFuns(funs: List[ir.Fun], action: Callable[[ir.Fun], None]) -> float:
+    start = time.perf_counter()
+    for fun in funs:
+        action(fun)
+    return time.perf_counter() - start
+
+
+def BenchmarkLiveness(fin: TextIO):
+    unit = serialize.UnitParseFromAsm(fin)
+    funs = _NormalFuns(unit)
+    for fun in funs:
+        optimize.FunCfgInit(fun, unit)
+    num_bbls = sum(len(fun.bbls) for fun in funs)
+    num_regs = sum(len(fun.regs) for fun in funs)
+    print(f"# funs: {len(funs)}  bbls: {num_bbls}  regs: {num_regs}")
+
+    t_sets = _TimeFuns(funs, liveness.FunComputeLivenessInfoWithSets)
+    expected: Dict[str, List[List[str]]] = {
+        fun.name: [sorted(r.name for r in bbl.live_out) for bbl in fun.bbls] for fun in funs}
+    t_bits = _TimeFuns(funs, liveness.FunComputeLivenessInfo)
+    for fun in funs:
+        actual = [sorted(r.name for r in bbl.live_out) for bbl in fun.bbls]
+        assert actual == expected[fun.name], f"liveness mismatch in {fun.name}"
+    print(f"liveness sets: {t_sets:8.3f}s")
+    print(f"liveness bits: {t_bits:8.3f}s  (speedup {t_sets / t_bits:.2f}x)")
+
+
+def _InsDefs(fun: ir.Fun) -> List[List[str]]:
+    # merge points (Bbls) depend on the iteration order so we only compare Ins
+    return [[str(id(d)) if isinstance(d, ir.Ins) else type(d).__name__
+             for d in ins.operand_defs] for bbl in fun.bbls for ins in bbl.inss]
+
+
+def BenchmarkReachingDefs(fin: TextIO):
+    unit = serialize.UnitParseFromAsm(fin)
+    funs = _NormalFuns(unit)
+    for fun in funs:
+        optimize.FunCfgInit(fun, unit)
+        cfg.FunRemoveUnreachableBbls(fun)
+    num_bbls = sum(len(fun.bbls) for fun in funs)
+    num_inss = sum(len(bbl.inss) for fun in funs for bbl in fun.bbls)
+    print(f"# funs: {len(funs)}  bbls: {num_bbls}  inss: {num_inss}")
+
+    t_maps = _TimeFuns(funs, reaching_defs.FunComputeReachingDefsWithMaps)
+    expected: Dict[str, List[List[str]]] = {fun.name: _InsDefs(fun) for fun in funs}
+    t_bits = _TimeFuns(funs, reaching_defs.FunComputeReachingDefs)
+    for fun in funs:
+        assert _InsDefs(fun) == expected[fun.name], f"reaching defs mismatch in {fun.name}"
+    print(f"reaching defs maps: {t_maps:8.3f}s")
+    print(f"reaching defs bits: {t_bits:8.3f}s  (speedup {t_maps / t_bits:.2f}x)")
+
+
+def BenchmarkMemory(fin: TextIO):
+    lines = fin.readlines()
+    tracemalloc.start()
+    unit = serialize.UnitParseFromAsm(iter(lines))
+    after_parse, _ = tracemalloc.get_traced_memory()
+    funs = _NormalFuns(unit)
+    num_inss = sum(len(bbl.inss) for fun in unit.funs for bbl in fun.bbls)
+    print(f"# funs: {len(unit.funs)}  inss: {num_inss}")
+    print(f"after parse:         {after_parse / num_inss:8.1f} bytes/ins")
+    for fun in funs:
+        optimize.FunCfgInit(fun, unit)
+        cfg.FunRemoveUnreachableBbls(fun)
+        reaching_defs.FunComputeReachingDefs(fun)
+    after_defs, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"after reaching defs: {after_defs / num_inss:8.1f} bytes/ins")
+    print(f"peak:                {peak / num_inss:8.1f} bytes/ins")
+
+
+def BenchmarkBinary(fin: TextIO):
+    lines = fin.readlines()
+    start = time.perf_counter()
+    unit = serialize.UnitParseFromAsm(lines)
+    t_text = time.perf_counter() - start
+    data = serialize.UnitWriteBinary(unit)
+    start = time.perf_counter()
+    unit2 = serialize.UnitReadBinary(data)
+    t_binary = time.perf_counter() - start
+    assert serialize.UnitRenderToASM(unit) == serialize.UnitRenderToASM(unit2)
+    print(f"# text: {sum(len(line) for line in lines)} bytes  binary: {len(data)} bytes")
+    print(f"load text:   {t_text:8.3f}s")
+    print(f"load binary: {t_binary:8.3f}s  (speedup {t_text / t_binary:.2f}x)")
+
+
+def BenchmarkParse(fin: TextIO):
+    lines = fin.readlines()
+    num_funs = sum(1 for line in lines if line.startswith(".fun"))
+    print(f"# lines: {len(lines)}  funs: {num_funs}")
+    start = time.perf_counter()
+    expected = [serialize.TokenizeLineReference(line) for line in lines]
+    t_ref = time.perf_counter() - start
+    start = time.perf_counter()
+    actual = [parse.ParseLineWithLists(line) for line in lines]
+    t_new = time.perf_counter() - start
+    assert expected == actual
+    print(f"tokenize reference: {len(lines) / t_ref:12.0f} lines/s")
+    print(f"tokenize scanner:   {len(lines) / t_new:12.0f} lines/s  (speedup {t_ref / t_new:.2f}x)")
+
+
+def _FunOpt(fun: ir.Fun, _unit: ir.Unit):
+    optimize.FunOpt(fun, collections.defaultdict(int))
+
+
+def BenchmarkParallel(fin: TextIO):
+    lines = fin.readlines()
+    units = [serialize.UnitParseFromAsm(lines) for _ in range(2)]
+    for unit in units:
+        optimize.UnitCfgInit(unit)
+    num_workers = os.cpu_count()
+    print(f"# funs: {len(units[0].funs)}  workers: {num_workers}")
+    times = []
+    for unit, n in zip(units, [1, num_workers]):
+        start = time.perf_counter()
+        for _ in parallel.UnitMapFuns(unit, _NormalFuns(unit), _FunOpt, n):
+            pass
+        times.append(time.perf_counter() - start)
+    assert serialize.UnitRenderToASM(units[0]) == serialize.UnitRenderToASM(units[1])
+    print(f"opt sequential: {times[0]:8.3f}s")
+    print(f"opt parallel:   {times[1]:8.3f}s  (speedup {times[0] / times[1]:.2f}x)")
+
+
+def _SynthesizeLargeBbl(num_inss: int, num_hot: int, seed: int) -> str:
+    """A fun with a single Bbl containing a chain of short lived temporaries
+
+    Each ins also uses one of num_hot regs which are live across the whole Bbl.
+    With fewer cpu regs than hot regs the hot regs get spilled and each of their
+    uses requires spilling another LiveRange for the scratch reg, i.e. we get lots
+    of spills with candidates far away from the current position.
+    """
+    rng = random.Random(seed)
+    out = [".fun big NORMAL [U32] = []",
+           f".reg U32 [{' '.join(f'h{i}' for i in range(num_hot))}]",
+           f".reg U32 [{' '.join(f't{i}' for i in range(num_inss))}]",
+           ".bbl start"]
+    for i in range(num_hot):
+        out.append(f"    mov h{i} = {i}")
+    out.append("    mov t0 = 0")
+    for i in range(1, num_inss):
+        out.append(f"    add t{i} = t{i - 1} h{rng.randrange(num_hot)}")
+    for i in range(num_hot):
+        out.append(f"    add t{num_inss - 1} = t{num_inss - 1} h{i}")
+    out.append(f"    pusharg t{num_inss - 1}")
+    out.append("    ret")
+    return "\n".join(out) + "\n"
+
+
+class _BenchmarkRegPool(reg_alloc.RegPool):
+
+    def __init__(self, num_regs: int):
+        self.cpu_regs = [ir.CpuReg(f"r{i}", i) for i in range(num_regs)]
+        self.available = (1 << num_regs) - 1
+
+    def get_cpu_reg_family(self, kind: o.DK) -> int:
+        return 0
+
+    def get_available_reg(self, lr: liveness.LiveRange) -> ir.CpuReg:
+        if self.available == 0:
+            return ir.CPU_REG_SPILL
+        no = (self.available & -self.available).bit_length() - 1
+        self.available &= ~(1 << no)
+        return self.cpu_regs[no]
+
+    def give_back_available_reg(self, cpu_reg: ir.CpuReg):
+        self.available |= 1 << cpu_reg.no
+
+
+def BenchmarkRegAlloc(_fin: TextIO):
+    """Linear scan with spilling on synthetic Bbls of increasing size (input is ignored)"""
+    for num_inss in [1000, 2000, 4000, 8000, 16000]:
+        unit = serialize.UnitParseFromAsm(io.StringIO(_SynthesizeLargeBbl(num_inss, num_inss // 4, num_inss)))
+        fun = unit.fun_syms["big"]
+        bbl = fun.bbls[0]
+        times = []
+        results = []
+        for assigner in [reg_alloc.RegisterAssignerLinearScanFancyReference,
+                         reg_alloc.RegisterAssignerLinearScanFancy]:
+            live_ranges = liveness.BblGetLiveRanges(bbl, fun, set())
+            start = time.perf_counter()
+            assigner(live_ranges, _BenchmarkRegPool(8))
+            times.append(time.perf_counter() - start)
+            results.append([str(lr) for lr in live_ranges])
+        assert results[0] == results[1], f"allocation mismatch for {num_inss} inss"
+        num_spilled = sum(1 for lr in results[1] if "SPILLED" in lr)
+        print(f"inss: {num_inss:6}  spilled: {num_spilled:6}  "
+              f"scan all: {times[0]:8.3f}s  active set: {times[1]:8.3f}s  "
+              f"(speedup {times[0] / times[1]:.2f}x)")
+
+
+_MODES = {
+    "liveness": BenchmarkLiveness,
+    "reaching_defs": BenchmarkReachingDefs,
+    "memory": BenchmarkMemory,
+    "binary": BenchmarkBinary,
+    "parse": BenchmarkParse,
+    "parallel": BenchmarkParallel,
+    "reg_alloc": BenchmarkRegAlloc,
+}
+
+
+def main(argv):
+    mode = argv[0] if argv else "liveness"
+    assert mode in _MODES, f"unknown mode: [{mode}]"
+    _MODES[mode](sys.stdin)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,7 +1,7 @@
 """This file contains helpers related to the CFG (Control Flow Graph)"""
 # (c) Robert Muth - see LICENSE for more info
 
-from typing import List, Tuple, Set
+from typing import List, Tuple, Set, Dict
 
 from Base import ir
 from Base import opcode_tab as o
@@ -76,6 +76,7 @@ def FunSplitBblsAtTerminators(fun: ir.Fun):
             bbls.append(new_bbl)
             fun.bbl_syms[new_bbl.name] = new_bbl
     fun.bbls = bbls
+    fun.InvalidateCfgAnalyses()
 
 
 def BblSplitBeforeFixEdges(orig_bbl: ir.Bbl, ins: ir.Ins, fun: ir.Fun, name: str) -> ir.Bbl:
@@ -94,6 +95,7 @@ def BblSplitBeforeFixEdges(orig_bbl: ir.Bbl, ins: ir.Ins, fun: ir.Fun, name: str
     orig_bbl.inss = orig_bbl.inss[ins_pos + 1:]
     fun.bbls.insert(bbl_pos, new_bbl)
     fun.bbl_syms[name] = new_bbl
+    fun.InvalidateCfgAnalyses()
     return new_bbl
 
 
@@ -137,6 +139,7 @@ def FunInitCFG(fun: ir.Fun):
         assert not last_bbl.inss, f"garbage bbl not empty in {fun.name}: {last_bbl}"
         del fun.bbl_syms[last_bbl.name]
         fun.bbls.pop(-1)
+    fun.InvalidateCfgAnalyses()
 
 
 def FunRemoveUnconditionalBranches(fun: ir.Fun):
@@ -155,6 +158,8 @@ def FunRemoveUnconditionalBranches(fun: ir.Fun):
         if last_ins_kind == o.OPC_KIND.BRA:
             inss.pop(-1)
     fun.flags |= ir.FUN_FLAG.CFG_NOT_LINEAR
+    # the edges do not change
+    fun.InvalidateAnalyses()
 
 
 def InsFlipCondBra(ins: ir.Ins, old_target: ir.Bbl, new_target: ir.Bbl):
@@ -229,6 +234,8 @@ def FunRemoveEmptyBbls(fun: ir.Fun) -> int:
 
     discarded = len(fun.bbls) - len(keep)
     fun.bbls = keep
+    if discarded:
+        fun.InvalidateCfgAnalyses()
     return discarded
 
 
@@ -250,6 +257,8 @@ def FunRemoveUnreachableBbls(fun: ir.Fun) -> int:
             succ.edge_in.remove(bbl)
     fun.bbls = [bbl for bbl in fun.bbls if bbl.name in reachable]
     fun.bbl_syms = {bbl.name: bbl for bbl in fun.bbls}
+    if discarded:
+        fun.InvalidateCfgAnalyses()
     return discarded
 
 
@@ -295,6 +304,7 @@ def FunAddUnconditionalBranches(fun: ir.Fun):
             bbls.append(bbl_bra)
     fun.bbls = bbls
     fun.flags &= ~ir.FUN_FLAG.CFG_NOT_LINEAR
+    fun.InvalidateCfgAnalyses()
 
 
 def UnitRemoveUnreachableCode(unit: ir.Unit, seeds: List[ir.Fun]):
@@ -322,3 +332,137 @@ def UnitRemoveUnreachableCode(unit: ir.Unit, seeds: List[ir.Fun]):
                                 ir.FUN_FLAG.REACHACHABLE not in op.flags):
                             reachable.add(op)
     unit.funs = [f for f in unit.funs if ir.FUN_FLAG.REACHACHABLE in f.flags]
+
+
+def FunReversePostorder(fun: ir.Fun) -> List[ir.Bbl]:
+    """Returns the bbls reachable from the entry in reverse postorder"""
+    if not fun.bbls:
+        return []
+    order: List[ir.Bbl] = []
+    visited: Set[str] = {fun.bbls[0].name}
+    # iterative dfs: (bbl, index of the next successor to visit)
+    stack: List[Tuple[ir.Bbl, int]] = [(fun.bbls[0], 0)]
+    while stack:
+        bbl, n = stack[-1]
+        if n == len(bbl.edge_out):
+            stack.pop(-1)
+            order.append(bbl)
+            continue
+        stack[-1] = (bbl, n + 1)
+        succ = bbl.edge_out[n]
+        if succ.name not in visited:
+            visited.add(succ.name)
+            stack.append((succ, 0))
+    order.reverse()
+    return order
+
+
+def _FunComputeDominators(fun: ir.Fun, rpo: List[ir.Bbl]):
+    """Cooper, Harvey, Kennedy: "A Simple, Fast Dominance Algorithm"
+
+    Sets bbl.idom and bbl.dom_depth
+    """
+    for bbl in fun.bbls:
+        bbl.idom = None
+        bbl.dom_depth = 0
+    if not rpo:
+        return
+    rpo_no = {bbl.name: n for n, bbl in enumerate(rpo)}
+    # idom by rpo number, the entry is its own idom while iterating
+    idoms: List[int] = [-1] * len(rpo)
+    idoms[0] = 0
+    changed = True
+    while changed:
+        changed = False
+        for n in range(1, len(rpo)):
+            new_idom = -1
+            for pred in rpo[n].edge_in:
+                p = rpo_no.get(pred.name, -1)
+                if p < 0 or idoms[p] < 0:
+                    continue  # unreachable or not yet processed
+                if new_idom < 0:
+                    new_idom = p
+                    continue
+                # intersect: walk up until both fingers meet
+                while p != new_idom:
+                    while p > new_idom:
+                        p = idoms[p]
+                    while new_idom > p:
+                        new_idom = idoms[new_idom]
+            if idoms[n] != new_idom:
+                idoms[n] = new_idom
+                changed = True
+    # idoms[n] < n so the parents are always handled first
+    for n in range(1, len(rpo)):
+        idom = rpo[idoms[n]]
+        rpo[n].idom = idom
+        rpo[n].dom_depth = idom.dom_depth + 1
+
+
+def Dominates(a: ir.Bbl, b: ir.Bbl) -> bool:
+    """Returns true if every path from the entry to b goes through a
+
+    Requires valid loop info (see FunEnsureLoopInfo).
+    """
+    while b is not None and b.dom_depth > a.dom_depth:
+        b = b.idom
+    return b is a
+
+
+def _FunComputeLoops(fun: ir.Fun, rpo: List[ir.Bbl]):
+    """Finds the natural loops using the back edges, i.e. edges to a dominator
+
+    Back edges into the same header are merged into a single loop.
+    Cycles without a dominating header (irreducible control flow) are not
+    considered loops.
+    """
+    for bbl in fun.bbls:
+        bbl.loop = None
+    reachable: Set[str] = {bbl.name for bbl in rpo}
+    members: Dict[str, Set[str]] = {}
+    for header in rpo:
+        stack = [pred for pred in header.edge_in if Dominates(header, pred)]
+        if not stack:
+            continue
+        body: Set[str] = {header.name}
+        while stack:
+            bbl = stack.pop(-1)
+            if bbl.name in body or bbl.name not in reachable:
+                continue
+            body.add(bbl.name)
+            stack += bbl.edge_in
+        members[header.name] = body
+
+    # two natural loops with different headers are either disjoint or nested,
+    # so processing larger loops first yields the enclosing loops first
+    loops: List[ir.Loop] = []
+    for header_name, body in sorted(members.items(), key=lambda x: -len(x[1])):
+        header = fun.bbl_syms[header_name]
+        parent = header.loop
+        loop = ir.Loop(header, [bbl for bbl in fun.bbls if bbl.name in body], parent,
+                       1 if parent is None else parent.depth + 1)
+        for bbl in loop.bbls:
+            bbl.loop = loop
+        loops.append(loop)
+    fun.loops = loops
+
+
+def FunComputeLoopInfo(fun: ir.Fun) -> int:
+    """Computes the dominator tree and the loop nest
+
+    The results are kept in bbl.idom, bbl.dom_depth, bbl.loop and fun.loops and
+    stay valid until the cfg is changed (see ir.Fun.InvalidateCfgAnalyses).
+    Returns the number of loops.
+    """
+    rpo = FunReversePostorder(fun)
+    _FunComputeDominators(fun, rpo)
+    _FunComputeLoops(fun, rpo)
+    fun.flags |= ir.FUN_FLAG.LOOP_INFO_VALID
+    return len(fun.loops)
+
+
+def FunEnsureLoopInfo(fun: ir.Fun) -> int:
+    """Like FunComputeLoopInfo but reuses the loop info if it is still valid"""
+    if ir.FUN_FLAG.LOOP_INFO_VALID in fun.flags:
+        return len(fun.loops)
+    return FunComputeLoopInfo(fun)
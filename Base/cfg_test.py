@@ -0,0 +1,108 @@
+#!/usr/bin/python3
+
+import unittest
+
+from Base import cfg
+from Base import ir
+from Base import testing
+
+# outer loop: a b c d, inner loop: b c (two back edges into b),
+# plus a second loop d e nested in the outer loop and an unreachable bbl
+_CODE = r"""
+.fun main NORMAL [] = [U32]
+.reg U32 [x]
+.bbl start
+    poparg x
+.bbl a
+    beq x 0 exit
+.bbl b
+    blt x 5 c
+    bra b
+.bbl c
+    beq x 7 b
+.bbl d
+    blt x 3 e
+    bra a
+.bbl e
+    sub x = x 1
+    bra d
+.bbl exit
+    ret
+.bbl dead
+    add x = x 1
+    bra c
+"""
+
+
+def _Names(bbls):
+    return [bbl.name for bbl in bbls]
+
+
+class TestLoops(unittest.TestCase):
+
+    def testDominators(self):
+        _, fun = testing.ParseFun(_CODE)
+        self.assertEqual(["start", "a", "b", "c", "d", "e", "exit"],
+                         _Names(cfg.FunReversePostorder(fun)))
+        cfg.FunComputeLoopInfo(fun)
+        bbl = fun.bbl_syms
+        self.assertEqual({"a": "start", "b": "a", "c": "b", "d": "c", "e": "d",
+                          "exit": "a"},
+                         {b.name: b.idom.name for b in fun.bbls if b.idom})
+        self.assertIsNone(bbl["start"].idom)
+        self.assertIsNone(bbl["dead"].idom)
+        self.assertTrue(cfg.Dominates(bbl["a"], bbl["e"]))
+        self.assertTrue(cfg.Dominates(bbl["c"], bbl["c"]))
+        self.assertFalse(cfg.Dominates(bbl["e"], bbl["c"]))
+        self.assertFalse(cfg.Dominates(bbl["b"], bbl["exit"]))
+
+    def testLoopNest(self):
+        _, fun = testing.ParseFun(_CODE)
+        self.assertEqual(3, cfg.FunComputeLoopInfo(fun))
+        outer, inner1, inner2 = fun.loops
+        self.assertEqual(["a", "b", "c", "d", "e"], _Names(outer.bbls))
+        self.assertEqual(1, outer.depth)
+        self.assertIsNone(outer.parent)
+        # the loops nested in the outer loop are sorted by size
+        self.assertEqual({"b": ["b", "c"], "d": ["d", "e"]},
+                         {loop.header.name: _Names(loop.bbls) for loop in [inner1, inner2]})
+        for loop in [inner1, inner2]:
+            self.assertIs(outer, loop.parent)
+            self.assertEqual(2, loop.depth)
+        self.assertEqual({"start": 0, "a": 1, "b": 2, "c": 2, "d": 2, "e": 2,
+                          "exit": 0, "dead": 0},
+                         {b.name: b.loop_depth for b in fun.bbls})
+
+    def testIrreducible(self):
+        _, fun = testing.ParseFun(r"""
+.fun main NORMAL [] = [U32]
+.reg U32 [x]
+.bbl start
+    poparg x
+    beq x 0 b
+.bbl a
+    add x = x 1
+.bbl b
+    beq x 1 a
+    ret
+""")
+        # the cycle a b has two entries so neither bbl is a loop header
+        self.assertEqual(0, cfg.FunComputeLoopInfo(fun))
+        self.assertEqual(0, fun.bbl_syms["a"].loop_depth)
+
+    def testInvalidation(self):
+        _, fun = testing.ParseFun(_CODE)
+        cfg.FunEnsureLoopInfo(fun)
+        self.assertIn(ir.FUN_FLAG.LOOP_INFO_VALID, fun.flags)
+        # instruction rewrites do not affect the cfg
+        ir.FunGenericRewrite(fun, lambda ins, _fun: [ins])
+        self.assertIn(ir.FUN_FLAG.LOOP_INFO_VALID, fun.flags)
+        self.assertEqual(1, cfg.FunRemoveUnreachableBbls(fun))
+        self.assertNotIn(ir.FUN_FLAG.LOOP_INFO_VALID, fun.flags)
+        self.assertEqual(3, cfg.FunEnsureLoopInfo(fun))
+        cfg.FunAddUnconditionalBranches(fun)
+        self.assertNotIn(ir.FUN_FLAG.LOOP_INFO_VALID, fun.flags)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,13 +7,28 @@ from typing import Optional
 from Base import ir
 from Base import opcode_tab as o
 
+
+def _Div(x: int, y: int) -> int:
+    """Integer division rounding towards zero (like C)"""
+    q = abs(x) // abs(y)
+    return q if (x < 0) == (y < 0) else -q
+
+
+def _Rem(x: int, y: int) -> int:
+    """Remainder of _Div, it has the same sign as x"""
+    return x - _Div(x, y) * y
+
+
 # TODO: naive implementation -> needs a lot more scrutiny
 _EVALUATORS_ALU = {
     o.ADD: lambda x, y: x + y,
     o.SUB: lambda x, y: x - y,
     o.MUL: lambda x, y: x * y,
-    o.DIV: lambda x, y: x // y,
+    o.DIV: lambda x, y: _Div(x, y) if isinstance(x, int) else x / y,
+    o.REM: _Rem,
     o.SHL: lambda x, y: x << y,
+    # signed values are negative python ints so this is an arithmetic shift for them
+    o.SHR: lambda x, y: x >> y,
     o.OR: lambda x, y: x | y,
     o.AND: lambda x, y: x & y,
     o.XOR: lambda x, y: x ^ y,
@@ -80,7 +95,10 @@ _EVALUATORS_ALU1 = {
 def EvaluatateALU(opcode: o.Opcode, op1: ir.Const, op2: ir.Const) -> ir.Const:
     evaluator = _EVALUATORS_ALU.get(opcode)
     assert evaluator, f"Evaluator NYI for: {opcode}"
-    return ir.Const(op1.kind, _truncate(op1.kind, evaluator(op1.value, op2.value)))
+    val2 = op2.value
+    if opcode in (o.SHL, o.SHR):
+        val2 &= op1.kind.bitwidth() - 1
+    return ir.Const(op1.kind, _truncate(op1.kind, evaluator(op1.value, val2)))
 
 
 def EvaluatateALU1(opcode: o.Opcode, op: ir.Const) -> Optional[ir.Const]:
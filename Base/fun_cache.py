@@ -0,0 +1,135 @@
+"""On disk cache for the results of compiling individual funs
+
+Entries are content addressed: the key is a hash of the serialized fun,
+of everything the backend may look at outside of the fun (e.g. the signatures
+of the callees) and of the backend version (see SourceHash).
+Values are arbitrary picklable objects, e.g. machine code fragments.
+
+The cache is bounded in size and evicts the least recently used entries.
+"""
+
+import collections
+import hashlib
+import os
+import pickle
+from typing import List, Dict, Any, Optional
+
+from Base import ir
+from Base import serialize
+
+# bump this if the layout of the cached values changes
+_FORMAT_VERSION = "1"
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def SourceHash(modules: List[Any]) -> str:
+    """Hashes all python files in the directories of the given modules"""
+    h = hashlib.sha256()
+    dirs = sorted({os.path.dirname(os.path.abspath(m.__file__)) for m in modules})
+    for d in dirs:
+        for name in sorted(os.listdir(d)):
+            if name.endswith(".py"):
+                h.update(name.encode("utf-8"))
+                with open(os.path.join(d, name), "rb") as fin:
+                    h.update(fin.read())
+    return h.hexdigest()
+
+
+def FunCallees(fun: ir.Fun) -> List[ir.Fun]:
+    """Returns all other funs referenced by fun in the order of their first use"""
+    seen: Dict[ir.Fun, None] = {}
+    for bbl in fun.bbls:
+        for ins in bbl.inss:
+            for op in ins.operands:
+                if isinstance(op, ir.Fun) and op is not fun:
+                    seen[op] = None
+    return list(seen)
+
+
+def FunCacheKey(fun: ir.Fun, callee_infos: List[str], version: str) -> str:
+    """callee_infos describes everything about the callees the backend depends on"""
+    h = hashlib.sha256()
+    h.update(f"{_FORMAT_VERSION}\n{version}\n".encode("utf-8"))
+    for line in serialize.FunRenderToAsm(fun):
+        h.update(line.encode("utf-8"))
+        h.update(b"\n")
+    for info in callee_infos:
+        h.update(info.encode("utf-8"))
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+class FunCache:
+    """Content addressed cache of picklable values stored in a directory"""
+
+    def __init__(self, directory: str, max_bytes=DEFAULT_MAX_BYTES):
+        self._dir = directory
+        self._max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        # key -> size, least recently used first.
+        # Across runs the mtime of the files is used as the "last used" timestamp
+        self._entries: Dict[str, int] = collections.OrderedDict()
+        self._size = 0
+        files = []
+        for entry in os.scandir(directory):
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.name, stat.st_size))
+        for _, key, size in sorted(files):
+            self._entries[key] = size
+            self._size += size
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def _Path(self, key: str) -> str:
+        return os.path.join(self._dir, key)
+
+    def Get(self, key: str) -> Optional[Any]:
+        if key not in self._entries:
+            self.misses += 1
+            return None
+        path = self._Path(key)
+        try:
+            with open(path, "rb") as fin:
+                value = pickle.load(fin)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            # e.g. removed by another process
+            self.misses += 1
+            return None
+        os.utime(path)
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def Put(self, key: str, value: Any):
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        path = self._Path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as fout:
+            fout.write(data)
+        # atomic so concurrent builds never see partial entries
+        os.replace(tmp, path)
+        self._size += len(data) - self._entries.pop(key, 0)
+        self._entries[key] = len(data)
+        self.stores += 1
+        self._Evict()
+
+    def _Evict(self):
+        while self._size > self._max_bytes:
+            key, size = self._entries.popitem(last=False)
+            try:
+                os.remove(self._Path(key))
+            except FileNotFoundError:
+                pass
+            self._size -= size
+            self.evictions += 1
+
+    def Size(self) -> int:
+        return self._size
+
+    def StatsString(self) -> str:
+        return (f"hits: {self.hits}  misses: {self.misses}  stores: {self.stores}  "
+                f"evictions: {self.evictions}  size: {self._size}")
@@ -0,0 +1,92 @@
+#!/usr/bin/python3
+
+import io
+import os
+import tempfile
+import unittest
+
+from Base import fun_cache
+from Base import serialize
+
+_CODE = r"""
+.fun a NORMAL [U32] = [U32]
+.reg U32 [x]
+.bbl start
+    poparg x
+    pusharg x
+    ret
+
+.fun b NORMAL [] = []
+.reg U32 [y]
+.bbl start
+    pusharg 1:U32
+    bsr a
+    poparg y
+    ret
+"""
+
+
+def _Keys(code: str, version="v1"):
+    unit = serialize.UnitParseFromAsm(io.StringIO(code))
+    out = []
+    for fun in unit.funs:
+        infos = [f"{c.name} {c.input_types}" for c in fun_cache.FunCallees(fun)]
+        out.append(fun_cache.FunCacheKey(fun, infos, version))
+    return out
+
+
+class TestKeys(unittest.TestCase):
+
+    def testCallees(self):
+        unit = serialize.UnitParseFromAsm(io.StringIO(_CODE))
+        self.assertEqual([], fun_cache.FunCallees(unit.GetFun("a")))
+        self.assertEqual([unit.GetFun("a")], fun_cache.FunCallees(unit.GetFun("b")))
+
+    def testKeyChanges(self):
+        a, b = _Keys(_CODE)
+        self.assertNotEqual(a, b)
+        self.assertEqual([a, b], _Keys(_CODE))
+        self.assertNotEqual([a, b], _Keys(_CODE, "v2"))
+        # a different body only affects the fun itself
+        a2, b2 = _Keys(_CODE.replace("pusharg 1:U32", "pusharg 2:U32"))
+        self.assertEqual(a, a2)
+        self.assertNotEqual(b, b2)
+        # a different callee signature also affects the caller
+        a3, b3 = _Keys(_CODE.replace("[U32] = [U32]", "[U32] = [S32]")
+                       .replace("pusharg 1:U32", "pusharg 1:S32"))
+        self.assertNotEqual(a, a3)
+        self.assertNotEqual(b, b3)
+
+
+class TestCache(unittest.TestCase):
+
+    def testGetPut(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = fun_cache.FunCache(tmp)
+            self.assertIsNone(cache.Get("k1"))
+            cache.Put("k1", (b"code", [("m", 4, "RO", [(1, b"data")])]))
+            self.assertEqual((b"code", [("m", 4, "RO", [(1, b"data")])]), cache.Get("k1"))
+            self.assertEqual((1, 1, 1, 0), (cache.hits, cache.misses, cache.stores, cache.evictions))
+            # entries survive
+            cache2 = fun_cache.FunCache(tmp)
+            self.assertEqual(cache.Size(), cache2.Size())
+            self.assertEqual((b"code", [("m", 4, "RO", [(1, b"data")])]), cache2.Get("k1"))
+
+    def testLruEviction(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = fun_cache.FunCache(tmp, 2500)
+            for key in ["k1", "k2"]:
+                cache.Put(key, bytes(1000))
+            # k1 is now the most recently used one
+            self.assertIsNotNone(cache.Get("k1"))
+            cache.Put("k3", bytes(1000))
+            self.assertEqual(1, cache.evictions)
+            self.assertIsNone(cache.Get("k2"))
+            self.assertIsNotNone(cache.Get("k1"))
+            self.assertIsNotNone(cache.Get("k3"))
+            self.assertEqual(["k1", "k3"], sorted(os.listdir(tmp)))
+            self.assertLessEqual(cache.Size(), 2500)
+
+
+if __name__ == '__main__':
+    unittest.main()
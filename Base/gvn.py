@@ -0,0 +1,162 @@
+"""Global value numbering (common subexpression elimination)
+
+The Cwerg IR is not in SSA form so values are identified with the help of
+reaching defs: two reg operands have the same value if they have the same
+(reaching) def. Two instructions with the same opcode and operand values
+compute the same value, so if one of them dominates the other, the latter one
+can be replaced by a mov - as long as the dst reg of the former still holds
+the value. The movs are cleaned up by the usual copy propagation and move
+elimination passes.
+
+Loads are only reused within a bbl and only if no memory is written in between.
+
+This should be run after unreachable code has been removed.
+"""
+
+from typing import List, Dict, Tuple, Any, Optional
+
+from Base import canonicalize
+from Base import cfg
+from Base import ir
+from Base import opcode_tab as o
+from Base import reaching_defs
+
+# instructions whose result only depends on their operands
+_PURE_KINDS = {o.OPC_KIND.ALU, o.OPC_KIND.ALU1, o.OPC_KIND.LEA,
+               o.OPC_KIND.LEA1, o.OPC_KIND.CONV, o.OPC_KIND.CMP}
+
+_CLOBBERS_MEM = o.OA.MEM_WR | o.OA.CALL | o.OA.SPECIAL
+
+
+class _ValueTable:
+    """Maps expressions to the instruction computing them
+
+    Entries are scoped by the dominator tree.
+    """
+
+    def __init__(self):
+        # id of def (Ins or (Bbl, Reg)) -> value number
+        self.numbers: Dict[Any, int] = {}
+        self.exprs: Dict[Tuple, ir.Ins] = {}
+        self._undo: List[Tuple[Tuple, Optional[ir.Ins]]] = []
+
+    def OperandKey(self, op: Any, op_def: Any) -> Tuple:
+        if isinstance(op, ir.Reg):
+            if isinstance(op_def, ir.Ins):
+                key = id(op_def)
+            elif isinstance(op_def, ir.Bbl):
+                key = (id(op_def), op.name)
+            else:
+                # no single def, i.e. every use is its own value
+                return "u", id(op)
+            num = self.numbers.get(key)
+            if num is None:
+                num = self.numbers[key] = len(self.numbers)
+            return "r", num
+        elif isinstance(op, ir.Const):
+            # str() keeps 0.0 and -0.0 apart
+            return "c", op.kind.name, str(op.value)
+        else:
+            # mems, stks and funs
+            return "o", id(op)
+
+    def InsKey(self, ins: ir.Ins) -> Tuple:
+        num_defs = ins.opcode.def_ops_count()
+        ops = [self.OperandKey(op, op_def) for op, op_def in
+               zip(ins.operands[num_defs:], ins.operand_defs[num_defs:])]
+        pos = canonicalize.CommutativeOperands(ins.opcode)
+        if pos is not None:
+            a, b = pos[0] - num_defs, pos[1] - num_defs
+            if ops[b] < ops[a]:
+                ops[a], ops[b] = ops[b], ops[a]
+        return (ins.opcode, ins.operands[0].kind, *ops)
+
+    def SameValue(self, op: Any, op_def: Any, ins: ir.Ins):
+        """The result of ins is known to be the same as the value of op"""
+        key = self.OperandKey(op, op_def)
+        if key[0] == "r":
+            self.numbers[id(ins)] = key[1]
+
+    def Add(self, key: Tuple, ins: ir.Ins):
+        self._undo.append((key, self.exprs.get(key)))
+        self.exprs[key] = ins
+
+    def Mark(self) -> int:
+        return len(self._undo)
+
+    def Restore(self, mark: int):
+        while len(self._undo) > mark:
+            key, ins = self._undo.pop(-1)
+            if ins is None:
+                del self.exprs[key]
+            else:
+                self.exprs[key] = ins
+
+
+def _BblValueNumbering(bbl: ir.Bbl, table: _ValueTable) -> int:
+    count = 0
+    # the defs inside bbl so far
+    local_defs: Dict[ir.Reg, ir.Ins] = {}
+    loads: Dict[Tuple, ir.Ins] = {}
+
+    def holds_value(ins: ir.Ins) -> bool:
+        dst = ins.operands[0]
+        if dst in local_defs:
+            return local_defs[dst] is ins
+        return bbl.defs_in.get(dst) is ins
+
+    for ins in bbl.inss:
+        opc = ins.opcode
+        if opc.attributes & _CLOBBERS_MEM:
+            loads.clear()
+        num_defs = opc.def_ops_count()
+        if num_defs != 1 or ins.operands[0].cpu_reg is not None:
+            pass
+        elif opc is o.MOV and isinstance(ins.operands[1], ir.Reg):
+            table.SameValue(ins.operands[1], ins.operand_defs[1], ins)
+        elif opc.kind in _PURE_KINDS or opc.kind is o.OPC_KIND.LD:
+            key = table.InsKey(ins)
+            exprs = loads if opc.kind is o.OPC_KIND.LD else table.exprs
+            prev = exprs.get(key)
+            if prev is not None and holds_value(prev):
+                table.SameValue(prev.operands[0], prev, ins)
+                ins.Init(o.MOV, [ins.operands[0], prev.operands[0]])
+                count += 1
+            elif opc.kind is o.OPC_KIND.LD:
+                loads[key] = ins
+            else:
+                table.Add(key, ins)
+        for reg in ins.operands[:num_defs]:
+            local_defs[reg] = ins
+    return count
+
+
+def FunGlobalValueNumbering(fun: ir.Fun) -> int:
+    """Returns the number of instructions replaced by movs"""
+    if not fun.bbls:
+        return 0
+    # constant folding may have left bbls which reaching defs cannot handle
+    cfg.FunRemoveUnreachableBbls(fun)
+    cfg.FunEnsureLoopInfo(fun)
+    reaching_defs.FunEnsureReachingDefs(fun)
+    children: Dict[str, List[ir.Bbl]] = {bbl.name: [] for bbl in fun.bbls}
+    for bbl in fun.bbls:
+        if bbl.idom is not None:
+            children[bbl.idom.name].append(bbl)
+    table = _ValueTable()
+    count = 0
+    # iterative walk of the dominator tree: (bbl, mark) where mark is None
+    # before the bbl is processed
+    stack: List[Tuple[ir.Bbl, Optional[int]]] = [(fun.bbls[0], None)]
+    while stack:
+        bbl, mark = stack.pop(-1)
+        if mark is not None:
+            table.Restore(mark)
+            continue
+        stack.append((bbl, table.Mark()))
+        count += _BblValueNumbering(bbl, table)
+        for child in reversed(children[bbl.name]):
+            stack.append((child, None))
+    if count:
+        fun.InvalidateAnalyses()
+    return count
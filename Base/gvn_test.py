@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+
+import collections
+import unittest
+
+from Base import gvn
+from Base import optimize
+from Base import testing
+
+_HEADER = r"""
+.fun main NORMAL [U32] = [A64 U32 U32]
+.reg U32 [x y a b c d v w]
+.reg A64 [p]
+"""
+
+
+class TestGvn(unittest.TestCase):
+
+    def testBbl(self):
+        _, fun = testing.ParseFun(_HEADER + r"""
+.bbl start
+    poparg p
+    poparg x
+    poparg y
+    add a = x y
+    add b = y x
+    mul c = a 3
+    mul d = b 3
+    sub v = x y
+    sub w = y x
+    pusharg d
+    ret
+""")
+        self.assertEqual(2, gvn.FunGlobalValueNumbering(fun))
+        self.assertEqual(["add a x y", "mov b a", "mul c a 3", "mov d c",
+                          "sub v x y", "sub w y x"], testing.RenderInss(fun.bbls[0])[3:9])
+
+    def testDominators(self):
+        _, fun = testing.ParseFun(_HEADER + r"""
+.bbl start
+    poparg p
+    poparg x
+    poparg y
+    lea p = p x
+    beq x 0 other
+.bbl then
+    add a = x y
+    add b = x y
+    bra join
+.bbl other
+    add a = x y
+.bbl join
+    add c = x y
+    lea p = p x
+    pusharg c
+    ret
+""")
+        # only the repeated add in "then" is dominated by an identical add,
+        # the lea uses a different value of p
+        self.assertEqual(1, gvn.FunGlobalValueNumbering(fun))
+        self.assertEqual(["add a x y", "mov b a"], testing.RenderInss(fun.bbl_syms["then"]))
+        self.assertEqual(["add c x y", "lea p p x", "pusharg c", "ret"],
+                         testing.RenderInss(fun.bbl_syms["join"]))
+
+    def testOverwrittenDst(self):
+        _, fun = testing.ParseFun(_HEADER + r"""
+.bbl start
+    poparg p
+    poparg x
+    poparg y
+    add a = x y
+    mov a = 0
+.bbl next
+    add b = x y
+    pusharg b
+    ret
+""")
+        self.assertEqual(0, gvn.FunGlobalValueNumbering(fun))
+
+    def testLoads(self):
+        _, fun = testing.ParseFun(_HEADER + r"""
+.bbl start
+    poparg p
+    poparg x
+    poparg y
+    ld v = p 4
+    ld w = p 4
+    st p 0 = x
+    ld a = p 4
+    add b = v w
+    add b = b a
+    pusharg b
+    ret
+""")
+        self.assertEqual(1, gvn.FunGlobalValueNumbering(fun))
+        self.assertEqual(["ld v p 4", "mov w v", "st p 0 x", "ld a p 4"],
+                         testing.RenderInss(fun.bbls[0])[3:7])
+
+
+    def testFoldedBranch(self):
+        _, fun = testing.ParseFun(_HEADER + r"""
+.bbl start
+    poparg p
+    poparg x
+    poparg y
+    mov v = 3
+    add a = x y
+    blt v 2 dead
+.bbl next
+    add b = x y
+    add b = b a
+    pusharg b
+    ret
+.bbl dead
+    pusharg a
+    ret
+""")
+        # const folding turns the blt into a bra and leaves dead unreachable
+        optimize.FunOptBasic(fun, collections.defaultdict(int), allow_conv_conversion=True)
+        self.assertEqual(1, gvn.FunGlobalValueNumbering(fun))
+        self.assertNotIn("dead", fun.bbl_syms)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,196 @@
+"""If-conversion
+
+Small diamonds and triangles in the cfg are collapsed into conditional moves
+(cmpeq/cmplt), e.g.
+
+    blt a b side            add %t = y 1
+.bbl other            =>    cmplt x = %t x a b
+    ...                     (side is removed)
+.bbl side
+    add x = y 1
+
+The instructions on the sides are executed unconditionally (speculated) with
+their results going into fresh regs which are then selected based on the
+original branch condition. Only cheap instructions which cannot trap are
+speculated.
+
+This avoids mispredicted branches for things like min/max, clamps and abs.
+
+Only int and address kinds are handled as not all backends have patterns
+for the floating point flavors of the cmp instructions.
+This works on the cfg form and should be followed by FunOptBasic.
+"""
+
+from typing import List, Dict, Optional, Tuple, Any
+
+from Base import ir
+from Base import opcode_tab as o
+
+# max number of instructions on a side
+_MAX_SIDE_INSS = 3
+# max number of conditional moves replacing a single branch
+_MAX_SELECTS = 4
+
+_SUPPORTED_KINDS = {o.DK.U32, o.DK.S32, o.DK.U64, o.DK.S64, o.DK.A32, o.DK.A64}
+
+_SPECULATABLE = {o.MOV, o.ADD, o.SUB, o.MUL, o.AND, o.OR, o.XOR, o.SHL, o.SHR, o.LEA}
+
+
+def _SideInss(side: ir.Bbl, head: ir.Bbl, fun: ir.Fun) -> Optional[List[ir.Ins]]:
+    """Returns the instructions of a side bbl if it can be if-converted"""
+    if side is fun.bbls[0] or side.edge_in != [head] or len(side.edge_out) != 1:
+        return None
+    if len(side.inss) > _MAX_SIDE_INSS:
+        return None
+    for ins in side.inss:
+        if ins.opcode not in _SPECULATABLE or ins.operands[0].kind not in _SUPPORTED_KINDS:
+            return None
+    return side.inss
+
+
+def _FinalValues(inss: List[ir.Ins]) -> Dict[ir.Reg, Any]:
+    """Returns the value each written reg has at the end of the side
+
+    The value is a reg or const if the last write was a mov, otherwise it is
+    the writing instruction.
+    """
+    values: Dict[ir.Reg, Any] = {}
+    for ins in inss:
+        dst = ins.operands[0]
+        if ins.opcode is o.MOV:
+            src = ins.operands[1]
+            values[dst] = values.get(src, src) if isinstance(src, ir.Reg) else src
+        else:
+            values[dst] = ins
+    return values
+
+
+def _Speculate(inss: List[ir.Ins], fun: ir.Fun, hoisted: List[ir.Ins]) -> Dict[int, ir.Reg]:
+    """Appends the non-mov instructions writing to fresh regs to hoisted
+
+    Returns the fresh reg for each of them keyed by id(ins).
+    """
+    renamed: Dict[ir.Reg, Any] = {}
+    tmps: Dict[int, ir.Reg] = {}
+    for ins in inss:
+        ops = [renamed.get(op, op) if isinstance(op, ir.Reg) else op for op in ins.operands]
+        dst = ins.operands[0]
+        if ins.opcode is o.MOV:
+            renamed[dst] = ops[1]
+        else:
+            tmp = fun.GetScratchReg(dst.kind, "ifconv", False)
+            hoisted.append(ir.Ins(ins.opcode, [tmp] + ops[1:]))
+            renamed[dst] = tmp
+            tmps[id(ins)] = tmp
+    return tmps
+
+
+def _Select(opc: o.Opcode, dst: ir.Reg, val_taken, val_not_taken, a, b) -> ir.Ins:
+    if opc is o.BEQ:
+        return ir.Ins(o.CMPEQ, [dst, val_taken, val_not_taken, a, b])
+    elif opc is o.BNE:
+        return ir.Ins(o.CMPEQ, [dst, val_not_taken, val_taken, a, b])
+    elif opc is o.BLT:
+        return ir.Ins(o.CMPLT, [dst, val_taken, val_not_taken, a, b])
+    else:
+        assert opc is o.BLE
+        # a <= b  <=>  !(b < a)
+        return ir.Ins(o.CMPLT, [dst, val_not_taken, val_taken, b, a])
+
+
+def _IfConvertedInss(cond_bra: ir.Ins, taken: List[ir.Ins], not_taken: List[ir.Ins],
+                     fun: ir.Fun) -> Optional[List[ir.Ins]]:
+    """Returns the speculated instructions followed by the conditional moves
+
+    A reg not written on one side keeps its value there.
+    """
+    values_taken = _FinalValues(taken)
+    values_not_taken = _FinalValues(not_taken)
+    dsts = list(values_taken) + [r for r in values_not_taken if r not in values_taken]
+    if len(dsts) > _MAX_SELECTS:
+        return None
+    a, b = cond_bra.operands[0], cond_bra.operands[1]
+    # the conditional moves must not observe each other
+    for dst in dsts:
+        if len(dsts) > 1 and dst in (a, b):
+            return None
+        for val in (values_taken.get(dst), values_not_taken.get(dst)):
+            if isinstance(val, ir.Reg) and val is not dst and val in dsts:
+                return None
+
+    out: List[ir.Ins] = []
+    tmps = _Speculate(taken, fun, out)
+    tmps.update(_Speculate(not_taken, fun, out))
+
+    def final(values, dst):
+        val = values.get(dst, dst)
+        return tmps[id(val)] if isinstance(val, ir.Ins) else val
+
+    for dst in dsts:
+        out.append(_Select(cond_bra.opcode, dst, final(values_taken, dst),
+                           final(values_not_taken, dst), a, b))
+    return out
+
+
+def _FindShape(head: ir.Bbl, fun: ir.Fun) -> Optional[
+        Tuple[ir.Bbl, List[ir.Bbl], List[ir.Ins], List[ir.Ins]]]:
+    """Returns the join bbl, the side bbls and the instructions on the taken/not taken path"""
+    if not head.inss or len(head.edge_out) != 2:
+        return None
+    cond_bra = head.inss[-1]
+    if cond_bra.opcode.kind is not o.OPC_KIND.COND_BRA:
+        return None
+    if cond_bra.operands[0].kind not in _SUPPORTED_KINDS:
+        return None
+    taken: ir.Bbl = cond_bra.operands[2]
+    not_taken = head.edge_out[0] if head.edge_out[1] is taken else head.edge_out[1]
+    if taken is not_taken:
+        return None
+    taken_inss = _SideInss(taken, head, fun)
+    not_taken_inss = _SideInss(not_taken, head, fun)
+    if taken_inss is not None and not_taken_inss is not None:
+        join = taken.edge_out[0]
+        if not_taken.edge_out[0] is not join:
+            return None
+        return join, [taken, not_taken], taken_inss, not_taken_inss
+    elif taken_inss is not None and taken.edge_out[0] is not_taken:
+        return not_taken, [taken], taken_inss, []
+    elif not_taken_inss is not None and not_taken.edge_out[0] is taken:
+        return taken, [not_taken], [], not_taken_inss
+    return None
+
+
+def _BblIfConvert(head: ir.Bbl, fun: ir.Fun) -> bool:
+    shape = _FindShape(head, fun)
+    if shape is None:
+        return False
+    join, sides, taken_inss, not_taken_inss = shape
+    if join is head:
+        return False
+    inss = _IfConvertedInss(head.inss[-1], taken_inss, not_taken_inss, fun)
+    if inss is None:
+        return False
+    head.inss[-1:] = inss
+    for side in sides:
+        head.DelEdgeOut(side)
+        side.DelEdgeOut(join)
+        del fun.bbl_syms[side.name]
+        fun.bbls.remove(side)
+    # in the triangle case the edge to the join is still there
+    if join not in head.edge_out:
+        head.AddEdgeOut(join)
+    return True
+
+
+def FunIfConversion(fun: ir.Fun) -> int:
+    """Returns the number of removed branches"""
+    count = 0
+    for head in fun.bbls[:]:
+        if head.name not in fun.bbl_syms:
+            continue
+        # the result may be the head of a surrounding diamond
+        while _BblIfConvert(head, fun):
+            count += 1
+    if count:
+        fun.InvalidateCfgAnalyses()
+    return count
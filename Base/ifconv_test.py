@@ -0,0 +1,102 @@
+#!/usr/bin/python3
+
+import unittest
+
+from Base import ifconv
+from Base import optimize
+from Base import sanity
+from Base import testing
+
+
+class TestIfConversion(unittest.TestCase):
+
+    def testTriangle(self):
+        unit, fun = testing.ParseFun(r"""
+.fun main NORMAL [S32] = [S32 S32]
+.reg S32 [a b]
+.bbl start
+    poparg a
+    poparg b
+    blt a b done
+.bbl is_b
+    mov a = b
+.bbl done
+    pusharg a
+    ret
+""")
+        self.assertEqual(1, ifconv.FunIfConversion(fun))
+        self.assertEqual([["poparg a", "poparg b", "cmplt a a b a b"],
+                          ["pusharg a", "ret"]], testing.RenderFun(fun))
+        optimize.FunCfgExit(fun, unit)
+        sanity.FunCheck(fun, unit, check_fallthroughs=True)
+
+    def testDiamond(self):
+        unit, fun = testing.ParseFun(r"""
+.fun main NORMAL [U32] = [U32]
+.reg U32 [x y z]
+.bbl start
+    poparg x
+    ble x 10 small
+.bbl big
+    mov y = 1
+    mov z = x
+    bra end
+.bbl small
+    mov y = 2
+.bbl end
+    add y = y z
+    pusharg y
+    ret
+""")
+        self.assertEqual(1, ifconv.FunIfConversion(fun))
+        self.assertEqual([["poparg x", "cmplt y 1 2 10:U32 x", "cmplt z x z 10:U32 x"],
+                          ["add y y z", "pusharg y", "ret"]], testing.RenderFun(fun))
+        optimize.FunCfgExit(fun, unit)
+        sanity.FunCheck(fun, unit, check_fallthroughs=True)
+
+    def testSpeculation(self):
+        unit, fun = testing.ParseFun(r"""
+.fun main NORMAL [S32] = [S32]
+.reg S32 [x]
+.bbl start
+    poparg x
+    blt x 0 neg
+.bbl done
+    pusharg x
+    ret
+.bbl neg
+    sub x = 0 x
+    bra done
+""")
+        self.assertEqual(1, ifconv.FunIfConversion(fun))
+        self.assertEqual([["poparg x", "sub $1_ifconv 0 x", "cmplt x $1_ifconv x x 0"],
+                          ["pusharg x", "ret"]], testing.RenderFun(fun))
+        optimize.FunCfgExit(fun, unit)
+        sanity.FunCheck(fun, unit, check_fallthroughs=True)
+
+    def testNoConversion(self):
+        unit, fun = testing.ParseFun(r"""
+.fun main NORMAL [U32] = [U32 U32]
+.reg U32 [x y]
+.bbl start
+    poparg x
+    poparg y
+    beq x 0 skip
+.bbl side
+    mov y = x
+    mov x = 1
+.bbl skip
+    bne y 0 skip2
+.bbl side2
+    div x = y x
+.bbl skip2
+    pusharg x
+    ret
+""")
+        # the first side reads a reg written by a select, the second may trap
+        self.assertEqual(0, ifconv.FunIfConversion(fun))
+        self.assertEqual(5, len(fun.bbls))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,231 @@
+"""Inlining of small leaf funs
+
+Inlining works on the linear form of the IR, i.e. before optimize.FunCfgInit,
+so that it can be run right after parsing and before any of the per fun
+optimizations which will clean up the movs introduced here.
+
+A call site
+
+    pusharg b
+    pusharg a
+    bsr callee
+    poparg x
+
+is replaced by movs of the arguments into (renamed) copies of the regs popped
+by the callee followed by a copy of the bbls of the callee in which
+
+    pusharg y
+    ret
+
+becomes
+
+    mov x = y
+    bra cont
+
+where cont is a new bbl containing the rest of the original bbl.
+
+Only leaf funs are inlined so the result does not depend on the order in
+which the funs are processed.
+"""
+
+from typing import Dict, Any, Optional
+
+from Base import cfg
+from Base import ir
+from Base import opcode_tab as o
+
+# callees with a single call site can be larger because the out of line copy
+# usually becomes unreachable
+_SINGLE_CALL_SITE_FACTOR = 4
+
+_MARSHALLING = {o.POPARG, o.PUSHARG, o.RET}
+
+
+def FunInlineSize(fun: ir.Fun) -> int:
+    """Number of instructions excluding the ones dealing with args and results"""
+    return sum(1 for bbl in fun.bbls for ins in bbl.inss if ins.opcode not in _MARSHALLING)
+
+
+def _FunSize(fun: ir.Fun) -> int:
+    return sum(len(bbl.inss) for bbl in fun.bbls)
+
+
+def _UniqueName(name: str, syms: Dict[str, Any]) -> str:
+    if name not in syms:
+        return name
+    for i in range(1, 100000):
+        cand = f"{name}{i}"
+        if cand not in syms:
+            return cand
+    assert False
+
+
+def _IsInlinable(callee: ir.Fun) -> bool:
+    if callee.kind is not o.FUN_KIND.NORMAL or not callee.bbls or not ir.FunIsLeaf(callee):
+        return False
+    if any(reg.cpu_reg is not None for reg in callee.regs):
+        return False
+    # syscalls also use pusharg/poparg
+    if any(ins.opcode is o.SYSCALL for bbl in callee.bbls for ins in bbl.inss):
+        return False
+    entry = callee.bbls[0].inss
+    num_inputs = len(callee.input_types)
+    return (len(entry) >= num_inputs and
+            all(ins.opcode is o.POPARG for ins in entry[:num_inputs]))
+
+
+def _ReturnsAreWellFormed(callee: ir.Fun) -> bool:
+    """Checks that every ret is preceded by the pushargs of all results"""
+    num_outputs = len(callee.output_types)
+    for bbl in callee.bbls:
+        for n, ins in enumerate(bbl.inss):
+            if ins.opcode is not o.RET:
+                continue
+            if n < num_outputs or not all(
+                    x.opcode is o.PUSHARG for x in bbl.inss[n - num_outputs:n]):
+                return False
+    return True
+
+
+def _CallSiteIsWellFormed(bbl: ir.Bbl, pos: int, callee: ir.Fun) -> bool:
+    num_inputs = len(callee.input_types)
+    num_outputs = len(callee.output_types)
+    inss = bbl.inss
+    return (pos >= num_inputs and pos + num_outputs < len(inss) and
+            all(ins.opcode is o.PUSHARG for ins in inss[pos - num_inputs:pos]) and
+            all(ins.opcode is o.POPARG for ins in inss[pos + 1:pos + 1 + num_outputs]))
+
+
+class _Cloner:
+    """Maps the regs, stks, jtbs and bbls of the callee to fresh ones in the caller"""
+
+    def __init__(self, caller: ir.Fun, callee: ir.Fun, suffix: str):
+        self.map: Dict[int, Any] = {}
+        for reg in callee.regs:
+            name = _UniqueName(f"{reg.name}{suffix}", caller.reg_syms)
+            self.map[id(reg)] = caller.AddReg(ir.Reg(name, reg.kind))
+        for stk in callee.stk_syms.values():
+            name = _UniqueName(f"{stk.name}{suffix}", caller.stk_syms)
+            clone = ir.Stk(name, stk.alignment, stk.count)
+            caller.AddStk(clone)
+            self.map[id(stk)] = clone
+        for bbl in callee.bbls:
+            name = cfg.NewDerivedBblName(f"{callee.name}_{bbl.name}", suffix, caller)
+            clone = ir.Bbl(name)
+            caller.bbl_syms[name] = clone
+            self.map[id(bbl)] = clone
+        for jtb in callee.jtbs:
+            name = _UniqueName(f"{jtb.name}{suffix}", caller.jtb_syms)
+            tab = {k: self.map[id(v)] for k, v in jtb.bbl_tab.items()}
+            self.map[id(jtb)] = caller.AddJtb(
+                ir.Jtb(name, self.map[id(jtb.def_bbl)], tab, jtb.size))
+
+    def Operand(self, op: Any) -> Any:
+        if isinstance(op, ir.Const):
+            # consts are occasionally updated in place
+            return ir.Const(op.kind, op.value)
+        # funs and mems are not cloned
+        return self.map.get(id(op), op)
+
+    def Ins(self, ins: ir.Ins) -> ir.Ins:
+        return ir.Ins(ins.opcode, [self.Operand(op) for op in ins.operands])
+
+
+def _InlineCallSite(caller: ir.Fun, bbl: ir.Bbl, pos: int, callee: ir.Fun, suffix: str):
+    num_inputs = len(callee.input_types)
+    num_outputs = len(callee.output_types)
+    inss = bbl.inss
+    args = [ins.operands[0] for ins in reversed(inss[pos - num_inputs:pos])]
+    results = [ins.operands[0] for ins in inss[pos + 1:pos + 1 + num_outputs]]
+    cloner = _Cloner(caller, callee, suffix)
+
+    cont = ir.Bbl(cfg.NewDerivedBblName(bbl.name, "_cont", caller))
+    caller.bbl_syms[cont.name] = cont
+    cont.inss = inss[pos + 1 + num_outputs:]
+    bbl.inss = inss[:pos - num_inputs]
+    params = callee.bbls[0].inss[:num_inputs]
+    for param, arg in zip(params, args):
+        bbl.inss.append(ir.Ins(o.MOV, [cloner.Operand(param.operands[0]), arg]))
+
+    clones = []
+    for callee_bbl in callee.bbls:
+        clone: ir.Bbl = cloner.Operand(callee_bbl)
+        todo = callee_bbl.inss[num_inputs:] if callee_bbl is callee.bbls[0] else callee_bbl.inss
+        for n, ins in enumerate(todo):
+            if ins.opcode is o.PUSHARG:
+                # handled together with the ret
+                continue
+            elif ins.opcode is o.RET:
+                for dst, push in zip(results, reversed(todo[n - num_outputs:n])):
+                    clone.inss.append(ir.Ins(o.MOV, [dst, cloner.Operand(push.operands[0])]))
+                clone.inss.append(ir.Ins(o.BRA, [cont]))
+            else:
+                clone.inss.append(cloner.Ins(ins))
+        clones.append(clone)
+    index = caller.bbls.index(bbl) + 1
+    caller.bbls[index:index] = clones + [cont]
+
+
+def _CalleeToInline(ins: ir.Ins, caller: ir.Fun, candidates: Dict[ir.Fun, None]) -> Optional[ir.Fun]:
+    if ins.opcode is not o.BSR:
+        return None
+    callee = ins.operands[0]
+    if callee is caller or callee not in candidates:
+        return None
+    return callee
+
+
+def FunInlineCalls(fun: ir.Fun, candidates: Dict[ir.Fun, None]) -> int:
+    """Inlines all the calls of the candidates, returns the number of inlined calls
+
+    The fun must still be in linear form (see optimize.FunCfgInit).
+    """
+    count = 0
+    todo = list(fun.bbls)
+    while todo:
+        bbl = todo.pop(0)
+        for pos, ins in enumerate(bbl.inss):
+            callee = _CalleeToInline(ins, fun, candidates)
+            if callee is None or not _CallSiteIsWellFormed(bbl, pos, callee):
+                continue
+            count += 1
+            _InlineCallSite(fun, bbl, pos, callee, f"_inl{count}")
+            # the remainder of the bbl may contain more calls
+            todo.insert(0, fun.bbls[fun.bbls.index(bbl) + len(callee.bbls) + 1])
+            break
+    if count:
+        fun.InvalidateCfgAnalyses()
+    return count
+
+
+def UnitInline(unit: ir.Unit, budget: int) -> Dict[str, int]:
+    """Inlines calls of small leaf funs
+
+    A leaf fun is inlined if it has at most `budget` instructions (not counting
+    poparg, pusharg and ret) or if it has a single call site and is at most
+    _SINGLE_CALL_SITE_FACTOR times larger than that.
+    Returns the number of inlined calls and the code size growth in instructions.
+    """
+    call_sites: Dict[ir.Fun, int] = {}
+    for fun in unit.funs:
+        for bbl in fun.bbls:
+            for ins in bbl.inss:
+                if ins.opcode is o.BSR:
+                    call_sites[ins.operands[0]] = call_sites.get(ins.operands[0], 0) + 1
+    candidates: Dict[ir.Fun, None] = {}
+    for callee, count in call_sites.items():
+        limit = budget * _SINGLE_CALL_SITE_FACTOR if count == 1 else budget
+        if (_IsInlinable(callee) and _ReturnsAreWellFormed(callee) and
+                FunInlineSize(callee) <= limit):
+            candidates[callee] = None
+
+    stats = {"inlined": 0, "inline_growth": 0}
+    for fun in unit.funs:
+        if fun.kind is not o.FUN_KIND.NORMAL:
+            continue
+        before = _FunSize(fun)
+        count = FunInlineCalls(fun, candidates)
+        if count:
+            stats["inlined"] += count
+            stats["inline_growth"] += _FunSize(fun) - before
+    return stats
@@ -0,0 +1,128 @@
+#!/usr/bin/python3
+
+import io
+import unittest
+
+from Base import inliner
+from Base import ir
+from Base import opcode_tab as o
+from Base import optimize
+from Base import sanity
+from Base import serialize
+
+_UNIT = r"""
+.fun add_mul NORMAL [U32 U32] = [U32 U32]
+.reg U32 [a b s p]
+.bbl start
+    poparg a
+    poparg b
+    add s = a b
+    mul p = a b
+    pusharg p
+    pusharg s
+    ret
+
+.fun max NORMAL [U32] = [U32 U32]
+.reg U32 [a b]
+.bbl start
+    poparg a
+    poparg b
+    blt b a is_a
+    pusharg b
+    ret
+.bbl is_a
+    pusharg a
+    ret
+
+.fun fib NORMAL [U32] = [U32]
+.reg U32 [x y]
+.bbl start
+    poparg x
+    blt x 2 done
+    sub x = x 1
+    pusharg x
+    bsr fib
+    poparg y
+    add x = x y
+.bbl done
+    pusharg x
+    ret
+
+.fun main NORMAL [U32] = [U32 U32]
+.reg U32 [x y s p m]
+.bbl start
+    poparg x
+    poparg y
+    pusharg y
+    pusharg x
+    bsr add_mul
+    poparg s
+    poparg p
+    pusharg 7:U32
+    pusharg s
+    bsr max
+    poparg m
+    pusharg m
+    bsr fib
+    poparg m
+    add m = m p
+    pusharg m
+    ret
+"""
+
+
+def _Calls(fun: ir.Fun):
+    return [ins.operands[0].name for bbl in fun.bbls for ins in bbl.inss
+            if ins.opcode is o.BSR]
+
+
+class TestInliner(unittest.TestCase):
+
+    def testSize(self):
+        unit = serialize.UnitParseFromAsm(io.StringIO(_UNIT))
+        self.assertEqual(2, inliner.FunInlineSize(unit.fun_syms["add_mul"]))
+        self.assertEqual(1, inliner.FunInlineSize(unit.fun_syms["max"]))
+
+    def testInline(self):
+        unit = serialize.UnitParseFromAsm(io.StringIO(_UNIT))
+        main = unit.fun_syms["main"]
+        stats = inliner.UnitInline(unit, 10)
+        # fib is not a leaf
+        self.assertEqual(2, stats["inlined"])
+        self.assertEqual(["fib"], _Calls(main))
+        self.assertEqual(["fib"], _Calls(unit.fun_syms["fib"]))
+        # the results are moved directly into the regs popped by the caller
+        inss = [serialize.InsRenderToAsm(ins).strip()
+                for bbl in main.bbls for ins in bbl.inss]
+        self.assertIn("mov s s_inl1", inss)
+        self.assertIn("mov p p_inl1", inss)
+        self.assertIn("mov a_inl2 s", inss)
+        self.assertIn("mov b_inl2 7", inss)
+        for fun in unit.funs:
+            optimize.FunCfgInit(fun, unit)
+            sanity.FunCheck(fun, unit, check_cfg=True, check_push_pop=True)
+
+    def testBudget(self):
+        unit = serialize.UnitParseFromAsm(io.StringIO(_UNIT + r"""
+.fun main2 NORMAL [U32] = [U32 U32]
+.reg U32 [x y s p]
+.bbl start
+    poparg x
+    poparg y
+    pusharg y
+    pusharg x
+    bsr add_mul
+    poparg s
+    poparg p
+    pusharg s
+    ret
+"""))
+        # add_mul has now two call sites, max still has a single one
+        stats = inliner.UnitInline(unit, 1)
+        self.assertEqual(1, stats["inlined"])
+        self.assertEqual(["add_mul", "fib"], _Calls(unit.fun_syms["main"]))
+        self.assertEqual(["add_mul"], _Calls(unit.fun_syms["main2"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,7 +15,7 @@ import collections
 import dataclasses
 import enum
 import struct
-from typing import List, Dict, Set, Optional, Any
+from typing import List, Dict, Set, Optional, Any, Tuple
 
 from Base import opcode_tab as o
 
@@ -24,6 +24,21 @@ class ParseError(Exception):
     pass
 
 
+def _AddSlots(cls):
+    """Recreates the dataclass cls with __slots__ instead of a per instance __dict__
+
+    This is what dataclasses.dataclass(slots=True) does but that requires
+    Python 3.10. Field defaults live in the generated __init__ so the
+    class attributes holding them (which would clash with the slots) can go.
+    """
+    field_names = tuple(f.name for f in dataclasses.fields(cls))
+    cls_dict = dict(cls.__dict__)
+    for name in field_names + ("__dict__", "__weakref__"):
+        cls_dict.pop(name, None)
+    cls_dict["__slots__"] = field_names
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
 ############################################################
 # Operand TYPE
 ############################################################
@@ -56,6 +71,7 @@ _NUM_CONVERSION_STR = {
 }
 
 
+@_AddSlots
 @dataclasses.dataclass(init=True)
 class Const:
     """Constant Number (arbitrary precision int or float)"""
@@ -170,6 +186,7 @@ class StackSlot:
     offset: int = 0
 
 
+@_AddSlots
 @dataclasses.dataclass(init=True)
 class CpuReg:
     """CPU Register"""
@@ -197,6 +214,7 @@ class REG_FLAG(enum.Flag):
     MARKED = 1 << 7
 
 
+@_AddSlots
 @dataclasses.dataclass(init=True)
 class Reg:
     """Register"""
@@ -206,6 +224,7 @@ class Reg:
     flags: REG_FLAG = REG_FLAG(0)
     def_ins: "Ins" = INS_INVALID  # first definition used by reg_stats
     def_bbl: "Bbl" = BBL_INVALID  # first definition used by reg_stats
+    no: int = 0  # dense numbering used by liveness (see liveness.FunNumberReg)
 
     def IsIntReg(self):
         flavor = self.kind.flavor()
@@ -239,17 +258,31 @@ CPU_REG_INVALID = CpuReg("CPU_REG_INVALID", -2, 1000)
 CPU_REG_SPILL = CpuReg("CPU_REG_SPILL", -1, 1000)
 
 
+def RegBitsToSet(bits: int, reg_map: List[Reg]) -> Set[Reg]:
+    """Converts a bitset over Reg.no back into a set of Regs"""
+    out = set()
+    # bin() gives us the bits msb first, reversing it makes the string index the bit number
+    digits = bin(bits)[:1:-1]
+    pos = digits.find("1")
+    while pos >= 0:
+        out.add(reg_map[pos])
+        pos = digits.find("1", pos + 1)
+    return out
+
+
 # The top lattice element for reaching_defs analysis
 # The bot lattice element is represented by not being in the REG_DEG_MAP
 
 
+@_AddSlots
 @dataclasses.dataclass()
 class Ins:
     """Instruction"""
 
     opcode: o.Opcode
     operands: List[Any]
-    operand_defs: List[Any]  # ir.INVALID, ir.Ins or ir.Bbl
+    # only allocated once needed, e.g. by reaching_defs
+    _operand_defs: Optional[List[Any]]
 
     def __init__(self, opcode: o.Opcode, operands: List[Any]):
         self.Init(opcode, operands)
@@ -259,9 +292,21 @@ class Ins:
             opcode.operand_kinds), f"operand num mismatch for {opcode} {operands}"
         self.opcode = opcode
         self.operands = operands
-        self.operand_defs = [INS_INVALID] * len(operands)
+        self._operand_defs = None
         return self
 
+    @property
+    def operand_defs(self) -> List[Any]:
+        """ir.INVALID, ir.Ins or ir.Bbl for each operand"""
+        if self._operand_defs is None:
+            # note: operands may have been shortened already in preparation of an Init()
+            self._operand_defs = [INS_INVALID] * len(self.opcode.operand_kinds)
+        return self._operand_defs
+
+    @operand_defs.setter
+    def operand_defs(self, defs: List[Any]):
+        self._operand_defs = defs
+
     # for reaching defs etc, this has cause subtle bugs
     def __eq__(self, other):
         assert False, "do not compare Ins directly. Use 'is' if appropriate"
@@ -281,6 +326,7 @@ def InsSwapOps(ins: Ins, a: int, b: int):
     ins.operand_defs[a], ins.operand_defs[b] = ins.operand_defs[b], ins.operand_defs[a]
 
 
+@_AddSlots
 @dataclasses.dataclass()
 class Bbl:
     """Basic Block"""
@@ -289,9 +335,39 @@ class Bbl:
     inss: List[Ins] = dataclasses.field(default_factory=list)
     edge_out: List["Bbl"] = dataclasses.field(default_factory=list)
     edge_in: List["Bbl"] = dataclasses.field(default_factory=list)
-    # set of reg live at the end of the Bbl
-    live_out: Set[Reg] = dataclasses.field(default_factory=set)
     defs_in: Dict[Reg, Ins] = dataclasses.field(default_factory=dict)
+    # regs live at the end of the Bbl as a bitset over Reg.no.
+    # `live_out` converts this into a set of Regs on demand.
+    live_out_bits: int = 0
+    live_out_map: List[Reg] = dataclasses.field(default_factory=list)
+    _live_out: Optional[Set[Reg]] = None
+    # dominator tree and loop nest, see cfg.FunComputeLoopInfo.
+    # idom is None for the entry and for unreachable Bbls
+    idom: Optional["Bbl"] = None
+    dom_depth: int = 0
+    loop: Optional["Loop"] = None  # innermost loop containing the Bbl
+
+    @property
+    def loop_depth(self) -> int:
+        return 0 if self.loop is None else self.loop.depth
+
+    @property
+    def live_out(self) -> Set[Reg]:
+        """set of reg live at the end of the Bbl"""
+        if self._live_out is None:
+            self._live_out = RegBitsToSet(self.live_out_bits, self.live_out_map)
+        return self._live_out
+
+    @live_out.setter
+    def live_out(self, regs: Set[Reg]):
+        self._live_out = regs
+        self.live_out_bits = 0
+        self.live_out_map = []
+
+    def SetLiveOutBits(self, bits: int, reg_map: List[Reg]):
+        self._live_out = None
+        self.live_out_bits = bits
+        self.live_out_map = reg_map
 
     def AddIns(self, ins: Ins):
         self.inss.append(ins)
@@ -331,6 +407,18 @@ class Bbl:
 BBL_INVALID = Bbl("INVALID_BBL", forward_declared=True)
 
 
+@dataclasses.dataclass(eq=False)
+class Loop:
+    """Natural loop (all back edges to the same header are merged)"""
+    header: Bbl
+    bbls: List[Bbl]  # in the order of Fun.bbls, including the header
+    parent: Optional["Loop"] = None  # next enclosing loop
+    depth: int = 1  # outermost loops have depth 1
+
+    def __repr__(self):
+        return f"[LOOP {self.header.name} depth={self.depth} {len(self.bbls)}]"
+
+
 @dataclasses.dataclass()
 class Jtb:
     """JumpTables"""
@@ -351,6 +439,14 @@ class FUN_FLAG(enum.Flag):
     LIVENESS_VALID = 1 << 2  # liveness info is valid
     STACK_FINALIZED = 1 << 3  # stack size must not change anymore (no more scratch regs!)
     REACHACHABLE = 1 << 4
+    REACHING_DEFS_VALID = 1 << 5  # reaching defs info is valid
+    LOOP_INFO_VALID = 1 << 6  # dominator tree and loops are valid
+
+
+# analyses which become stale when the Ins or Bbls of a Fun change
+FUN_FLAG_ANALYSES = FUN_FLAG.LIVENESS_VALID | FUN_FLAG.REACHING_DEFS_VALID
+# analyses which additionally become stale when the cfg edges change
+FUN_FLAG_CFG_ANALYSES = FUN_FLAG_ANALYSES | FUN_FLAG.LOOP_INFO_VALID
 
 
 class Fun:
@@ -366,6 +462,8 @@ class Fun:
         self.reg_syms: Dict[str, Reg] = {}
         # All regs mentioned in reg_syms are partioned in one of these:
         self.regs: List[Reg] = []
+        # maps Reg.no back to the Reg (see liveness.FunNumberReg)
+        self.reg_map: List[Reg] = []
         #
         # basic block
         self.bbl_syms: Dict[str, Bbl] = {}
@@ -385,6 +483,12 @@ class Fun:
         # (def2) "potentially changed but no visible to caller = scratch"
         #        we usually use an approximation, i.e. caller-save regs
         self.cpu_live_clobber: List[CpuReg] = []
+        # the callees and their cpu_live_out at the time liveness was computed
+        # None means unknown (see liveness.FunLivenessIsValid)
+        self.liveness_callees: Optional[List[Tuple["Fun", Tuple[CpuReg, ...]]]] = None
+        # all loops, enclosing loops before the loops nested in them
+        # (valid if FUN_FLAG.LOOP_INFO_VALID is set)
+        self.loops: List[Loop] = []
 
         if kind != o.FUN_KIND.INVALID:  # not  forward_declared
             self.Init(kind, output_types, input_types)
@@ -396,6 +500,20 @@ class Fun:
         self.input_types = input_types
         self.output_types = output_types
 
+    def InvalidateAnalyses(self):
+        """Must be called whenever the Ins or Bbls change
+
+        The generic rewriters below do this automatically.
+        """
+        self.flags &= ~FUN_FLAG_ANALYSES
+
+    def InvalidateCfgAnalyses(self):
+        """Must be called whenever the Bbls or the edges between them change
+
+        The cfg mutators do this automatically.
+        """
+        self.flags &= ~FUN_FLAG_CFG_ANALYSES
+
     def FinalizeStackSlots(self):
         """Assigns stack-offsets to each stk location and spliled register"""
         assert FUN_FLAG.STACK_FINALIZED not in self.flags
@@ -577,6 +695,8 @@ class Unit:
         self.mem_syms: Dict[str, Mem] = {}
         self.mems: List = []
         self._temp_name_count = 0
+        # if not None, FindOrAddConstMem appends all the mems it returns
+        self.const_mem_log: Optional[List[Mem]] = None
 
     def GetTempName(self) -> str:
         self._temp_name_count += 1
@@ -623,11 +743,12 @@ class Unit:
         data = num.ToBytes()
         name = MakeName(data, num.kind)
         mem = self.mem_syms.get(name)
-        if mem:
-            return mem
-        mem = Mem(name, len(data), o.MEM_KIND.RO)
-        mem.AddData(DataBytes(1, data))
-        self.AddMem(mem)
+        if not mem:
+            mem = Mem(name, len(data), o.MEM_KIND.RO)
+            mem.AddData(DataBytes(1, data))
+            self.AddMem(mem)
+        if self.const_mem_log is not None:
+            self.const_mem_log.append(mem)
         return mem
 
     def AddData(self, data):
@@ -653,8 +774,10 @@ def UnitCheckCompatibility(
 # Many of the helpers below make use of instruction transformer which must
 # return an Optional[List[Ins]. The result will be used as follows:
 # None: leave the current Ins as is, note that the Ins may have been change by the transformer
+#       but only in ways which do not affect the analyses (e.g. liveness)
 # List[Ins]: replace the current Ins with the list, an empty List means
 # the Ins will be dropped
+# The rewriters invalidate the analyses of the Fun if there was any replacement.
 
 
 def BblGenericRewrite(bbl: Bbl, fun: Fun,
@@ -670,6 +793,8 @@ def BblGenericRewrite(bbl: Bbl, fun: Fun,
             count += 1
         inss += new_inss
     bbl.inss = inss
+    if count:
+        fun.InvalidateAnalyses()
     return count
 
 
@@ -693,6 +818,8 @@ def BblGenericRewriteWithBbl(bbl: Bbl, fun: Fun, ins_transformer, **extra) -> in
             count += 1
         inss += new_inss
     bbl.inss = inss
+    if count:
+        fun.InvalidateAnalyses()
     return count
 
 
@@ -717,6 +844,8 @@ def BblGenericRewriteReverse(bbl: Bbl, fun: Fun,
             count += 1
         inss += new_inss
     bbl.inss = list(reversed(inss))
+    if count:
+        fun.InvalidateAnalyses()
     return count
 
 
@@ -737,6 +866,8 @@ def FunGenericRewriteBbl(fun: Fun, bbl_transformer, **extra) -> int:
     count = 0
     for bbl in fun.bbls:
         count += bbl_transformer(bbl, fun, **extra)
+    if count:
+        fun.InvalidateAnalyses()
     return count
 
 
@@ -746,3 +877,42 @@ def FunIsLeaf(fun) -> bool:
             if ins.opcode is o.BSR or ins.opcode is o.JSR:
                 return False
     return True
+
+
+def FunEscapedStks(fun: Fun) -> Set[str]:
+    """Stks that might be accessed other than via ld.stk/st.stk"""
+    out: Set[str] = set()
+    for bbl in fun.bbls:
+        for ins in bbl.inss:
+            if ins.opcode in {o.LD_STK, o.ST_STK}:
+                continue
+            for op in ins.operands:
+                if isinstance(op, Stk):
+                    out.add(op.name)
+    return out
+
+
+def InsIsTailCall(fun: Fun, bbl: Bbl, pos: int) -> bool:
+    """Whether the call bbl.inss[pos] can be replaced by a jump to the callee
+
+    This is meant for the backends after register allocation. The call must
+    be followed by a ret and possibly some reg to reg movs which leave the
+    results of the callee in fun.cpu_live_out.
+    Args are always passed in cpu regs but the stack frame of fun is gone by the
+    time the callee runs, so funs with stk regions, whose addresses may have been
+    passed to the callee, are excluded.
+    """
+    if bbl.inss[pos].opcode is not o.BSR or fun.stk_syms:
+        return False
+    # cpu reg -> the cpu reg whose value (right after the call) it holds
+    values: Dict[Any, Any] = {}
+    for ins in bbl.inss[pos + 1:]:
+        if ins.opcode is o.RET:
+            return all(values.get(cpu_reg, cpu_reg) == cpu_reg for cpu_reg in fun.cpu_live_out)
+        if ins.opcode is not o.MOV:
+            return False
+        dst, src = ins.operands
+        if not isinstance(src, Reg) or not dst.HasCpuReg() or not src.HasCpuReg():
+            return False
+        values[dst.cpu_reg] = values.get(src.cpu_reg, src.cpu_reg)
+    return False
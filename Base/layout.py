@@ -0,0 +1,212 @@
+"""Basic block placement
+
+The bbls of a fun are reordered so that the likely successor of a bbl follows
+it directly, i.e. becomes the fallthrough, and so that cold bbls end up at the
+end of the fun (Pettis, Hansen: "Profile Guided Code Positioning").
+
+The likelihood of the edges is taken from an edge profile if one is available
+or otherwise estimated with static heuristics (Ball, Larus: "Branch
+Prediction for Free"):
+* loop back edges are taken
+* loop exits are not taken
+* paths ending in a trap are cold
+* early returns are not taken
+
+This works on the cfg form and must run before optimize.FunCfgExit which
+inserts the branches needed for the new order.
+
+The edge profile format has one edge per line:
+
+    <fun> <src-bbl> <dst-bbl> <count>
+
+Lines starting with "#" are ignored.
+"""
+
+from typing import List, Dict, Set, Tuple, Optional
+
+from Base import cfg
+from Base import ir
+from Base import opcode_tab as o
+
+# fun name -> (src bbl name, dst bbl name) -> count
+EdgeProfile = Dict[str, Dict[Tuple[str, str], int]]
+
+# estimated number of iterations of a loop, only used to scale the weights
+_LOOP_SCALE = 10.0
+
+_PROB_BACK_EDGE = 0.88
+_PROB_LOOP_EXIT = 0.2
+_PROB_RETURN = 0.28
+_PROB_COLD = 0.001
+
+
+def ReadEdgeProfile(fin) -> EdgeProfile:
+    out: EdgeProfile = {}
+    for line in fin:
+        token = line.split()
+        if not token or token[0].startswith("#"):
+            continue
+        assert len(token) == 4, f"bad edge profile line: {line}"
+        fun, src, dst, count = token
+        edges = out.setdefault(fun, {})
+        edges[(src, dst)] = edges.get((src, dst), 0) + int(count)
+    return out
+
+
+def _FunColdBbls(fun: ir.Fun) -> Set[str]:
+    """Bbls which can only lead to a trap"""
+    cold: Set[str] = set()
+    changed = True
+    while changed:
+        changed = False
+        for bbl in fun.bbls:
+            if bbl.name in cold or bbl is fun.bbls[0]:
+                continue
+            if bbl.inss and bbl.inss[-1].opcode is o.TRAP:
+                pass
+            elif not bbl.edge_out or any(succ.name not in cold for succ in bbl.edge_out):
+                continue
+            cold.add(bbl.name)
+            changed = True
+    return cold
+
+
+def _IsBackEdge(src: ir.Bbl, dst: ir.Bbl) -> bool:
+    return dst.loop is not None and dst.loop.header is dst and cfg.Dominates(dst, src)
+
+
+def _EdgeProb(src: ir.Bbl, dst: ir.Bbl, other: ir.Bbl, cold: Set[str]) -> float:
+    """Static probability that the two way branch in src goes to dst rather than other"""
+    if (dst.name in cold) != (other.name in cold):
+        return _PROB_COLD if dst.name in cold else 1.0 - _PROB_COLD
+    if _IsBackEdge(src, dst) != _IsBackEdge(src, other):
+        return _PROB_BACK_EDGE if _IsBackEdge(src, dst) else 1.0 - _PROB_BACK_EDGE
+    if dst.loop_depth != other.loop_depth:
+        return _PROB_LOOP_EXIT if dst.loop_depth < other.loop_depth else 1.0 - _PROB_LOOP_EXIT
+
+    def returns(bbl):
+        return bbl.inss and bbl.inss[-1].opcode is o.RET
+
+    if returns(dst) != returns(other):
+        return _PROB_RETURN if returns(dst) else 1.0 - _PROB_RETURN
+    return 0.5
+
+
+def FunStaticEdgeWeights(fun: ir.Fun) -> Tuple[Dict[Tuple[str, str], float], Set[str]]:
+    """Returns the estimated edge weights and the cold bbls"""
+    cfg.FunEnsureLoopInfo(fun)
+    cold = _FunColdBbls(fun)
+    weights: Dict[Tuple[str, str], float] = {}
+    for bbl in fun.bbls:
+        freq = _LOOP_SCALE ** bbl.loop_depth
+        if bbl.name in cold:
+            freq *= _PROB_COLD
+        succs = bbl.edge_out
+        for succ in succs:
+            if len(succs) == 2 and succs[0] is not succs[1]:
+                other = succs[1] if succ is succs[0] else succs[0]
+                prob = _EdgeProb(bbl, succ, other, cold)
+            else:
+                prob = 1.0 / len(succs)
+            weights[(bbl.name, succ.name)] = weights.get((bbl.name, succ.name), 0.0) + freq * prob
+    return weights, cold
+
+
+def _ProfileEdgeWeights(fun: ir.Fun, edges: Dict[Tuple[str, str], int]) -> Tuple[
+        Dict[Tuple[str, str], float], Set[str]]:
+    """Bbls never executed are cold"""
+    weights: Dict[Tuple[str, str], float] = {
+        (bbl.name, succ.name): float(edges.get((bbl.name, succ.name), 0))
+        for bbl in fun.bbls for succ in bbl.edge_out}
+    executed: Set[str] = {fun.bbls[0].name}
+    for (src, dst), count in weights.items():
+        if count > 0:
+            executed.add(src)
+            executed.add(dst)
+    return weights, {bbl.name for bbl in fun.bbls if bbl.name not in executed}
+
+
+def _CanFallThrough(bbl: ir.Bbl) -> bool:
+    return not bbl.inss or bbl.inss[-1].opcode.has_fallthrough()
+
+
+def FunLayoutBbls(fun: ir.Fun, edges: Optional[Dict[Tuple[str, str], int]] = None) -> int:
+    """Reorders the bbls along the heaviest edges, returns the number of moved bbls
+
+    edges is the edge profile for this fun (see ReadEdgeProfile). If it is
+    None, static heuristics are used.
+    """
+    if len(fun.bbls) <= 2:
+        return 0
+    if edges is None:
+        weights, cold = FunStaticEdgeWeights(fun)
+    else:
+        weights, cold = _ProfileEdgeWeights(fun, edges)
+    pos = {bbl.name: n for n, bbl in enumerate(fun.bbls)}
+    entry = fun.bbls[0]
+
+    # bottom up: grow chains along the heaviest edges
+    chain_of: Dict[str, List[ir.Bbl]] = {bbl.name: [bbl] for bbl in fun.bbls}
+    # on a tie prefer the bbls with a single successor since they would need an extra bra
+    num_succs = {bbl.name: len(bbl.edge_out) for bbl in fun.bbls}
+    candidates = sorted(weights.items(), key=lambda x: (
+        -x[1], num_succs[x[0][0]], pos[x[0][0]], pos[x[0][1]]))
+    for (src_name, dst_name), _ in candidates:
+        src_chain = chain_of[src_name]
+        dst_chain = chain_of[dst_name]
+        src = src_chain[-1]
+        dst = dst_chain[0]
+        if (src.name != src_name or dst.name != dst_name or src_chain is dst_chain or
+                dst is entry or not _CanFallThrough(src)):
+            continue
+        # keep the cold bbls out of the hot chains
+        if dst.name in cold and src.name not in cold:
+            continue
+        src_chain += dst_chain
+        for bbl in dst_chain:
+            chain_of[bbl.name] = src_chain
+
+    # top down: place the chain with the strongest connection to the placed bbls next
+    chains: List[List[ir.Bbl]] = []
+    seen: Set[int] = set()
+    for bbl in fun.bbls:
+        chain = chain_of[bbl.name]
+        if id(chain) not in seen:
+            seen.add(id(chain))
+            chains.append(chain)
+    hot = [c for c in chains if c[0] is entry or any(bbl.name not in cold for bbl in c)]
+    # weight of the edges between a chain and the bbls placed so far
+    strength: Dict[int, float] = {id(c): 0.0 for c in chains}
+    adjacent: Dict[str, List[Tuple[str, float]]] = {bbl.name: [] for bbl in fun.bbls}
+    for (src_name, dst_name), w in weights.items():
+        adjacent[src_name].append((dst_name, w))
+        adjacent[dst_name].append((src_name, w))
+    placed: Set[str] = set()
+    placement: List[List[ir.Bbl]] = []
+    while hot:
+        # ties are broken by the original order
+        best = max(range(len(hot)), key=lambda n: (strength[id(hot[n])], -n))
+        chain = hot.pop(best)
+        placement.append(chain)
+        placed.update(bbl.name for bbl in chain)
+        for bbl in chain:
+            for other, w in adjacent[bbl.name]:
+                if other not in placed:
+                    strength[id(chain_of[other])] += w
+    for chain in chains:
+        if chain[0].name not in placed:
+            placement.append(chain)
+    # the last bbl cannot have a fallthrough successor (see cfg.FunAddUnconditionalBranches)
+    if len(placement[-1][-1].edge_out) > 1:
+        last = [n for n in range(1, len(placement)) if len(placement[n][-1].edge_out) <= 1]
+        if not last:
+            return 0
+        placement.append(placement.pop(last[-1]))
+    order: List[ir.Bbl] = [bbl for chain in placement for bbl in chain]
+    assert len(order) == len(fun.bbls) and order[0] is entry
+
+    moved = sum(1 for a, b in zip(order, fun.bbls) if a is not b)
+    if moved:
+        fun.bbls = order
+        fun.InvalidateCfgAnalyses()
+    return moved
@@ -0,0 +1,101 @@
+#!/usr/bin/python3
+
+import io
+import unittest
+
+from Base import layout
+from Base import optimize
+from Base import sanity
+from Base import testing
+
+
+def _Names(fun):
+    return [bbl.name for bbl in fun.bbls]
+
+
+class TestLayout(unittest.TestCase):
+
+    def testLoop(self):
+        unit, fun = testing.ParseFun(r"""
+.fun main NORMAL [U32] = [U32]
+.reg U32 [n i sum]
+.bbl start
+    poparg n
+    mov i = 0
+    mov sum = 0
+.bbl loop
+    blt i n body
+    bra done
+.bbl bad
+    trap
+.bbl body
+    beq i 1000 bad
+.bbl body2
+    add sum = sum i
+    add i = i 1
+    bra loop
+.bbl done
+    pusharg sum
+    ret
+""")
+        self.assertEqual(5, layout.FunLayoutBbls(fun))
+        # the loop is rotated and the trap is moved to the end
+        self.assertEqual(["start", "body", "body2", "loop", "done", "bad"], _Names(fun))
+        optimize.FunCfgExit(fun, unit)
+        sanity.FunCheck(fun, unit, check_fallthroughs=True)
+
+    def testNoFallthroughFromLastBbl(self):
+        unit, fun = testing.ParseFun(r"""
+.fun main NORMAL [U32] = [U32]
+.reg U32 [x y]
+.bbl start
+    poparg x
+    mov y = 0
+    blt y 3 done
+.bbl spin
+    add y = y x
+    blt y 2 spin
+.bbl back
+    add y = y x
+    bra spin
+.bbl done
+    pusharg y
+    ret
+""")
+        layout.FunLayoutBbls(fun)
+        # the spin loop must not end up last, its fallthrough would fall off the fun
+        self.assertLessEqual(len(fun.bbls[-1].edge_out), 1)
+        optimize.FunCfgExit(fun, unit)
+        sanity.FunCheck(fun, unit, check_fallthroughs=True)
+
+    def testProfile(self):
+        unit, fun = testing.ParseFun(r"""
+.fun main NORMAL [U32] = [U32]
+.reg U32 [x]
+.bbl start
+    poparg x
+    beq x 0 zero
+.bbl nonzero
+    mov x = 1
+    bra end
+.bbl zero
+    mov x = 2
+.bbl end
+    pusharg x
+    ret
+""")
+        profile = layout.ReadEdgeProfile(io.StringIO(r"""
+# fun src dst count
+main start zero 90
+main start nonzero 10
+main zero end 90
+main nonzero end 10
+"""))
+        self.assertEqual(3, layout.FunLayoutBbls(fun, profile["main"]))
+        self.assertEqual(["start", "zero", "end", "nonzero"], _Names(fun))
+        optimize.FunCfgExit(fun, unit)
+        sanity.FunCheck(fun, unit, check_fallthroughs=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+"""Loop invariant code motion
+
+Instructions whose operands do not change inside a loop are moved into the
+preheader of the loop, i.e. the unique bbl through which the loop is entered.
+
+The invariance of operands is determined with the help of reaching defs:
+an operand is invariant if its def is outside of the loop or is an instruction
+which has been hoisted already.
+
+This should be run after unreachable code has been removed.
+"""
+
+from typing import List, Dict, Set, Optional
+
+from Base import cfg
+from Base import ir
+from Base import liveness
+from Base import opcode_tab as o
+from Base import reaching_defs
+
+# instructions without side effects which can always be executed speculatively
+_HOISTABLE_KINDS = {o.OPC_KIND.ALU, o.OPC_KIND.ALU1, o.OPC_KIND.LEA,
+                    o.OPC_KIND.LEA1, o.OPC_KIND.CONV, o.OPC_KIND.CMP}
+
+# instructions which may trap must be executed in every iteration of the loop
+_MAY_TRAP = {o.DIV, o.REM}
+
+
+def _LoopPreheader(header: ir.Bbl, body: Set[str]) -> Optional[ir.Bbl]:
+    """Returns the bbl which can serve as a preheader if there is one"""
+    outside = [pred for pred in header.edge_in if pred.name not in body]
+    if len(outside) != 1:
+        return None
+    pred = outside[0]
+    if len(pred.edge_out) != 1:
+        return None
+    if pred.inss and (pred.inss[-1].opcode.is_bbl_terminator() or
+                      pred.inss[-1].opcode is o.PUSHARG):
+        return None
+    return pred
+
+
+def _FunAddPreheader(fun: ir.Fun, loop: ir.Loop) -> bool:
+    """Makes sure the loop has a preheader, returns True if a bbl was added"""
+    header = loop.header
+    body = {bbl.name for bbl in loop.bbls}
+    if _LoopPreheader(header, body) is not None:
+        return False
+    pre = ir.Bbl(cfg.NewDerivedBblName(header.name, "_pre", fun))
+    for pred in header.edge_in[:]:
+        if pred.name in body:
+            continue
+        if pred.inss:
+            cfg.InsMaybePatchNewSuccessor(pred.inss[-1], header, pre)
+        pred.ReplaceEdgeOut(header, pre)
+    pre.AddEdgeOut(header)
+    # if the header is the entry of the fun, the preheader becomes the new entry
+    fun.bbls.insert(fun.bbls.index(header), pre)
+    fun.bbl_syms[pre.name] = pre
+    fun.InvalidateCfgAnalyses()
+    return True
+
+
+def _LoopClobbers(inss: List[ir.Ins]):
+    """Returns the mems and stks written by the loop or None if any memory may be written"""
+    mems: Set[str] = set()
+    stks: Set[str] = set()
+    for ins in inss:
+        opc = ins.opcode
+        if opc is o.ST:
+            return None
+        elif opc is o.ST_MEM:
+            mems.add(ins.operands[0].name)
+        elif opc is o.ST_STK:
+            stks.add(ins.operands[0].name)
+        elif opc.is_call() or (opc.attributes & (o.OA.MEM_WR | o.OA.SPECIAL)):
+            return None
+    return mems, stks
+
+
+def _IsLoadAliased(ins: ir.Ins, clobbers) -> bool:
+    base = ins.operands[1]
+    if ins.opcode is o.LD_MEM and base.kind is o.MEM_KIND.RO:
+        return False
+    if clobbers is None:
+        return True
+    mems, stks = clobbers
+    if ins.opcode is o.LD:
+        return bool(mems or stks)
+    elif ins.opcode is o.LD_MEM:
+        return base.name in mems
+    else:
+        return base.name in stks
+
+
+def _LoopHoist(loop: ir.Loop, pre: ir.Bbl) -> int:
+    body = {bbl.name for bbl in loop.bbls}
+    loop_inss: Dict[int, ir.Bbl] = {}
+    num_defs: Dict[ir.Reg, int] = {}
+    for bbl in loop.bbls:
+        for ins in bbl.inss:
+            loop_inss[id(ins)] = bbl
+            for reg in ins.operands[:ins.opcode.def_ops_count()]:
+                num_defs[reg] = num_defs.get(reg, 0) + 1
+    clobbers = _LoopClobbers([ins for bbl in loop.bbls for ins in bbl.inss])
+    # the bbls executed in every iteration dominate all the exits and latches
+    exits = [bbl for bbl in loop.bbls
+             if loop.header in bbl.edge_out or any(succ.name not in body for succ in bbl.edge_out)]
+    # regs which may not be defined in the preheader
+    live_in = pre.live_out
+
+    def is_invariant(op, op_def) -> bool:
+        if not isinstance(op, ir.Reg):
+            return True
+        if isinstance(op_def, ir.Ins):
+            return id(op_def) not in loop_inss or id(op_def) in hoisted
+        return isinstance(op_def, ir.Bbl) and op_def.name not in body
+
+    def is_hoistable(ins: ir.Ins, bbl: ir.Bbl) -> bool:
+        opc = ins.opcode
+        if opc.kind not in _HOISTABLE_KINDS and opc.kind is not o.OPC_KIND.LD:
+            return False
+        dst = ins.operands[0]
+        if num_defs[dst] != 1 or dst in live_in or dst.cpu_reg is not None:
+            return False
+        num_defs_ins = opc.def_ops_count()
+        for op, op_def in zip(ins.operands[num_defs_ins:], ins.operand_defs[num_defs_ins:]):
+            if not is_invariant(op, op_def):
+                return False
+        if opc.kind is o.OPC_KIND.LD:
+            if _IsLoadAliased(ins, clobbers):
+                return False
+        elif opc not in _MAY_TRAP:
+            return True
+        return all(cfg.Dominates(bbl, x) for x in exits)
+
+    hoisted: Set[int] = set()
+    change = True
+    while change:
+        change = False
+        for bbl in loop.bbls:
+            keep = []
+            for ins in bbl.inss:
+                if is_hoistable(ins, bbl):
+                    hoisted.add(id(ins))
+                    pre.inss.append(ins)
+                    change = True
+                else:
+                    keep.append(ins)
+            bbl.inss = keep
+    return len(hoisted)
+
+
+def FunLoopInvariantCodeMotion(fun: ir.Fun) -> int:
+    """Returns the number of hoisted instructions
+
+    Preheaders which end up empty are removed again.
+    """
+    # constant folding may have left bbls which reaching defs cannot handle
+    cfg.FunRemoveUnreachableBbls(fun)
+    if cfg.FunEnsureLoopInfo(fun) == 0:
+        return 0
+    candidates = [loop for loop in fun.loops
+                  if not loop.header.inss or loop.header.inss[0].opcode is not o.POPARG]
+    added = [loop.header.name for loop in candidates if _FunAddPreheader(fun, loop)]
+    cfg.FunEnsureLoopInfo(fun)
+    liveness.FunEnsureLivenessInfo(fun)
+    reaching_defs.FunEnsureReachingDefs(fun)
+    headers = {loop.header.name for loop in candidates}
+    count = 0
+    # inner loops first so that their invariants can move further out
+    for loop in reversed(fun.loops):
+        if loop.header.name not in headers:
+            continue
+        body = {bbl.name for bbl in loop.bbls}
+        pre = _LoopPreheader(loop.header, body)
+        count += _LoopHoist(loop, pre)
+    if count:
+        fun.InvalidateAnalyses()
+    if added:
+        # drop the preheaders which did not receive any instructions
+        cfg.FunRemoveEmptyBbls(fun)
+    return count
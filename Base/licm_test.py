@@ -0,0 +1,154 @@
+#!/usr/bin/python3
+
+import collections
+import unittest
+
+from Base import licm
+from Base import optimize
+from Base import testing
+
+_HEADER = r"""
+.mem TAB 4 RO
+    .data 16 [1]
+
+.mem COUNTER 4 RW
+    .data 4 [0]
+
+.fun main NORMAL [U32] = [A64 U32]
+.reg U32 [n i y off v t sum]
+.reg A64 [p q]
+"""
+
+
+def _Opcodes(bbl):
+    return [ins.opcode.name for ins in bbl.inss]
+
+
+class TestLicm(unittest.TestCase):
+
+    def testHoisting(self):
+        _, fun = testing.ParseFun(_HEADER + r"""
+.bbl start
+    poparg p
+    poparg n
+    mov i 0
+    mov y 0
+    mov sum 0
+.bbl loop
+    add i = i y
+    add off = n 8
+    lea q = p off
+    ld v = q 0
+    ld.mem t = TAB 4
+    add y = n 3
+    add sum = sum v
+    add sum = sum t
+    blt i n loop
+.bbl done
+    pusharg sum
+    ret
+""")
+        self.assertEqual(4, licm.FunLoopInvariantCodeMotion(fun))
+        # the existing predecessor serves as the preheader
+        self.assertEqual(["start", "loop", "done"], [bbl.name for bbl in fun.bbls])
+        self.assertEqual(["poparg", "poparg", "mov", "mov", "mov",
+                          "add", "lea", "ld", "ld.mem"], _Opcodes(fun.bbls[0]))
+        # y is live into the loop
+        self.assertEqual(["add", "add", "add", "add", "blt"], _Opcodes(fun.bbls[1]))
+
+    def testAliasedLoad(self):
+        _, fun = testing.ParseFun(_HEADER + r"""
+.bbl start
+    poparg p
+    poparg n
+    mov i 0
+.bbl loop
+    ld v = p 0
+    ld.mem t = TAB 4
+    add i = i v
+    add i = i t
+    st.mem COUNTER 0 = i
+    blt i n loop
+.bbl done
+    pusharg i
+    ret
+""")
+        # TAB is read only so it cannot be aliased
+        self.assertEqual(1, licm.FunLoopInvariantCodeMotion(fun))
+        self.assertEqual(["ld", "add", "add", "st.mem", "blt"], _Opcodes(fun.bbls[1]))
+
+    def testPreheader(self):
+        _, fun = testing.ParseFun(_HEADER + r"""
+.bbl start
+    poparg p
+    poparg n
+    mov i 0
+    beq n 0 done
+.bbl cond
+    ble n i done
+.bbl body
+    add off = n 8
+    ld v = p off
+    add i = i v
+    bra cond
+.bbl done
+    pusharg i
+    ret
+""")
+        self.assertEqual(1, licm.FunLoopInvariantCodeMotion(fun))
+        self.assertEqual(["start", "cond_pre1", "cond", "body", "done"],
+                         [bbl.name for bbl in fun.bbls])
+        self.assertEqual(["cond"], [bbl.name for bbl in fun.bbls[1].edge_out])
+        # the load might not be executed at all
+        self.assertEqual(["add"], _Opcodes(fun.bbls[1]))
+        self.assertEqual(["ld", "add"], _Opcodes(fun.bbls[3]))
+
+    def testNothingToHoist(self):
+        _, fun = testing.ParseFun(_HEADER + r"""
+.bbl start
+    poparg p
+    poparg n
+    mov i 0
+    beq n 0 done
+.bbl loop
+    add i = i 1
+    blt i n loop
+.bbl done
+    pusharg i
+    ret
+""")
+        self.assertEqual(0, licm.FunLoopInvariantCodeMotion(fun))
+        # the temporary preheader is gone again
+        self.assertEqual(["start", "loop", "done"], [bbl.name for bbl in fun.bbls])
+        self.assertEqual(["done", "loop"], sorted(bbl.name for bbl in fun.bbls[0].edge_out))
+
+
+    def testFoldedBranch(self):
+        _, fun = testing.ParseFun(_HEADER + r"""
+.bbl start
+    poparg p
+    poparg n
+    mov i 0
+    mov y 3
+    mov sum 0
+    blt y 2 dead
+.bbl loop
+    add i = i 1
+    add off = n 8
+    add sum = sum off
+    blt i n loop
+.bbl done
+    pusharg sum
+    ret
+.bbl dead
+    pusharg y
+    ret
+""")
+        # const folding turns the blt into a bra and leaves dead unreachable
+        optimize.FunOptBasic(fun, collections.defaultdict(int), allow_conv_conversion=True)
+        self.assertEqual(1, licm.FunLoopInvariantCodeMotion(fun))
+        self.assertNotIn("dead", fun.bbl_syms)
+
+
+if __name__ == '__main__':
+    unittest.main()
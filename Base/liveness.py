@@ -137,7 +137,7 @@ def _BblRemoveUselessInstructions(bbl: ir.Bbl, fun: ir.Fun) -> int:
 
 
 def FunRemoveUselessInstructions(fun: ir.Fun) -> int:
-    assert ir.FUN_FLAG.LIVENESS_VALID in fun.flags
+    FunEnsureLivenessInfo(fun)
     return ir.FunGenericRewriteBbl(fun, _BblRemoveUselessInstructions)
 
 
@@ -169,8 +169,11 @@ def _FunLivenessFixpoint(fun: ir.Fun,
     return count
 
 
-def FunComputeLivenessInfo(fun: ir.Fun) -> int:
-    """Assumes that cfg.funInitCFG has been called"""
+def FunComputeLivenessInfoWithSets(fun: ir.Fun) -> int:
+    """Reference implementation of FunComputeLivenessInfo using sets of Regs
+
+    Kept for testing and benchmarking the bitset based version against
+    """
     if len(fun.bbls) > 1:
         assert len(fun.bbls[0].edge_out) > 0, f"you must run cfg.FunInitCFG"
     all_liveness: Dict[str, Liveness] = {}
@@ -184,9 +187,158 @@ def FunComputeLivenessInfo(fun: ir.Fun) -> int:
     for bbl in fun.bbls:
         bbl.live_out = all_liveness[bbl.name].live_out
     fun.flags |= ir.FUN_FLAG.LIVENESS_VALID
+    fun.liveness_callees = None
+    return rounds
+
+
+def FunNumberReg(fun: ir.Fun):
+    """Assigns a dense Reg.no to each reg in the fun and updates fun.reg_map
+
+    Reg.no zero is not used.
+    This invalidates the reaching defs as they are looked up by Reg.no.
+    """
+    reg_map = [ir.REG_INVALID]
+    for no, reg in enumerate(fun.regs, 1):
+        reg.no = no
+        reg_map.append(reg)
+    fun.reg_map = reg_map
+    fun.flags &= ~ir.FUN_FLAG.REACHING_DEFS_VALID
+
+
+def _RegNosToBits(nos: Set[int], num_regs: int) -> int:
+    # setting bits in a bytearray avoids creating lots of large temporary ints
+    buf = bytearray((num_regs + 7) // 8)
+    for no in nos:
+        buf[no >> 3] |= 1 << (no & 7)
+    return int.from_bytes(buf, "little")
+
+
+def _FunCpuRegResults(fun: ir.Fun) -> Dict[str, List[ir.Reg]]:
+    """Groups the regs of fun by the name of their CpuReg"""
+    out: Dict[str, List[ir.Reg]] = {}
+    for reg in fun.regs:
+        if reg.HasCpuReg():
+            out.setdefault(reg.cpu_reg.name, []).append(reg)
+    return out
+
+
+def _BblDefUseBits(bbl: ir.Bbl, cpu_reg_regs: Dict[str, List[ir.Reg]],
+                   num_regs: int, callees: Dict[ir.Fun, None]) -> Tuple[int, int]:
+    """Bitset version of _BblDefUse
+
+    Works on Reg.no rather than Regs which is considerably cheaper to hash.
+    Instead of iterating over all regs at each call, regs with
+    a CpuReg are looked up in cpu_reg_regs.
+    All callees are added to callees.
+    """
+    bbl_def: Set[int] = set()
+    bbl_use: Set[int] = set()
+    for ins in reversed(bbl.inss):
+        opcode = ins.opcode
+        if opcode.is_call():
+            callee: ir.Fun = cfg.InsCallee(ins)
+            assert isinstance(callee, ir.Fun)
+            callees[callee] = None
+            for cpu_reg in callee.cpu_live_out:
+                for reg in cpu_reg_regs.get(cpu_reg.name, []):
+                    if reg.cpu_reg is cpu_reg:
+                        bbl_def.add(reg.no)
+                        bbl_use.discard(reg.no)
+        num_defs = opcode.def_ops_count()
+        for n, reg in enumerate(ins.operands):
+            if not isinstance(reg, ir.Reg): continue
+            if n < num_defs:
+                bbl_def.add(reg.no)
+                bbl_use.discard(reg.no)
+            else:
+                bbl_use.add(reg.no)
+    return _RegNosToBits(bbl_def, num_regs), _RegNosToBits(bbl_use, num_regs)
+
+
+def _FunLivenessFixpointBits(preds: List[List[int]], live_def: List[int],
+                             live_use: List[int], live_out: List[int]) -> int:
+    """Backward flow liveness computation on bitsets
+
+    All arguments are indexed by the position of the Bbl in fun.bbls.
+    live_out is updated in place.
+    """
+    count = 0
+    num_bbls = len(preds)
+    live_in = [0] * num_bbls
+    # like the set based version we look at the last bbl first
+    active = list(range(num_bbls))
+    is_active = [True] * num_bbls
+    while active:
+        count += 1
+        n = active.pop(-1)
+        is_active[n] = False
+        new_in = (live_out[n] & ~live_def[n]) | live_use[n]
+        if new_in == live_in[n]:
+            continue
+        live_in[n] = new_in
+        for p in preds[n]:
+            old_out = live_out[p]
+            new_out = old_out | new_in
+            if new_out == old_out:
+                continue
+            live_out[p] = new_out
+            if not is_active[p]:
+                is_active[p] = True
+                active.append(p)
+    return count
+
+
+def FunComputeLivenessInfo(fun: ir.Fun) -> int:
+    """Assumes that cfg.funInitCFG has been called
+
+    The analysis is performed on bitsets over Reg.no. The bbl.live_out sets
+    are only materialized when accessed.
+    """
+    if len(fun.bbls) > 1:
+        assert len(fun.bbls[0].edge_out) > 0, f"you must run cfg.FunInitCFG"
+    FunNumberReg(fun)
+    reg_map = fun.reg_map
+    num_regs = len(reg_map)
+    cpu_reg_regs = _FunCpuRegResults(fun)
+    bbl_pos: Dict[str, int] = {bbl.name: n for n, bbl in enumerate(fun.bbls)}
+    preds: List[List[int]] = []
+    live_def: List[int] = []
+    live_use: List[int] = []
+    callees: Dict[ir.Fun, None] = {}
+    for bbl in fun.bbls:
+        preds.append([bbl_pos[pred.name] for pred in bbl.edge_in])
+        bbl_def, bbl_use = _BblDefUseBits(bbl, cpu_reg_regs, num_regs, callees)
+        live_def.append(bbl_def)
+        live_use.append(bbl_use)
+    live_out = [0] * len(fun.bbls)
+    rounds = _FunLivenessFixpointBits(preds, live_def, live_use, live_out)
+    for bbl, bits in zip(fun.bbls, live_out):
+        bbl.SetLiveOutBits(bits, reg_map)
+    fun.flags |= ir.FUN_FLAG.LIVENESS_VALID
+    fun.liveness_callees = [(callee, tuple(callee.cpu_live_out)) for callee in callees]
     return rounds
 
 
+def FunLivenessIsValid(fun: ir.Fun) -> bool:
+    """Besides the fun itself liveness depends on the cpu_live_out of the callees
+
+    which the backends set up while legalizing the callees.
+    """
+    if ir.FUN_FLAG.LIVENESS_VALID not in fun.flags or fun.liveness_callees is None:
+        return False
+    for callee, cpu_live_out in fun.liveness_callees:
+        if tuple(callee.cpu_live_out) != cpu_live_out:
+            return False
+    return True
+
+
+def FunEnsureLivenessInfo(fun: ir.Fun) -> int:
+    """Like FunComputeLivenessInfo but reuses the liveness info if it is still valid"""
+    if FunLivenessIsValid(fun):
+        return 0
+    return FunComputeLivenessInfo(fun)
+
+
 def _HandleSpillForIns(ins: ir.Ins, regs_to_be_spilled: Set[str],
                        spill_slots, ld_spill, st_spill, zero):
     out_ld = []
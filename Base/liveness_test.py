@@ -288,6 +288,88 @@ class TestRanges(unittest.TestCase):
         for lr in ranges:
             print(lr)
 
+    def testBitsMatchSets(self):
+        code = io.StringIO(r"""
+.fun main NORMAL [U32] = [U32 U32]
+.reg U32 [n a i x y]
+.bbl start
+    poparg n
+    poparg a
+    mov i 0
+    mov x 0
+.bbl loop
+    blt n i done
+    add y = x a
+    beq y 7 skip
+    add x = y i
+.bbl skip
+    add i = i 1
+    bra loop
+.bbl done
+    pusharg x
+    ret
+""")
+        unit = serialize.UnitParseFromAsm(code)
+        fun = unit.fun_syms["main"]
+        optimize.FunCfgInit(fun, unit)
+        liveness.FunComputeLivenessInfoWithSets(fun)
+        expected = [set(bbl.live_out) for bbl in fun.bbls]
+        liveness.FunComputeLivenessInfo(fun)
+        self.assertEqual(expected, [bbl.live_out for bbl in fun.bbls])
+        names = [sorted(r.name for r in bbl.live_out) for bbl in fun.bbls]
+        self.assertEqual([["a", "i", "n", "x"], ["a", "i", "n", "x"],
+                          ["a", "i", "n", "x", "y"], ["a", "i", "n", "x"],
+                          ["a", "i", "n", "x"], []], names)
+
+
+
+class TestValidity(unittest.TestCase):
+
+    def _Setup(self):
+        code = io.StringIO(r"""
+.fun callee EXTERN [U32] = []
+
+.fun main NORMAL [U32] = [U32]
+.reg U32 [a x]
+.bbl start
+    poparg a
+    bsr callee
+    poparg x
+    add x = x a
+    pusharg x
+    ret
+""")
+        unit = serialize.UnitParseFromAsm(code)
+        fun = unit.fun_syms["main"]
+        optimize.FunCfgInit(fun, unit)
+        return unit, fun
+
+    def testReuse(self):
+        unit, fun = self._Setup()
+        self.assertFalse(liveness.FunLivenessIsValid(fun))
+        self.assertGreater(liveness.FunEnsureLivenessInfo(fun), 0)
+        self.assertTrue(liveness.FunLivenessIsValid(fun))
+        self.assertEqual(0, liveness.FunEnsureLivenessInfo(fun))
+        # a rewrite without changes keeps the info
+        self.assertEqual(0, liveness.FunRemoveUselessInstructions(fun))
+        self.assertTrue(liveness.FunLivenessIsValid(fun))
+
+    def testInvalidation(self):
+        unit, fun = self._Setup()
+        liveness.FunComputeLivenessInfo(fun)
+        ir.FunGenericRewrite(fun, lambda ins, _fun: [ins] if ins.opcode is o.ADD else None)
+        self.assertFalse(liveness.FunLivenessIsValid(fun))
+
+        liveness.FunComputeLivenessInfo(fun)
+        cfg.FunRemoveUnconditionalBranches(fun)
+        self.assertFalse(liveness.FunLivenessIsValid(fun))
+
+        # the liveness at calls depends on the callee
+        liveness.FunComputeLivenessInfo(fun)
+        callee = unit.fun_syms["callee"]
+        callee.cpu_live_out = [ir.CpuReg("r0", 0)]
+        self.assertFalse(liveness.FunLivenessIsValid(fun))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -13,7 +13,7 @@ Examples:
       instruction set with sequence of equivalent instructions
 """
 
-from typing import List, Optional
+from typing import List, Optional, Callable
 
 from Base import cfg
 from Base import ir
@@ -112,6 +112,118 @@ def FunStrengthReduction(fun: ir.Fun) -> int:
     return ir.FunGenericRewrite(fun, _InsStrengthReduction)
 
 
+def DivisionMagic(d: int, precision: int, width=32):
+    """Returns the multiplier m and the post shift for dividing by d
+
+    This is `CHOOSE_MULTIPLIER` from Granlund and Montgomery:
+    "Division by Invariant Integers using Multiplication".
+    For 0 <= n < 2^precision: n // d == (n * m) >> (width + post_shift)
+    m may need width + 1 bits.
+    """
+    assert 1 < d < (1 << width)
+    log = (d - 1).bit_length()
+    post_shift = log
+    m_low = (1 << (width + log)) // d
+    m_high = ((1 << (width + log)) + (1 << (width + log - precision))) // d
+    while m_low // 2 < m_high // 2 and post_shift > 0:
+        m_low //= 2
+        m_high //= 2
+        post_shift -= 1
+    return m_high, post_shift
+
+
+def _InsDivByConst(ins: ir.Ins, fun: ir.Fun) -> Optional[List[ir.Ins]]:
+    """Rewrites 32 bit int division and modulo by a constant to multiplications
+
+    The high half of the product is obtained with a 64 bit multiplication so
+    this is only usable for targets with 64 bit registers.
+
+    div z:U32 = a 7
+    becomes
+    conv w:U64 = a
+    mul w = w 0x24924925
+    shr w = w 32
+    conv t:U32 = w
+    sub z = a t
+    shr z = z 1
+    add z = z t
+    shr z = z 2
+
+    Division by 0, 1, -1 and min_int is left alone.
+    """
+    opc = ins.opcode
+    if opc not in (o.DIV, o.REM):
+        return None
+    dst, src, divisor = ins.operands
+    kind = dst.kind
+    if kind not in (o.DK.U32, o.DK.S32) or not isinstance(divisor, ir.Const):
+        return None
+    d = divisor.value
+    is_signed = kind is o.DK.S32
+    if abs(d) <= 1 or d == -(1 << 31):
+        return None
+    if d & (d - 1) == 0 and not is_signed:
+        if opc is o.REM:
+            return [ins.Init(o.AND, [dst, src, ir.Const(kind, d - 1)])]
+        shift = d.bit_length() - 1
+        return [ins.Init(o.SHR, [dst, src, ir.Const(kind, shift)])]
+    out = []
+    q = fun.GetScratchReg(kind, "div_q", False)
+    if abs(d) & (abs(d) - 1) == 0:
+        # round towards zero by adding d - 1 to negative dividends
+        shift = abs(d).bit_length() - 1
+        out.append(ir.Ins(o.SHR, [q, src, ir.Const(kind, 31)]))
+        out.append(ir.Ins(o.AND, [q, q, ir.Const(kind, abs(d) - 1)]))
+        out.append(ir.Ins(o.ADD, [q, q, src]))
+        out.append(ir.Ins(o.SHR, [q, q, ir.Const(kind, shift)]))
+    elif is_signed:
+        m, post_shift = DivisionMagic(abs(d), 31)
+        # m < 2^32 so the product fits into 63 bits
+        wide = fun.GetScratchReg(o.DK.S64, "div_wide", False)
+        out.append(ir.Ins(o.CONV, [wide, src]))
+        out.append(ir.Ins(o.MUL, [wide, wide, ir.Const(o.DK.S64, m)]))
+        out.append(ir.Ins(o.SHR, [wide, wide, ir.Const(o.DK.S64, 32 + post_shift)]))
+        out.append(ir.Ins(o.CONV, [q, wide]))
+        # round towards zero by adding one for negative dividends
+        sign = fun.GetScratchReg(kind, "div_sign", False)
+        out.append(ir.Ins(o.SHR, [sign, src, ir.Const(kind, 31)]))
+        out.append(ir.Ins(o.SUB, [q, q, sign]))
+    else:
+        m, post_shift = DivisionMagic(d, 32)
+        wide = fun.GetScratchReg(o.DK.U64, "div_wide", False)
+        out.append(ir.Ins(o.CONV, [wide, src]))
+        if m < (1 << 32):
+            out.append(ir.Ins(o.MUL, [wide, wide, ir.Const(o.DK.U64, m)]))
+            out.append(ir.Ins(o.SHR, [wide, wide, ir.Const(o.DK.U64, 32 + post_shift)]))
+            out.append(ir.Ins(o.CONV, [q, wide]))
+        else:
+            # m has 33 bits: q = (((src * (m - 2^32)) >> 32) + src) >> post_shift
+            # computed as t + ((src - t) >> 1) >> (post_shift - 1) to stay within 32 bits
+            out.append(ir.Ins(o.MUL, [wide, wide, ir.Const(o.DK.U64, m - (1 << 32))]))
+            out.append(ir.Ins(o.SHR, [wide, wide, ir.Const(o.DK.U64, 32)]))
+            t = fun.GetScratchReg(kind, "div_t", False)
+            out.append(ir.Ins(o.CONV, [t, wide]))
+            out.append(ir.Ins(o.SUB, [q, src, t]))
+            out.append(ir.Ins(o.SHR, [q, q, ir.Const(kind, 1)]))
+            out.append(ir.Ins(o.ADD, [q, q, t]))
+            if post_shift > 1:
+                out.append(ir.Ins(o.SHR, [q, q, ir.Const(kind, post_shift - 1)]))
+    if is_signed and d < 0:
+        out.append(ir.Ins(o.SUB, [q, ir.Const(kind, 0), q]))
+    if opc is o.DIV:
+        out.append(ins.Init(o.MOV, [dst, q]))
+    else:
+        prod = fun.GetScratchReg(kind, "div_prod", False)
+        out.append(ir.Ins(o.MUL, [prod, q, ir.Const(kind, d)]))
+        out.append(ins.Init(o.SUB, [dst, src, prod]))
+    return out
+
+
+def FunDivByConstToMul(fun: ir.Fun) -> int:
+    """Replaces 32 bit divisions and modulos by constants (see _InsDivByConst)"""
+    return ir.FunGenericRewrite(fun, _InsDivByConst)
+
+
 def _InsMoveElimination(ins: ir.Ins, _fun: ir.Fun) -> Optional[List[ir.Ins]]:
     if ins.opcode not in {o.MOV, o.CONV}:
         return None
@@ -241,10 +353,11 @@ def InsEliminateCmp(ins: ir.Ins, bbl: ir.Bbl, fun: ir.Fun):
     bbl.edge_in.append(bbl_prev)
 
 
-def FunEliminateCmp(fun: ir.Fun) -> int:
+def FunEliminateCmp(fun: ir.Fun, keep: Optional[Callable[[ir.Ins], bool]] = None) -> int:
+    """keep optionally selects the cmpXX instructions the backend can handle directly"""
     for bbl in fun.bbls[:]:  # not we are updating the list while iterating over it
         for ins in bbl.inss[:]:
-            if ins.opcode.kind is o.OPC_KIND.CMP:
+            if ins.opcode.kind is o.OPC_KIND.CMP and (keep is None or not keep(ins)):
                 InsEliminateCmp(ins, bbl, fun)
 
 
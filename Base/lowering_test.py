@@ -0,0 +1,107 @@
+#!/usr/bin/python3
+
+import io
+import random
+import unittest
+
+from Base import eval
+from Base import ir
+from Base import lowering
+from Base import opcode_tab as o
+from Base import optimize
+from Base import serialize
+
+
+def _Execute(inss, regs):
+    """Runs a straight line sequence of instructions, regs maps regs to values"""
+    def value(op):
+        return op.value if isinstance(op, ir.Const) else regs[op]
+
+    for ins in inss:
+        opc = ins.opcode
+        ops = ins.operands
+        if opc is o.MOV:
+            regs[ops[0]] = value(ops[1])
+        elif opc is o.CONV:
+            regs[ops[0]] = eval.ConvertIntValue(
+                ops[0].kind, ir.Const(ops[1].kind, value(ops[1]))).value
+        else:
+            assert opc.kind is o.OPC_KIND.ALU, f"unexpected {ins}"
+            regs[ops[0]] = eval.EvaluatateALU(
+                opc, ir.Const(ops[1].kind, value(ops[1])),
+                ir.Const(ops[2].kind, value(ops[2]))).value
+
+
+def _Dividends(kind: o.DK, d: int, rng: random.Random):
+    if kind is o.DK.U32:
+        lo, hi = 0, (1 << 32) - 1
+    else:
+        lo, hi = -(1 << 31), (1 << 31) - 1
+    out = [lo, lo + 1, hi - 1, hi, 0, 1, 2]
+    for m in (1, 2, 3, hi // abs(d)):
+        for x in (m * d - 1, m * d, m * d + 1, -m * d - 1, -m * d, -m * d + 1):
+            if lo <= x <= hi:
+                out.append(x)
+    out += [rng.randint(lo, hi) for _ in range(30)]
+    return out
+
+
+class TestDivByConst(unittest.TestCase):
+
+    def _Check(self, kind: o.DK, divisors):
+        rng = random.Random(1)
+        fun = ir.Fun("f", o.FUN_KIND.NORMAL, [], [])
+        dst = fun.AddReg(ir.Reg("dst", kind))
+        src = fun.AddReg(ir.Reg("src", kind))
+        for d in divisors:
+            for opc in (o.DIV, o.REM):
+                inss = lowering._InsDivByConst(ir.Ins(opc, [dst, src, ir.Const(kind, d)]), fun)
+                self.assertIsNotNone(inss, f"{opc.name} {d}")
+                self.assertNotIn(opc, [ins.opcode for ins in inss])
+                for x in _Dividends(kind, d, rng):
+                    expected = eval.EvaluatateALU(opc, ir.Const(kind, x), ir.Const(kind, d)).value
+                    regs = {src: x}
+                    _Execute(inss, regs)
+                    self.assertEqual(expected, regs[dst], f"{x} {opc.name} {d}")
+
+    def testUnsigned(self):
+        rng = random.Random(2)
+        divisors = list(range(2, 300)) + [(1 << n) + k for n in range(9, 32) for k in (-1, 0, 1)]
+        divisors += [0xffffffff, 641, 6700417] + [rng.randint(2, 0xffffffff) for _ in range(100)]
+        self._Check(o.DK.U32, [d for d in divisors if d <= 0xffffffff])
+
+    def testSigned(self):
+        rng = random.Random(3)
+        divisors = list(range(2, 300)) + [(1 << n) + k for n in range(9, 31) for k in (-1, 0, 1)]
+        divisors += [(1 << 31) - 1, 641] + [rng.randint(2, (1 << 31) - 1) for _ in range(100)]
+        self._Check(o.DK.S32, divisors + [-d for d in divisors])
+
+    def testFun(self):
+        unit = serialize.UnitParseFromAsm(io.StringIO(r"""
+.fun main NORMAL [U32 S32] = [U32 S32]
+.reg U32 [x a b]
+.reg S32 [y c d]
+.bbl start
+    poparg x
+    poparg y
+    div a = x 10
+    rem b = x a
+    div c = y 1
+    rem d = y -3
+    add a = a b
+    add c = c d
+    pusharg c
+    pusharg a
+    ret
+"""))
+        fun = unit.fun_syms["main"]
+        optimize.FunCfgInit(fun, unit)
+        self.assertEqual(2, lowering.FunDivByConstToMul(fun))
+        opcodes = [ins.opcode for ins in fun.bbls[0].inss]
+        # only the division by a reg and by one are left
+        self.assertEqual(1, opcodes.count(o.REM))
+        self.assertEqual(1, opcodes.count(o.DIV))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+"""Scalar replacement of stk regions (mem2reg)
+
+Stk regions whose address is never taken are only accessed via
+ld.stk/st.stk. If all these accesses use constant offsets, each accessed
+field (offset + kind) can be kept in a reg instead, e.g.
+
+.stk s 4 8
+    st.stk s 4 = x              mov $1_s_4 = x
+    ...                   =>    ...
+    ld.stk y = s 4              mov y = $1_s_4
+
+A field is promoted if all its accesses agree on the kind and do not
+partially overlap with other accesses. A stk without remaining accesses is
+removed which shrinks the stack frame.
+
+The fields regs are initialized to zero at the beginning of the fun so that
+there is no use without a def. These movs are removed by the
+liveness based optimizations if they are not needed.
+Since the code is not in SSA form no phis are needed.
+"""
+
+from typing import List, Dict, Tuple, Set
+
+from Base import ir
+from Base import opcode_tab as o
+
+# (offset, kind) of a field
+Field = Tuple[int, o.DK]
+
+
+def _AccessKind(ins: ir.Ins) -> o.DK:
+    return ins.operands[0].kind if ins.opcode is o.LD_STK else ins.operands[2].kind
+
+
+def _FunStkFields(fun: ir.Fun) -> Dict[str, Set[Field]]:
+    """Returns the fields which can be promoted for each stk
+
+    Stks whose address escapes or which are accessed with reg offsets are
+    not included.
+    """
+    accesses: Dict[str, Set[Field]] = {name: set() for name in fun.stk_syms}
+    bad: Set[str] = set()
+    for bbl in fun.bbls:
+        for ins in bbl.inss:
+            for n, op in enumerate(ins.operands):
+                if not isinstance(op, ir.Stk):
+                    continue
+                if ins.opcode is o.LD_STK and n == 1 or ins.opcode is o.ST_STK and n == 0:
+                    offset = ins.operands[n + 1]
+                    if isinstance(offset, ir.Const):
+                        accesses[op.name].add((offset.value, _AccessKind(ins)))
+                        continue
+                # lea.stk, cas.stk and reg offsets
+                bad.add(op.name)
+    out: Dict[str, Set[Field]] = {}
+    for name, fields in accesses.items():
+        if name in bad:
+            continue
+        ranges = {}
+        for offset, kind in fields:
+            size = kind.bitwidth() // 8
+            ranges.setdefault(offset, []).append((offset + size, kind))
+        good: Set[Field] = set()
+        for offset, ends in ranges.items():
+            if len(ends) != 1:
+                continue  # accessed with different kinds
+            end, kind = ends[0]
+            if any(other != offset and other < end and offset < other_end
+                   for other, other_ends in ranges.items() for other_end, _ in other_ends):
+                continue
+            good.add((offset, kind))
+        out[name] = good
+    return out
+
+
+def _Zero(kind: o.DK) -> ir.Const:
+    return ir.Const(kind, 0.0 if kind.flavor() == o.DK_FLAVOR_F else 0)
+
+
+def FunPromoteStkFields(fun: ir.Fun) -> int:
+    """Returns the number of rewritten ld.stk/st.stk instructions"""
+    if not fun.stk_syms or not fun.bbls:
+        return 0
+    entry = fun.bbls[0]
+    # the initialization would be repeated
+    if entry.edge_in:
+        return 0
+    promotable = _FunStkFields(fun)
+    regs: Dict[Tuple[str, int], ir.Reg] = {}
+    inits: List[ir.Ins] = []
+    for name, fields in sorted(promotable.items()):
+        for offset, kind in sorted(fields, key=lambda x: x[0]):
+            reg = fun.GetScratchReg(kind, f"{name}_{offset}", False)
+            regs[(name, offset)] = reg
+            inits.append(ir.Ins(o.MOV, [reg, _Zero(kind)]))
+    if not regs:
+        return 0
+
+    def field_reg(stk, offset):
+        if not isinstance(offset, ir.Const):
+            return None
+        return regs.get((stk.name, offset.value))
+
+    count = 0
+    remaining: Set[str] = set()
+    for bbl in fun.bbls:
+        for n, ins in enumerate(bbl.inss):
+            ops = ins.operands
+            if ins.opcode is o.LD_STK:
+                reg = field_reg(ops[1], ops[2])
+                if reg is not None:
+                    bbl.inss[n] = ir.Ins(o.MOV, [ops[0], reg])
+                    count += 1
+                    continue
+            elif ins.opcode is o.ST_STK:
+                reg = field_reg(ops[0], ops[1])
+                if reg is not None:
+                    bbl.inss[n] = ir.Ins(o.MOV, [reg, ops[2]])
+                    count += 1
+                    continue
+            for op in ins.operands:
+                if isinstance(op, ir.Stk):
+                    remaining.add(op.name)
+    for name in list(fun.stk_syms):
+        if name in promotable and name not in remaining:
+            del fun.stk_syms[name]
+    # popargs must stay at the beginning
+    pos = 0
+    while pos < len(entry.inss) and entry.inss[pos].opcode is o.POPARG:
+        pos += 1
+    entry.inss[pos:pos] = inits
+    fun.InvalidateAnalyses()
+    return count
@@ -0,0 +1,68 @@
+#!/usr/bin/python3
+
+import unittest
+
+from Base import mem2reg
+from Base import sanity
+from Base import testing
+
+
+class TestMem2Reg(unittest.TestCase):
+
+    def testPromotion(self):
+        unit, fun = testing.ParseFun(r"""
+.fun main NORMAL [U32] = [U32]
+.reg U32 [x y]
+.reg U64 [z]
+.stk pair 8 16
+.bbl start
+    poparg x
+    st.stk pair 0 = x
+    st.stk pair 8 = 7:U64
+    beq x 0 skip
+.bbl inc
+    ld.stk y = pair 0
+    add y = y 1
+    st.stk pair 0 = y
+.bbl skip
+    ld.stk y = pair 0
+    ld.stk z = pair 8
+    pusharg y
+    ret
+""")
+        self.assertEqual(6, mem2reg.FunPromoteStkFields(fun))
+        self.assertEqual({}, fun.stk_syms)
+        self.assertEqual([["poparg x", "mov $1_pair_0 0", "mov $2_pair_8 0",
+                           "mov $1_pair_0 x", "mov $2_pair_8 7", "beq x 0 skip"],
+                          ["mov y $1_pair_0", "add y y 1", "mov $1_pair_0 y"],
+                          ["mov y $1_pair_0", "mov z $2_pair_8", "pusharg y", "ret"]],
+                         testing.RenderFun(fun))
+        sanity.FunCheck(fun, unit, check_push_pop=True)
+
+    def testNoPromotion(self):
+        unit, fun = testing.ParseFun(r"""
+.fun main NORMAL [U32] = [U32]
+.reg U32 [x y]
+.reg U16 [h]
+.reg A64 [a]
+.stk escapes 4 4
+.stk overlap 4 8
+.bbl start
+    poparg x
+    lea.stk a = escapes 0
+    st.stk escapes 0 = x
+    st.stk overlap 0 = x
+    st.stk overlap 4 = x
+    ld.stk h = overlap 2
+    ld.stk y = overlap 4
+    pusharg y
+    ret
+""")
+        # only the field at offset 4 of overlap does not overlap with another access
+        self.assertEqual(2, mem2reg.FunPromoteStkFields(fun))
+        self.assertEqual(["escapes", "overlap"], sorted(fun.stk_syms))
+        sanity.FunCheck(fun, unit, check_push_pop=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
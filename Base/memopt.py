@@ -0,0 +1,276 @@
+"""Memory optimizations across bbls
+
+* load forwarding: a load from a location whose value is known because of an
+  earlier store to or load from the same location is replaced by a mov
+* dead store elimination: a store is removed if the location is overwritten
+  on all paths before it can be read or if the location is in a stk region
+  which is not read anymore before the fun returns
+
+Both are classic dataflow problems over the cfg. Locations are described by
+a base (a stk, a mem or a reg), a constant offset and a kind. The alias model
+is deliberately simple:
+
+* distinct stks and distinct mems never alias each other
+* a stk whose address is never taken (no lea.stk) cannot be accessed via a reg
+* accesses relative to the same reg with disjoint offsets do not alias
+* anything else may alias
+
+Calls may read or write all memory except stks whose address is never taken.
+cas, bcopy and bzero are treated as accessing all memory.
+The code is not in SSA form so facts mentioning a reg are dropped whenever
+the reg is written.
+"""
+
+from typing import List, Dict, Optional, Set, Tuple, Any
+
+from Base import ir
+from Base import opcode_tab as o
+
+# ("stk", name), ("mem", name) or ("reg", reg)
+Base = Tuple[str, Any]
+# base, offset (None if not constant), kind of the access
+Loc = Tuple[Base, Optional[int], o.DK]
+
+_LOADS = {o.LD: 1, o.LD_MEM: 1, o.LD_STK: 1}
+_STORES = {o.ST: 0, o.ST_MEM: 0, o.ST_STK: 0}
+
+
+def _MakeLoc(ins: ir.Ins, pos: int, kind: o.DK) -> Loc:
+    base = ins.operands[pos]
+    if isinstance(base, ir.Stk):
+        b = ("stk", base.name)
+    elif isinstance(base, ir.Mem):
+        b = ("mem", base.name)
+    else:
+        assert isinstance(base, ir.Reg)
+        b = ("reg", base)
+    offset = ins.operands[pos + 1]
+    return b, offset.value if isinstance(offset, ir.Const) else None, kind
+
+
+def _InsLoc(ins: ir.Ins) -> Optional[Loc]:
+    """Returns the location accessed by a load or store"""
+    pos = _LOADS.get(ins.opcode)
+    if pos is not None:
+        return _MakeLoc(ins, pos, ins.operands[0].kind)
+    pos = _STORES.get(ins.opcode)
+    if pos is not None:
+        return _MakeLoc(ins, pos, ins.operands[2].kind)
+    return None
+
+
+class _AliasModel:
+
+    def __init__(self, fun: ir.Fun):
+        self.escaped = ir.FunEscapedStks(fun)
+
+    def IsPrivate(self, loc: Loc) -> bool:
+        """Only accessible via ld.stk/st.stk"""
+        base = loc[0]
+        return base[0] == "stk" and base[1] not in self.escaped
+
+    def MayAlias(self, a: Loc, b: Loc) -> bool:
+        base_a, base_b = a[0], b[0]
+        if base_a == base_b:
+            if a[1] is None or b[1] is None:
+                return True
+            return a[1] < b[1] + b[2].bitwidth() // 8 and b[1] < a[1] + a[2].bitwidth() // 8
+        if base_a[0] == "reg" or base_b[0] == "reg":
+            return not self.IsPrivate(a) and not self.IsPrivate(b)
+        return False
+
+
+def _IsBarrier(ins: ir.Ins) -> bool:
+    """Accesses unknown memory"""
+    return ins.opcode.kind in {o.OPC_KIND.CAS, o.OPC_KIND.BCOPY, o.OPC_KIND.BZERO}
+
+
+def _DefinedRegs(ins: ir.Ins) -> List[ir.Reg]:
+    return ins.operands[:ins.opcode.def_ops_count()]
+
+
+############################################################
+# Load Forwarding
+############################################################
+
+# location -> reg or const holding its current value
+_Avail = Dict[Loc, Any]
+
+
+def _MentionsReg(loc: Loc, val: Any, reg: ir.Reg) -> bool:
+    return val is reg or loc[0] == ("reg", reg)
+
+
+def _ForwardTransfer(ins: ir.Ins, avail: _Avail, model: _AliasModel) -> Optional[Any]:
+    """Updates avail, returns the known value if ins is a load"""
+    if ins.opcode.is_call():
+        for loc in [loc for loc in avail if not model.IsPrivate(loc)]:
+            del avail[loc]
+        return None
+    if _IsBarrier(ins):
+        avail.clear()
+        return None
+    loc = _InsLoc(ins)
+    known = None
+    if loc is not None and ins.opcode in _STORES:
+        for other in [other for other in avail if model.MayAlias(loc, other)]:
+            del avail[other]
+    elif loc is not None:
+        known = avail.get(loc)
+    for reg in _DefinedRegs(ins):
+        for other in [other for other, val in avail.items() if _MentionsReg(other, val, reg)]:
+            del avail[other]
+    # e.g. "ld x = x 0" does not provide a fact
+    if loc is None or loc[1] is None or any(loc[0] == ("reg", reg) for reg in _DefinedRegs(ins)):
+        return known
+    if ins.opcode in _STORES:
+        avail[loc] = ins.operands[2]
+    else:
+        # keep the older fact if still valid since it is more likely to be shared by other paths
+        avail.setdefault(loc, ins.operands[0])
+    return known
+
+
+def _Meet(a: Optional[_Avail], b: _Avail) -> _Avail:
+    if a is None:
+        return dict(b)
+    return {loc: val for loc, val in a.items() if loc in b and b[loc] == val}
+
+
+def FunForwardLoads(fun: ir.Fun) -> int:
+    """Returns the number of loads replaced by movs"""
+    model = _AliasModel(fun)
+    avail_out: Dict[str, _Avail] = {}
+    changed = True
+    while changed:
+        changed = False
+        for n, bbl in enumerate(fun.bbls):
+            avail = _BblAvailIn(bbl, n, avail_out)
+            if avail is None:
+                continue
+            for ins in bbl.inss:
+                _ForwardTransfer(ins, avail, model)
+            if avail_out.get(bbl.name) != avail:
+                avail_out[bbl.name] = avail
+                changed = True
+
+    count = 0
+    for n, bbl in enumerate(fun.bbls):
+        avail = _BblAvailIn(bbl, n, avail_out) or {}
+        for pos, ins in enumerate(bbl.inss):
+            known = _ForwardTransfer(ins, avail, model)
+            if known is not None:
+                bbl.inss[pos] = ir.Ins(o.MOV, [ins.operands[0], known])
+                count += 1
+    if count:
+        fun.InvalidateAnalyses()
+    return count
+
+
+def _BblAvailIn(bbl: ir.Bbl, n: int, avail_out: Dict[str, _Avail]) -> Optional[_Avail]:
+    """Returns None if no pred has been visited yet"""
+    if n == 0:
+        return {}
+    avail: Optional[_Avail] = None
+    # preds not yet visited do not constrain the result (optimistic)
+    for pred in bbl.edge_in:
+        out = avail_out.get(pred.name)
+        if out is not None:
+            avail = _Meet(avail, out)
+    return avail
+
+
+############################################################
+# Dead Store Elimination
+############################################################
+
+def _FunPrivateStoreLocs(fun: ir.Fun, model: _AliasModel) -> Set[Loc]:
+    """All locations in private stks written by the fun which are dead at a ret"""
+    out: Set[Loc] = set()
+    for bbl in fun.bbls:
+        for ins in bbl.inss:
+            if ins.opcode is o.ST_STK:
+                loc = _InsLoc(ins)
+                if loc[1] is not None and model.IsPrivate(loc):
+                    out.add(loc)
+    return out
+
+
+def _BackwardTransfer(ins: ir.Ins, dead: Set[Loc], model: _AliasModel) -> bool:
+    """Updates dead, returns true if ins is a dead store"""
+    if ins.opcode.is_call():
+        for loc in [loc for loc in dead if not model.IsPrivate(loc)]:
+            dead.remove(loc)
+        return False
+    if _IsBarrier(ins):
+        dead.clear()
+        return False
+    for reg in _DefinedRegs(ins):
+        for loc in [loc for loc in dead if loc[0] == ("reg", reg)]:
+            dead.remove(loc)
+    loc = _InsLoc(ins)
+    if loc is None:
+        return False
+    if ins.opcode in _LOADS:
+        for other in [other for other in dead if model.MayAlias(loc, other)]:
+            dead.remove(other)
+        return False
+    if loc in dead:
+        return True
+    if loc[1] is not None:
+        dead.add(loc)
+    return False
+
+
+def FunEliminateDeadStores(fun: ir.Fun) -> int:
+    """Returns the number of removed stores"""
+    model = _AliasModel(fun)
+    at_ret = _FunPrivateStoreLocs(fun, model)
+    dead_in: Dict[str, Set[Loc]] = {}
+    changed = True
+    while changed:
+        changed = False
+        for bbl in reversed(fun.bbls):
+            dead = _BblDeadOut(bbl, dead_in, at_ret)
+            if dead is None:
+                continue
+            for ins in reversed(bbl.inss):
+                _BackwardTransfer(ins, dead, model)
+            if dead_in.get(bbl.name) != dead:
+                dead_in[bbl.name] = dead
+                changed = True
+
+    count = 0
+    for bbl in fun.bbls:
+        dead = _BblDeadOut(bbl, dead_in, at_ret) or set()
+        keep: List[ir.Ins] = []
+        for ins in reversed(bbl.inss):
+            if _BackwardTransfer(ins, dead, model):
+                count += 1
+            else:
+                keep.append(ins)
+        keep.reverse()
+        bbl.inss = keep
+    if count:
+        fun.InvalidateAnalyses()
+    return count
+
+
+def _BblDeadOut(bbl: ir.Bbl, dead_in: Dict[str, Set[Loc]],
+               at_ret: Set[Loc]) -> Optional[Set[Loc]]:
+    """Returns None if no succ has been visited yet"""
+    if not bbl.edge_out:
+        if bbl.inss and bbl.inss[-1].opcode is o.RET:
+            return set(at_ret)
+        return set()
+    dead: Optional[Set[Loc]] = None
+    # succs not yet visited do not constrain the result (optimistic)
+    for succ in bbl.edge_out:
+        succ_dead = dead_in.get(succ.name)
+        if succ_dead is not None:
+            dead = set(succ_dead) if dead is None else dead & succ_dead
+    return dead
+
+
+def FunMemOpt(fun: ir.Fun) -> int:
+    return FunForwardLoads(fun) + FunEliminateDeadStores(fun)
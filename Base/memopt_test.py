@@ -0,0 +1,102 @@
+#!/usr/bin/python3
+
+import unittest
+
+from Base import memopt
+from Base import testing
+
+
+class TestMemOpt(unittest.TestCase):
+
+    def testForwardAcrossBbls(self):
+        unit, fun = testing.ParseFun(r"""
+.fun main NORMAL [U32] = [U32 A64]
+.reg U32 [x y z]
+.reg A64 [p]
+.mem g 4 RW
+    .data 8 [0]
+.bbl start
+    poparg x
+    poparg p
+    st.mem g 0 = x
+    st p 0 = 5:U32
+    st p 4 = 6:U32
+    beq x 0 other
+.bbl one
+    ld y = p 0
+    bra end
+.bbl other
+    ld y = p 4
+.bbl end
+    ld z = p 0
+    ld.mem y = g 0
+    pusharg z
+    ret
+""")
+        # "st p 0" may clobber g but p 0 and p 4 are disjoint
+        self.assertEqual(3, memopt.FunForwardLoads(fun))
+        self.assertEqual([["mov y 5"],
+                          ["mov y 6"],
+                          ["mov z 5", "ld.mem y g 0", "pusharg z", "ret"]],
+                         testing.RenderFun(fun)[1:])
+
+    def testCallsAndRedefinitions(self):
+        unit, fun = testing.ParseFun(r"""
+.fun foo NORMAL [] = []
+.bbl start
+    ret
+
+.fun main NORMAL [U32] = [A64]
+.reg U32 [x y z]
+.reg A64 [p]
+.stk s 4 4
+.bbl start
+    poparg p
+    st.stk s 0 = 1:U32
+    st p 0 = 2:U32
+    bsr foo
+    ld.stk x = s 0
+    ld y = p 0
+    lea p = p 4
+    ld z = p 0
+    pusharg z
+    ret
+""")
+        # only the private stk survives the call
+        self.assertEqual(1, memopt.FunForwardLoads(fun))
+        self.assertEqual("mov x 1", testing.RenderFun(fun)[0][4])
+
+    def testDeadStores(self):
+        unit, fun = testing.ParseFun(r"""
+.fun main NORMAL [U32] = [U32 A64]
+.reg U32 [x y]
+.reg A64 [p]
+.stk s 4 8
+.bbl start
+    poparg x
+    poparg p
+    st p 0 = 1:U32
+    st.stk s 0 = x
+    st.stk s 4 = x
+    blt x 10 small
+.bbl big
+    st p 0 = 2:U32
+    st.stk s 4 = 3:U32
+    bra end
+.bbl small
+    st p 0 = 3:U32
+.bbl end
+    ld.stk y = s 0
+    pusharg y
+    ret
+""")
+        # the first "st p 0" is overwritten on both paths, "s 4" is never read
+        self.assertEqual(3, memopt.FunEliminateDeadStores(fun))
+        self.assertEqual([["poparg x", "poparg p", "st.stk s 0 x", "blt x 10 small"],
+                          ["st p 0 2:U32"],
+                          ["st p 0 3:U32"],
+                          ["ld.stk y s 0", "pusharg y", "ret"]], testing.RenderFun(fun))
+
+
+if __name__ == '__main__':
+    unittest.main()
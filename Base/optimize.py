@@ -1,13 +1,26 @@
 #!/usr/bin/python3
 
 import collections
+import csv
+import dataclasses
+import functools
+import io
+import json
 import sys
-from typing import List, Dict
+import time
+from typing import List, Dict, Tuple, Optional, Callable, Any, FrozenSet
 
 from Base import cfg
+from Base import gvn
+from Base import ifconv
 from Base import ir
+from Base import layout
+from Base import licm
 from Base import liveness
+from Base import parallel
 from Base import lowering
+from Base import mem2reg
+from Base import memopt
 from Base import opcode_tab as o
 from Base import reaching_defs
 from Base import reg_alloc
@@ -92,6 +105,98 @@ class RegPoolSimple(reg_alloc.RegPool):
         available.append(reg)
 
 
+@dataclasses.dataclass
+class PassStats:
+    calls: int = 0
+    secs: float = 0.0
+    # change in the number of instructions
+    ins_delta: int = 0
+    # sum of the integer results of the pass
+    changes: int = 0
+
+
+def FunInsCount(fun: ir.Fun) -> int:
+    return sum(len(bbl.inss) for bbl in fun.bbls)
+
+
+class PassManager:
+    """Runs fun level passes and records how much time and change they cause
+
+    A pass is any function taking the fun as its first argument, e.g.
+    lowering.FunStrengthReduction or the Phase* functions of the backends.
+    Integer results are interpreted as the number of changes made.
+    Passes are identified by name and the stats for all calls with the same
+    name are accumulated. Wall time is also accumulated per fun.
+    """
+
+    def __init__(self):
+        self.passes: Dict[str, PassStats] = {}
+        self.fun_secs: Dict[str, float] = collections.defaultdict(float)
+
+    def Run(self, name: str, pass_fun: Callable, fun: ir.Fun, *args, **kwargs) -> Any:
+        ins_before = FunInsCount(fun)
+        start = time.perf_counter()
+        result = pass_fun(fun, *args, **kwargs)
+        secs = time.perf_counter() - start
+        stats = self.passes.get(name)
+        if stats is None:
+            stats = self.passes[name] = PassStats()
+        stats.calls += 1
+        stats.secs += secs
+        stats.ins_delta += FunInsCount(fun) - ins_before
+        if isinstance(result, int):
+            stats.changes += result
+        self.fun_secs[fun.name] += secs
+        return result
+
+    def Merge(self, other: "PassManager"):
+        for name, o_stats in other.passes.items():
+            stats = self.passes.get(name)
+            if stats is None:
+                stats = self.passes[name] = PassStats()
+            stats.calls += o_stats.calls
+            stats.secs += o_stats.secs
+            stats.ins_delta += o_stats.ins_delta
+            stats.changes += o_stats.changes
+        for name, secs in other.fun_secs.items():
+            self.fun_secs[name] += secs
+
+    def RenderJson(self, opt_stats: Optional[Dict[str, int]] = None) -> str:
+        out = {
+            "passes": [dict(name=name, **dataclasses.asdict(stats))
+                       for name, stats in self.passes.items()],
+            "funs": [{"name": name, "secs": secs} for name, secs in self.fun_secs.items()],
+        }
+        if opt_stats is not None:
+            out["opt_stats"] = dict(opt_stats)
+        return json.dumps(out, indent=1)
+
+    def RenderCsv(self) -> str:
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="\n")
+        writer.writerow(["kind", "name", "calls", "secs", "ins_delta", "changes"])
+        for name, stats in self.passes.items():
+            writer.writerow(["pass", name, stats.calls, f"{stats.secs:.6f}",
+                             stats.ins_delta, stats.changes])
+        for name, secs in self.fun_secs.items():
+            writer.writerow(["fun", name, "", f"{secs:.6f}", "", ""])
+        return buf.getvalue()
+
+    def Save(self, path: str):
+        """The format is determined by the file extension: .csv or .json"""
+        with open(path, "w") as fout:
+            fout.write(self.RenderCsv() if path.endswith(".csv") else self.RenderJson())
+
+
+def _RunUntracked(_name: str, pass_fun: Callable, fun: ir.Fun, *args, **kwargs) -> Any:
+    return pass_fun(fun, *args, **kwargs)
+
+
+def PassRunner(pm: Optional[PassManager]) -> Callable:
+    """Returns pm.Run or an equivalent function with no tracking overhead"""
+    return _RunUntracked if pm is None else pm.Run
+
+
 def FunCfgInit(fun: ir.Fun, unit: ir.Unit):
     cfg.FunSplitBblsAtTerminators(fun)
     cfg.FunInitCFG(fun)
@@ -120,63 +225,121 @@ def UnitCfgExit(unit: ir.Unit):
 
 
 def FunOptBasic(fun: ir.Fun, opt_stats: Dict[str, int],
-                allow_conv_conversion: bool):
-    opt_stats["merge_move"] += reaching_defs.FunMergeMoveWithSrcDef(fun)
+                allow_conv_conversion: bool, pm: Optional[PassManager] = None):
+    run = PassRunner(pm)
+    opt_stats["merge_move"] += run("merge_move", reaching_defs.FunMergeMoveWithSrcDef, fun)
 
-    opt_stats["canonicalized"] += canonicalize.FunCanonicalize(fun)
-    opt_stats["strength_red"] += lowering.FunStrengthReduction(fun)
+    opt_stats["canonicalized"] += run("canonicalized", canonicalize.FunCanonicalize, fun)
+    opt_stats["strength_red"] += run("strength_red", lowering.FunStrengthReduction, fun)
 
-    opt_stats["empty_bbls"] = cfg.FunRemoveEmptyBbls(fun)
-    opt_stats["unreachable_bbls"] = cfg.FunRemoveUnreachableBbls(fun)
-    reaching_defs.FunComputeReachingDefs(fun)
-    reaching_defs.FunCheckReachingDefs(fun)
-    opt_stats["reg_prop"] = reaching_defs.FunPropagateRegs(fun)
-    opt_stats["const_prop"] += reaching_defs.FunPropagateConsts(fun)
+    opt_stats["empty_bbls"] += run("empty_bbls", cfg.FunRemoveEmptyBbls, fun)
+    opt_stats["unreachable_bbls"] += run("unreachable_bbls", cfg.FunRemoveUnreachableBbls, fun)
+    run("reaching_defs", reaching_defs.FunEnsureReachingDefs, fun)
+    run("check_reaching_defs", reaching_defs.FunCheckReachingDefs, fun)
+    opt_stats["reg_prop"] += run("reg_prop", reaching_defs.FunPropagateRegs, fun)
+    opt_stats["const_prop"] += run("const_prop", reaching_defs.FunPropagateConsts, fun)
 
-    opt_stats["const_fold"] += reaching_defs.FunConstantFold(
-        fun, allow_conv_conversion)
+    opt_stats["const_fold"] += run("const_fold", reaching_defs.FunConstantFold,
+                                   fun, allow_conv_conversion)
 
-    opt_stats["canonicalized"] += canonicalize.FunCanonicalize(fun)
-    opt_stats["strength_red"] += lowering.FunStrengthReduction(fun)
+    opt_stats["canonicalized"] += run("canonicalized", canonicalize.FunCanonicalize, fun)
+    opt_stats["strength_red"] += run("strength_red", lowering.FunStrengthReduction, fun)
 
-    opt_stats["ls_st_simplify"] += reaching_defs.FunLoadStoreSimplify(fun)
+    opt_stats["ls_st_simplify"] += run("ls_st_simplify", reaching_defs.FunLoadStoreSimplify, fun)
 
-    opt_stats["move_elim"] += lowering.FunMoveElimination(fun)
+    opt_stats["move_elim"] += run("move_elim", lowering.FunMoveElimination, fun)
 
-    liveness.FunComputeLivenessInfo(fun)
+    run("liveness", liveness.FunEnsureLivenessInfo, fun)
 
-    opt_stats["useless"] = liveness.FunRemoveUselessInstructions(fun)
+    opt_stats["useless"] += run("useless", liveness.FunRemoveUselessInstructions, fun)
+    run("reg_stats", reg_stats.FunComputeRegStatsExceptLAC, fun)
+    run("reg_stats_lac", reg_stats.FunComputeRegStatsLAC, fun)
+
+    opt_stats["dropped_regs"] += run("dropped_regs", reg_stats.FunDropUnreferencedRegs, fun)
+    opt_stats["separated_regs"] += run("separated_regs", reg_stats.FunSeparateLocalRegUsage, fun)
+
+
+# opt_stats, report and (optional) pass stats for a single fun
+_FunOptResult = Tuple[Dict[str, int], str, Optional[PassManager]]
+
+
+def _FunOptBasicWithRegStats(fun: ir.Fun, _unit: ir.Unit, dump_reg_stats,
+                             track_passes) -> _FunOptResult:
+    opt_stats: Dict[str, int] = collections.defaultdict(int)
+    pm = PassManager() if track_passes else None
+    FunOptBasic(fun, opt_stats, allow_conv_conversion=True, pm=pm)
+    if not dump_reg_stats:
+        return opt_stats, "", pm
     reg_stats.FunComputeRegStatsExceptLAC(fun)
+    liveness.FunEnsureLivenessInfo(fun)
     reg_stats.FunComputeRegStatsLAC(fun)
-
-    opt_stats["dropped_regs"] += reg_stats.FunDropUnreferencedRegs(fun)
-    opt_stats["separated_regs"] += reg_stats.FunSeparateLocalRegUsage(fun)
+    rs = reg_stats.FunCalculateRegStats(fun)
+    return opt_stats, f"# {fun.name:30} RegStats: {rs}", pm
 
 
-def UnitOptBasic(unit: ir.Unit, dump_reg_stats) -> Dict[str, int]:
+def _UnitOptFuns(unit: ir.Unit, fun_action, num_workers: int,
+                 pm: Optional[PassManager]) -> Dict[str, int]:
     cfg.UnitRemoveUnreachableCode(unit, [unit.fun_syms["main"]])
     opt_stats: Dict[str, int] = collections.defaultdict(int)
-    for fun in unit.funs:
-        if fun.kind is not o.FUN_KIND.NORMAL:
-            continue
-        FunOptBasic(fun, opt_stats, allow_conv_conversion=True)
-        if dump_reg_stats:
-            reg_stats.FunComputeRegStatsExceptLAC(fun)
-            liveness.FunComputeLivenessInfo(fun)
-            reg_stats.FunComputeRegStatsLAC(fun)
-            rs = reg_stats.FunCalculateRegStats(fun)
-            print(f"# {fun.name:30} RegStats: {rs}")
+    funs = [fun for fun in unit.funs if fun.kind is o.FUN_KIND.NORMAL]
+    action = functools.partial(fun_action, track_passes=pm is not None)
+    for fun_stats, report, fun_pm in parallel.UnitMapFuns(unit, funs, action, num_workers):
+        for key, val in fun_stats.items():
+            opt_stats[key] += val
+        if fun_pm:
+            pm.Merge(fun_pm)
+        if report:
+            print(report)
     return opt_stats
 
 
-def FunOpt(fun: ir.Fun, opt_stats: Dict[str, int]):
-    FunOptBasic(fun, opt_stats, allow_conv_conversion=True)
-    lowering.FunRegWidthWidening(fun, o.DK.U8, o.DK.U32)
-    lowering.FunRegWidthWidening(fun, o.DK.S8, o.DK.S32)
-    lowering.FunRegWidthWidening(fun, o.DK.U16, o.DK.U32)
-    lowering.FunRegWidthWidening(fun, o.DK.S16, o.DK.S32)
+def UnitOptBasic(unit: ir.Unit, dump_reg_stats, num_workers=1,
+                 pm: Optional[PassManager] = None) -> Dict[str, int]:
+    """num_workers > 1 optimizes the funs in parallel (see parallel.UnitMapFuns)
 
-    FunOptBasic(fun, opt_stats, allow_conv_conversion=False)
+    If pm is provided it accumulates the pass stats of all funs.
+    """
+    return _UnitOptFuns(unit, functools.partial(
+        _FunOptBasicWithRegStats, dump_reg_stats=dump_reg_stats), num_workers, pm)
+
+
+# optional passes for FunOpt. These are not part of the C++ implementation
+# so they are not run by default.
+EXTRA_PASSES = ("mem2reg", "div_by_const", "gvn", "mem_opt", "licm", "if_conv", "layout")
+
+
+def FunOpt(fun: ir.Fun, opt_stats: Dict[str, int], pm: Optional[PassManager] = None,
+           extra_passes: FrozenSet[str] = frozenset(),
+           edge_profile: Optional[layout.EdgeProfile] = None):
+    """extra_passes is a subset of EXTRA_PASSES
+
+    edge_profile is only used by the layout pass.
+    """
+    run = PassRunner(pm)
+    if "mem2reg" in extra_passes:
+        opt_stats["mem2reg"] += run("mem2reg", mem2reg.FunPromoteStkFields, fun)
+    FunOptBasic(fun, opt_stats, allow_conv_conversion=True, pm=pm)
+    run("widening", lowering.FunRegWidthWidening, fun, o.DK.U8, o.DK.U32)
+    run("widening", lowering.FunRegWidthWidening, fun, o.DK.S8, o.DK.S32)
+    run("widening", lowering.FunRegWidthWidening, fun, o.DK.U16, o.DK.U32)
+    run("widening", lowering.FunRegWidthWidening, fun, o.DK.S16, o.DK.S32)
+    # requires a target with 64 bit regs, the A32 backend rejects the result
+    if "div_by_const" in extra_passes:
+        opt_stats["div_by_const"] += run("div_by_const", lowering.FunDivByConstToMul, fun)
+    if "gvn" in extra_passes:
+        opt_stats["gvn"] += run("gvn", gvn.FunGlobalValueNumbering, fun)
+    if "mem_opt" in extra_passes:
+        opt_stats["mem_opt"] += run("mem_opt", memopt.FunMemOpt, fun)
+    if "licm" in extra_passes:
+        opt_stats["licm"] += run("licm", licm.FunLoopInvariantCodeMotion, fun)
+    if "if_conv" in extra_passes:
+        opt_stats["if_conv"] += run("if_conv", ifconv.FunIfConversion, fun)
+
+    FunOptBasic(fun, opt_stats, allow_conv_conversion=False, pm=pm)
+    # must be last as it only affects the placement of the bbls
+    if "layout" in extra_passes:
+        edges = None if edge_profile is None else edge_profile.get(fun.name, {})
+        opt_stats["layout"] += run("layout", layout.FunLayoutBbls, fun, edges)
 
     # non_scratch = set()
     # for reg in fun.regs:
@@ -186,54 +349,86 @@ def FunOpt(fun: ir.Fun, opt_stats: Dict[str, int]):
     # liveness.FunSpillRegs(fun, non_scratch, unit)
 
 
-def UnitOpt(unit: ir.Unit, dump_reg_stats) -> Dict[str, int]:
-    cfg.UnitRemoveUnreachableCode(unit, [unit.fun_syms["main"]])
+def _FunOptWithRegStats(fun: ir.Fun, _unit: ir.Unit, dump_reg_stats, extra_passes,
+                        edge_profile, track_passes) -> _FunOptResult:
     opt_stats: Dict[str, int] = collections.defaultdict(int)
-    for fun in unit.funs:
-        if fun.kind is not o.FUN_KIND.NORMAL:
-            continue
-        FunOpt(fun, opt_stats)
-        if dump_reg_stats:
-            local_stats = reg_stats.FunComputeBblRegUsageStats(
-                fun, REG_KIND_MAP_TYPICAL)
-            loc_lac = sum(
-                count for (kind, lac), count in local_stats.items() if lac)
-            loc_not_lac = sum(
-                count for (kind, lac), count in local_stats.items() if not lac)
-
-            # computes max number of
-            reg_stats.FunComputeRegStatsExceptLAC(fun)
-            reg_stats.FunComputeRegStatsLAC(fun)
-            rs = reg_stats.FunCalculateRegStats(fun)
-            print(
-                f"# {fun.name:30} RegStats: {rs}  {loc_lac:2}/{loc_not_lac:2}")
-    return opt_stats
+    pm = PassManager() if track_passes else None
+    FunOpt(fun, opt_stats, pm, extra_passes, edge_profile)
+    if not dump_reg_stats:
+        return opt_stats, "", pm
+    local_stats = reg_stats.FunComputeBblRegUsageStats(
+        fun, REG_KIND_MAP_TYPICAL)
+    loc_lac = sum(
+        count for (kind, lac), count in local_stats.items() if lac)
+    loc_not_lac = sum(
+        count for (kind, lac), count in local_stats.items() if not lac)
+
+    # computes max number of
+    reg_stats.FunComputeRegStatsExceptLAC(fun)
+    reg_stats.FunComputeRegStatsLAC(fun)
+    rs = reg_stats.FunCalculateRegStats(fun)
+    return opt_stats, f"# {fun.name:30} RegStats: {rs}  {loc_lac:2}/{loc_not_lac:2}", pm
+
+
+def UnitOpt(unit: ir.Unit, dump_reg_stats, num_workers=1,
+            pm: Optional[PassManager] = None,
+            extra_passes: FrozenSet[str] = frozenset(),
+            edge_profile: Optional[layout.EdgeProfile] = None) -> Dict[str, int]:
+    """num_workers > 1 optimizes the funs in parallel (see parallel.UnitMapFuns)
+
+    If pm is provided it accumulates the pass stats of all funs.
+    """
+    return _UnitOptFuns(unit, functools.partial(
+        _FunOptWithRegStats, dump_reg_stats=dump_reg_stats,
+        extra_passes=extra_passes, edge_profile=edge_profile), num_workers, pm)
 
 
 def main(argv):
     mode = "optimize"
     if argv:
         mode = argv.pop(0)
+    # optional number of worker processes for the optimization modes
+    num_workers = int(argv.pop(0)) if argv else 1
+    # optional comma separated list of EXTRA_PASSES, e.g. "licm"
+    extra_passes = frozenset(argv.pop(0).split(",")) if argv else frozenset()
+    assert extra_passes <= set(EXTRA_PASSES), f"unknown passes: {extra_passes}"
+    # optional edge profile for the layout pass (see layout.ReadEdgeProfile)
+    edge_profile = None
+    if argv:
+        with open(argv.pop(0)) as fin:
+            edge_profile = layout.ReadEdgeProfile(fin)
 
     unit = serialize.UnitParseFromAsm(sys.stdin)
     if mode == "optimize":
         UnitCfgInit(unit)
-        unit_stats = UnitOpt(unit, True)
+        unit_stats = UnitOpt(unit, True, num_workers, extra_passes=extra_passes,
+                             edge_profile=edge_profile)
         UnitCfgExit(unit)
         print("\n".join(serialize.UnitRenderToASM(unit)))
     elif mode == "optlite":
         UnitCfgInit(unit)
-        unit_stats = UnitOptBasic(unit, True)
+        unit_stats = UnitOptBasic(unit, True, num_workers)
         UnitCfgExit(unit)
         print("\n".join(serialize.UnitRenderToASM(unit)))
     elif mode == "optimize_stats":
         UnitCfgInit(unit)
-        unit_stats = UnitOpt(unit, True)
+        unit_stats = UnitOpt(unit, True, num_workers, extra_passes=extra_passes,
+                             edge_profile=edge_profile)
         UnitCfgExit(unit)
         print("\n".join(serialize.UnitRenderToASM(unit)))
         print(f"# STATS:")
         for key, val in unit_stats.items():
             print(f"#  {key}: {val}")
+    elif mode in ("optimize_stats_json", "optimize_stats_csv"):
+        # only the stats are printed
+        pm = PassManager()
+        UnitCfgInit(unit)
+        unit_stats = UnitOpt(unit, False, num_workers, pm, extra_passes, edge_profile)
+        UnitCfgExit(unit)
+        if mode == "optimize_stats_json":
+            print(pm.RenderJson(unit_stats))
+        else:
+            print(pm.RenderCsv(), end="")
     elif mode == "serialize":
         print("\n".join(serialize.UnitRenderToASM(unit)))
     elif mode == "cfg":
@@ -0,0 +1,119 @@
+"""Runs function level passes on a process pool
+
+The workers are forked so they start out with a copy of the unit and only
+the results have to be shipped back (see serialize.FunWriteBinary).
+
+Passes run this way must only modify the fun they are given. The one unit wide
+side effect which is supported is the creation of const mems via
+Unit.FindOrAddConstMem. Results are merged back in the order of the funs so
+the outcome is identical to processing the funs one after another.
+"""
+
+import concurrent.futures
+import multiprocessing
+import sys
+from typing import List, Dict, Callable, Any, Iterator, Optional, Tuple
+
+from Base import ir
+from Base import serialize
+
+# picklable description of the const mems requested by a fun:
+# (name, alignment, kind, [(count, data)])
+ConstMems = List[Tuple]
+
+# state shared with the (forked) workers
+_UNIT: ir.Unit = None
+_ACTION: Callable[[ir.Fun, ir.Unit], Any] = None
+_COPY_BACK = True
+
+
+def CanRunInParallel() -> bool:
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _RunActionLoggingConstMems(fun: ir.Fun, unit: ir.Unit, action) -> Tuple[Any, ConstMems]:
+    unit.const_mem_log = []
+    try:
+        result = action(fun, unit)
+        mems = unit.const_mem_log
+    finally:
+        unit.const_mem_log = None
+    const_mems = []
+    for mem in mems:
+        assert all(isinstance(d, ir.DataBytes) for d in mem.datas), f"bad const mem {mem.name}"
+        const_mems.append((mem.name, mem.alignment, mem.kind,
+                           [(d.count, d.data) for d in mem.datas]))
+    return result, const_mems
+
+
+def _RunAction(fun_no: int) -> Tuple[Optional[bytes], Any, ConstMems]:
+    fun = _UNIT.funs[fun_no]
+    result, const_mems = _RunActionLoggingConstMems(fun, _UNIT, _ACTION)
+    data = serialize.FunWriteBinary(fun) if _COPY_BACK else None
+    return data, result, const_mems
+
+
+def MergeConstMems(unit: ir.Unit, const_mems: ConstMems):
+    """Adds the const mems which are not yet part of unit"""
+    for name, alignment, kind, datas in const_mems:
+        if name in unit.mem_syms:
+            continue
+        mem = unit.AddMem(ir.Mem(name, alignment, kind))
+        for count, data in datas:
+            mem.AddData(ir.DataBytes(count, data))
+
+
+def UnitMapFunsWithConstMems(unit: ir.Unit, funs: List[ir.Fun],
+                             action: Callable[[ir.Fun, ir.Unit], Any],
+                             num_workers: int,
+                             cpu_regs: Dict[str, ir.CpuReg] = {},
+                             copy_back=True) -> Iterator[Tuple[Any, ConstMems]]:
+    """Like UnitMapFuns but also yields the const mems requested by each fun
+
+    Const mems created in a worker process are only added to unit if they are
+    needed for copy_back. Otherwise use MergeConstMems().
+    """
+    global _UNIT, _ACTION, _COPY_BACK
+    if num_workers <= 1 or len(funs) <= 1 or not CanRunInParallel():
+        for fun in funs:
+            yield _RunActionLoggingConstMems(fun, unit, action)
+        return
+
+    assert _UNIT is None, "UnitMapFuns cannot be nested"
+    fun_nos: Dict[ir.Fun, int] = {fun: n for n, fun in enumerate(unit.funs)}
+    _UNIT, _ACTION, _COPY_BACK = unit, action, copy_back
+    # otherwise buffered output would also be flushed by the workers
+    sys.stdout.flush()
+    sys.stderr.flush()
+    try:
+        chunk_size = max(1, len(funs) // (num_workers * 8))
+        with concurrent.futures.ProcessPoolExecutor(
+                num_workers, mp_context=multiprocessing.get_context("fork")) as pool:
+            results = pool.map(_RunAction, [fun_nos[fun] for fun in funs],
+                               chunksize=chunk_size)
+            for fun, (data, result, const_mems) in zip(funs, results):
+                if copy_back:
+                    MergeConstMems(unit, const_mems)
+                    serialize.FunReadBinary(data, unit, fun, cpu_regs)
+                yield result, const_mems
+    finally:
+        _UNIT, _ACTION, _COPY_BACK = None, None, True
+
+
+def UnitMapFuns(unit: ir.Unit, funs: List[ir.Fun],
+                action: Callable[[ir.Fun, ir.Unit], Any],
+                num_workers: int,
+                cpu_regs: Dict[str, ir.CpuReg] = {},
+                copy_back=True) -> Iterator[Any]:
+    """Runs action(fun, unit) for all funs and yields the results in order
+
+    With num_workers > 1 the funs are processed by a pool of worker processes
+    and the modified funs are copied back into unit unless copy_back is False.
+    Without copy_back only the results of the action are of interest and the
+    funs in unit must not be used afterwards. The results must be picklable.
+    cpu_regs is needed if the funs reference cpu regs.
+    """
+    for result, const_mems in UnitMapFunsWithConstMems(
+            unit, funs, action, num_workers, cpu_regs, copy_back):
+        MergeConstMems(unit, const_mems)
+        yield result
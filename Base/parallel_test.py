@@ -0,0 +1,94 @@
+#!/usr/bin/python3
+
+import io
+import unittest
+
+from Base import ir
+from Base import liveness
+from Base import opcode_tab as o
+from Base import optimize
+from Base import parallel
+from Base import serialize
+
+_CODE = r"""
+.mem COUNTER 4 RW
+    .data 4 [0]
+
+.fun a NORMAL [] = []
+.reg A64 [x]
+.bbl start
+    ret
+
+.fun b NORMAL [] = [U32]
+.reg A64 [x]
+.reg U32 [y]
+.bbl start
+    poparg y
+    bsr a
+    ret
+
+.fun c NORMAL [] = []
+.reg A64 [x]
+.bbl start
+    lea.mem x COUNTER 0
+    ret
+"""
+
+# the values are chosen so that funs share const mems
+_CONSTS = {"a": [1, 2], "b": [2, 3], "c": [4, 1]}
+
+
+def _AddConstMems(fun: ir.Fun, unit: ir.Unit):
+    inss = fun.bbls[0].inss
+    for n in _CONSTS[fun.name]:
+        mem = unit.FindOrAddConstMem(ir.Const(o.DK.U32, n))
+        inss.insert(0, ir.Ins(o.LEA_MEM, [fun.reg_syms["x"], mem, ir.Const(o.DK.U32, 0)]))
+    return fun.name, len(inss)
+
+
+def _Process(num_workers: int):
+    unit = serialize.UnitParseFromAsm(io.StringIO(_CODE))
+    optimize.UnitCfgInit(unit)
+    results = list(parallel.UnitMapFuns(unit, unit.funs, _AddConstMems, num_workers))
+    return unit, results
+
+
+class TestParallel(unittest.TestCase):
+
+    def testSameAsSequential(self):
+        unit1, results1 = _Process(1)
+        unit2, results2 = _Process(3)
+        self.assertEqual([("a", 3), ("b", 5), ("c", 4)], results1)
+        self.assertEqual(results1, results2)
+        self.assertEqual(["COUNTER", "$const_U32_01_00_00_00", "$const_U32_02_00_00_00",
+                          "$const_U32_03_00_00_00", "$const_U32_04_00_00_00"],
+                         [mem.name for mem in unit2.mems])
+        self.assertEqual(serialize.UnitRenderToASM(unit1), serialize.UnitRenderToASM(unit2))
+
+    def testFunsAreUpdatedInPlace(self):
+        unit, _ = _Process(2)
+        a = unit.GetFun("a")
+        b = unit.GetFun("b")
+        # the call in b must refer to the fun object owned by unit
+        self.assertIs(a, b.bbls[0].inss[-2].operands[0])
+        self.assertIs(unit.mem_syms["$const_U32_03_00_00_00"],
+                      b.bbls[0].inss[0].operands[1])
+        self.assertEqual(4, len(unit.GetFun("c").bbls[0].inss))
+
+
+class TestFunBinary(unittest.TestCase):
+
+    def testRoundTripWithState(self):
+        unit = serialize.UnitParseFromAsm(io.StringIO(_CODE))
+        optimize.UnitCfgInit(unit)
+        b = unit.GetFun("b")
+        liveness.FunComputeLivenessInfo(b)
+        expected = serialize.FunRenderToAsm(b)
+        serialize.FunReadBinary(serialize.FunWriteBinary(b), unit, b)
+        self.assertEqual(expected, serialize.FunRenderToAsm(b))
+        self.assertIs(b.reg_syms["y"], b.bbls[0].inss[0].operands[0])
+        self.assertIn(ir.FUN_FLAG.LIVENESS_VALID, b.flags)
+
+
+if __name__ == '__main__':
+    unittest.main()
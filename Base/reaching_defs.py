@@ -1,10 +1,13 @@
 """This file contains code for reaching definitions analysis
 and optimization depending on it, e.g. constant propagation, etc."""
 
+import collections
 import dataclasses
+import functools
 from typing import Dict, Tuple, Any, Optional, List, Set
 
 from Base import ir
+from Base import liveness
 from Base import opcode_tab as o
 from Base import serialize
 from Base import eval
@@ -109,12 +112,11 @@ def _BblPropagateDefs(bbl: ir.Bbl, defs_in: ir.REG_DEF_MAP):
                 ins.operand_defs[n] = defs_in[reg]
 
 
-def FunComputeReachingDefs(fun: ir.Fun):
-    """
-    Poor man's SSA we compute reaching defs at the Bbl beginning and
-    for each operand use.
+def FunComputeReachingDefsWithMaps(fun: ir.Fun):
+    """Reference implementation of FunComputeReachingDefs
 
-    This should be run after unreachable code has been removed.
+    Keeps a REG_DEF_MAP per bbl. This is quadratic for large funs and only
+    used for testing and benchmarking.
     """
     # Step 1: Initialization
     all_defs: Dict[str, ReachingDefs] = {}
@@ -146,6 +148,273 @@ def FunComputeReachingDefs(fun: ir.Fun):
             bbl_str = '\n'.join(serialize.BblRenderToAsm(bbl))
             assert False, f"found unreachable bbl in fun {fun.name}:\n{bbl_str}"
         _BblPropagateDefs(bbl, all_defs[bbl.name].defs_in.copy())
+    fun.flags |= ir.FUN_FLAG.REACHING_DEFS_VALID
+
+
+def _SetBitRange(buf: bytearray, start: int, end: int):
+    """Sets bits [start, end) in the little endian bitset buf"""
+    while start < end and start & 7:
+        buf[start >> 3] |= 1 << (start & 7)
+        start += 1
+    while start < end and end & 7:
+        end -= 1
+        buf[end >> 3] |= 1 << (end & 7)
+    if start < end:
+        buf[start >> 3:end >> 3] = b"\xff" * ((end - start) >> 3)
+
+
+class _DefsIn(dict):
+    """bbl.defs_in which is filled in lazily from the def bitsets
+
+    Clients wanting to shadow entries should use a collections.ChainMap.
+    """
+
+    def __init__(self, lookup):
+        super().__init__()
+        self._lookup = lookup
+
+    def __missing__(self, reg: ir.Reg):
+        val = self._lookup(reg)
+        if val is None:
+            raise KeyError(reg)
+        self[reg] = val
+        return val
+
+    def __contains__(self, reg) -> bool:
+        return super().__contains__(reg) or self._lookup(reg) is not None
+
+    def get(self, reg, default=None):
+        try:
+            return self[reg]
+        except KeyError:
+            return default
+
+
+class _DefBits:
+    """Def numbered reaching definitions for a fun
+
+    Every def of a reg is assigned an id and the ids for the same reg are
+    contiguous, so the defs of a reg form the bit range
+    [start[reg.no], start[reg.no] + count[reg.no]).
+    Regs that are used before being defined in some bbl get an extra
+    pseudo def (the first id of the range) which represents the value flowing
+    into the fun. Its location is the first bbl.
+
+    Reaching defs are computed as bitsets over def ids. Where more than one
+    def of a reg reaches a bbl, the merge point (a Bbl) is determined
+    lazily and only for the regs where it is actually needed.
+    """
+
+    def __init__(self, fun: ir.Fun):
+        liveness.FunNumberReg(fun)
+        bbls = fun.bbls
+        self.bbls = bbls
+        self.reg_map = fun.reg_map
+        num_regs = len(fun.reg_map)
+        bbl_pos: Dict[str, int] = {bbl.name: n for n, bbl in enumerate(bbls)}
+        self.preds: List[List[int]] = [[bbl_pos[p.name] for p in bbl.edge_in]
+                                       for bbl in bbls]
+        # Step 1: collect all defs and the regs used before being defined
+        reg_defs: List[List[ir.Ins]] = [[] for _ in range(num_regs)]
+        has_pseudo = bytearray(num_regs)
+        self.has_pseudo = has_pseudo
+        # per bbl: reg no -> last def in bbl (index into reg_defs, later def id)
+        self.last_def: List[Dict[int, int]] = []
+        for bbl in bbls:
+            last: Dict[int, int] = {}
+            for ins in bbl.inss:
+                ops = ins.operands
+                num_defs = ins.opcode.def_ops_count()
+                for n in range(num_defs, len(ops)):
+                    reg = ops[n]
+                    if isinstance(reg, ir.Reg) and reg.no not in last:
+                        has_pseudo[reg.no] = 1
+                for n in range(num_defs):
+                    defs = reg_defs[ops[n].no]
+                    last[ops[n].no] = len(defs)
+                    defs.append(ins)
+            self.last_def.append(last)
+
+        # Step 2: assign def ids
+        start = [0] * num_regs
+        count = [0] * num_regs
+        self.start = start
+        self.count = count
+        # def id -> Ins or first bbl for pseudo defs
+        values: List[Any] = []
+        self.values = values
+        first = bbls[0]
+        for no in range(1, num_regs):
+            start[no] = len(values)
+            if has_pseudo[no]:
+                values.append(first)
+            values += reg_defs[no]
+            count[no] = len(values) - start[no]
+        num_bytes = (len(values) + 7) // 8
+
+        # Step 3: gen and kill sets
+        gen: List[int] = []
+        keep: List[int] = []
+        for last in self.last_def:
+            gen_buf = bytearray(num_bytes)
+            kill_buf = bytearray(num_bytes)
+            for no, pos in last.items():
+                def_id = start[no] + has_pseudo[no] + pos
+                last[no] = def_id
+                gen_buf[def_id >> 3] |= 1 << (def_id & 7)
+                _SetBitRange(kill_buf, start[no], start[no] + count[no])
+            gen.append(int.from_bytes(gen_buf, "little"))
+            keep.append(~int.from_bytes(kill_buf, "little"))
+
+        # Step 4: Fixpoint computation - we look at the first bbl first
+        pseudo_buf = bytearray(num_bytes)
+        for no in range(1, num_regs):
+            if has_pseudo[no]:
+                pseudo_buf[start[no] >> 3] |= 1 << (start[no] & 7)
+        succs = [[bbl_pos[s.name] for s in bbl.edge_out] for bbl in bbls]
+        bits_in = [0] * len(bbls)
+        bits_in[0] = int.from_bytes(pseudo_buf, "little")
+        bits_out = [0] * len(bbls)
+        active = list(reversed(range(len(bbls))))
+        is_active = [True] * len(bbls)
+        while active:
+            n = active.pop(-1)
+            is_active[n] = False
+            out = gen[n] | (bits_in[n] & keep[n])
+            if out == bits_out[n]:
+                continue
+            bits_out[n] = out
+            for succ in succs[n]:
+                new_in = bits_in[succ] | out
+                if new_in != bits_in[succ]:
+                    bits_in[succ] = new_in
+                    if not is_active[succ]:
+                        is_active[succ] = True
+                        active.append(succ)
+        # bytes are cheaper to slice than (shifting) large ints
+        self.bytes_in: List[bytes] = [b.to_bytes(num_bytes, "little")
+                                      for b in bits_in]
+        # reg no -> (bbl pos -> merge point) for bbls reached by multiple defs
+        self.merges: Dict[int, Dict[int, Any]] = {}
+
+    def _RegIdsIn(self, n: int, no: int) -> int:
+        """Returns the def ids of reg no reaching bbl n relative to start[no]"""
+        count = self.count[no]
+        if count == 0:
+            return 0
+        start = self.start[no]
+        buf = self.bytes_in[n]
+        if count == 1:
+            return (buf[start >> 3] >> (start & 7)) & 1
+        bits = int.from_bytes(buf[start >> 3: (start + count + 7) >> 3], "little")
+        return (bits >> (start & 7)) & ((1 << count) - 1)
+
+    def _RegMerges(self, no: int) -> Dict[int, Any]:
+        merges = self.merges.get(no)
+        if merges is not None:
+            return merges
+        merges = {}
+        for n in range(len(self.bbls)):
+            ids = self._RegIdsIn(n, no)
+            if ids & (ids - 1):
+                merges[n] = None
+        self.merges[no] = merges
+
+        def value_out(p: int):
+            def_id = self.last_def[p].get(no)
+            if def_id is not None:
+                return self.values[def_id]
+            if p in merges:
+                return merges[p]
+            return self.ValueIn(p, no)
+
+        # A bbl reached by multiple defs is its own merge point unless all
+        # preds forward the same value. Once a bbl is a merge point it stays one.
+        change = True
+        while change:
+            change = False
+            for n, old in merges.items():
+                bbl = self.bbls[n]
+                if old is bbl:
+                    continue
+                new = bbl if n == 0 and self.has_pseudo[no] else None
+                for p in self.preds[n]:
+                    val = value_out(p)
+                    if val is None or val is new:
+                        continue
+                    if new is None:
+                        new = val
+                    else:
+                        new = bbl
+                        break
+                if new is not old:
+                    merges[n] = new
+                    change = True
+        return merges
+
+    def ValueIn(self, n: int, no: int):
+        """Returns the def (an Ins or a Bbl) of reg no at the beginning of bbl n
+
+        None indicates that the reg is not defined
+        """
+        ids = self._RegIdsIn(n, no)
+        if ids == 0:
+            return None
+        if ids & (ids - 1) == 0:
+            return self.values[self.start[no] + ids.bit_length() - 1]
+        return self._RegMerges(no)[n]
+
+    def Lookup(self, n: int, reg: ir.Reg):
+        no = reg.no
+        # regs created after the analysis have not been numbered
+        if no >= len(self.reg_map) or self.reg_map[no] is not reg:
+            return None
+        return self.ValueIn(n, no)
+
+    def BblPropagateDefs(self, n: int):
+        bbl = self.bbls[n]
+        defs: Dict[int, ir.Ins] = {}
+        for ins in bbl.inss:
+            ops = ins.operands
+            operand_defs = ins.operand_defs
+            num_defs = ins.opcode.def_ops_count()
+            for i in range(num_defs, len(ops)):
+                reg = ops[i]
+                if not isinstance(reg, ir.Reg):
+                    operand_defs[i] = ir.INS_INVALID
+                    continue
+                ins_def = defs.get(reg.no)
+                operand_defs[i] = ins_def if ins_def is not None else self.ValueIn(n, reg.no)
+            for i in range(num_defs):
+                defs[ops[i].no] = ins
+                operand_defs[i] = ir.INS_INVALID
+        bbl.defs_in = _DefsIn(functools.partial(self.Lookup, n))
+
+
+def FunComputeReachingDefs(fun: ir.Fun):
+    """
+    Poor man's SSA we compute reaching defs at the Bbl beginning and
+    for each operand use.
+
+    Unlike FunComputeReachingDefsWithMaps this uses def numbered bitsets
+    and bbl.defs_in is only materialized for the regs that are looked up.
+
+    This should be run after unreachable code has been removed.
+    """
+    for bbl in fun.bbls:
+        if bbl != fun.bbls[0] and not bbl.edge_in:
+            bbl_str = '\n'.join(serialize.BblRenderToAsm(bbl))
+            assert False, f"found unreachable bbl in fun {fun.name}:\n{bbl_str}"
+    def_bits = _DefBits(fun)
+    for n in range(len(fun.bbls)):
+        def_bits.BblPropagateDefs(n)
+    fun.flags |= ir.FUN_FLAG.REACHING_DEFS_VALID
+
+
+def FunEnsureReachingDefs(fun: ir.Fun):
+    """Like FunComputeReachingDefs but reuses the reaching defs if they are still valid"""
+    if ir.FUN_FLAG.REACHING_DEFS_VALID not in fun.flags:
+        FunComputeReachingDefs(fun)
 
 
 def FunCheckReachingDefs(fun: ir.Fun):
@@ -184,7 +453,7 @@ def FunPropagateConsts(fun: ir.Fun) -> int:
 
 
 def _InsConstantFold(
-        ins: ir.Ins, bbl: ir.Bbl, _fun: ir.Fun,
+        ins: ir.Ins, bbl: ir.Bbl, fun: ir.Fun,
         allow_conv_conversion: bool) -> Optional[List[ir.Ins]]:
     """
     Try combining the constant from ins_def with the instruction in ins
@@ -209,6 +478,7 @@ def _InsConstantFold(
         else:
             succ_to_drop = target
         bbl.DelEdgeOut(succ_to_drop)
+        fun.InvalidateCfgAnalyses()
         return []
     elif kind is o.OPC_KIND.CMP:
         if not isinstance(ops[3], ir.Const) or not isinstance(ops[4], ir.Const):
@@ -357,7 +627,7 @@ def _BblLoadStoreSimplify(bbl: ir.Bbl, _fun: ir.Fun) -> int:
 
     Requires reaching definitions both per bbl and per ins
     """
-    defs: ir.REG_DEF_MAP = bbl.defs_in.copy()
+    defs: ir.REG_DEF_MAP = collections.ChainMap({}, bbl.defs_in)
     count = 0
     for ins in bbl.inss:
         if ins.opcode in {o.ST, o.LD, o.LEA}:
@@ -390,7 +660,7 @@ def _BblPropagateRegOperands(bbl: ir.Bbl, _fun: ir.Fun) -> int:
 
     Requires reaching definitions both per bbl and per ins
     """
-    defs: ir.REG_DEF_MAP = bbl.defs_in.copy()
+    defs: ir.REG_DEF_MAP = collections.ChainMap({}, bbl.defs_in)
     count = 0
     for ins in bbl.inss:
         for n, mov in enumerate(ins.operand_defs):
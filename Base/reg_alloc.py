@@ -1,6 +1,7 @@
 """This file contains code for Register Allocation/Assignment """
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 
+from Base import cfg
 from Base import ir
 from Base import liveness
 from Base import opcode_tab as o
@@ -124,6 +125,8 @@ def _SpillEarlierLiveRange(reg: ir.Reg, pos: int, i: int, live_ranges: List[Live
                            pool: RegPool, do_not_spill: List[LiveRange], debug) -> int:
 
     kind_wanted = pool.get_cpu_reg_family(reg.kind)
+    # LiveRanges ending before the current position have given back their reg already
+    current_pos = live_ranges[i + 1].def_pos
     for i in range(i, -1, -1):  # count down to zero!
         lr = live_ranges[i]
         if (lr in do_not_spill or
@@ -132,6 +135,8 @@ def _SpillEarlierLiveRange(reg: ir.Reg, pos: int, i: int, live_ranges: List[Live
                 PRE_ALLOC in lr.flags or
                 lr.cpu_reg is ir.CPU_REG_SPILL or
                 lr.last_use_pos <= pos or
+                lr.last_use_pos < current_pos or
+                lr.last_use_pos is liveness.NO_USE or
                 pool.get_cpu_reg_family(lr.reg.kind) != kind_wanted):
             continue
         if debug:
@@ -143,6 +148,64 @@ def _SpillEarlierLiveRange(reg: ir.Reg, pos: int, i: int, live_ranges: List[Live
     assert False, f"failed to free up reg for {reg}"
 
 
+class _ScanAllSpillCandidates:
+    """Finds spill candidates by scanning all earlier LiveRanges
+
+    The cost of a spill grows with the number of LiveRanges in the Bbl, see _ActiveSet.
+    """
+
+    def __init__(self, live_ranges: List[LiveRange], pool: RegPool):
+        self.live_ranges = live_ranges
+        self.pool = pool
+
+    def add(self, i: int, lr: LiveRange):
+        pass
+
+    def spill(self, reg: ir.Reg, pos: int, i: int, do_not_spill: List[LiveRange], debug):
+        _SpillEarlierLiveRange(reg, pos, i, self.live_ranges, self.pool, do_not_spill, debug)
+
+
+class _ActiveSet:
+    """The def LiveRanges holding a cpu reg, i.e. the spill candidates
+
+    The candidates of each cpu reg family are kept in the order of the LiveRanges so
+    that the most recently started one is tried first like in _SpillEarlierLiveRange.
+    LiveRanges which have given back their reg are dropped when a spill runs across
+    them. So each spill only looks at the LiveRanges currently holding a cpu reg (plus
+    the ones dropped) rather than all earlier LiveRanges of the Bbl.
+    """
+
+    def __init__(self, live_ranges: List[LiveRange], pool: RegPool):
+        self.live_ranges = live_ranges
+        self.pool = pool
+        self.candidates: Dict[int, Dict[int, LiveRange]] = {}
+
+    def add(self, i: int, lr: LiveRange):
+        family = self.pool.get_cpu_reg_family(lr.reg.kind)
+        self.candidates.setdefault(family, {})[i] = lr
+
+    def spill(self, reg: ir.Reg, pos: int, i: int, do_not_spill: List[LiveRange], debug):
+        current_pos = self.live_ranges[i + 1].def_pos
+        candidates = self.candidates.get(self.pool.get_cpu_reg_family(reg.kind), {})
+        retired = []
+        victim = None
+        for n in reversed(candidates):
+            lr = candidates[n]
+            if lr.last_use_pos < current_pos:
+                retired.append(n)
+            elif lr not in do_not_spill and lr.last_use_pos > pos:
+                victim = n
+                break
+        for n in retired:
+            del candidates[n]
+        assert victim is not None, f"failed to free up reg for {reg}"
+        lr = candidates.pop(victim)
+        if debug:
+            debug(lr, f"spilling previously assigned {lr.cpu_reg.name}")
+        self.pool.give_back_available_reg(lr.cpu_reg)
+        lr.cpu_reg = ir.CPU_REG_SPILL
+
+
 # def _BackTrack(reg: ir.Reg, pos: int, i: int, live_ranges: List[LiveRange], pool: RegPool, debug) -> int:
 #     kind_wanted = pool.get_cpu_reg_family(reg.kind)
 #     for i in range(i, -1, -1):  # count down to zero!
@@ -162,8 +225,7 @@ def _SpillEarlierLiveRange(reg: ir.Reg, pos: int, i: int, live_ranges: List[Live
 #         return i + 1
 
 
-def _HandleDefLiveRangeFancy(i: int, lr: LiveRange, live_ranges: List[LiveRange], pool,
-                             debug):
+def _HandleDefLiveRangeFancy(i: int, lr: LiveRange, active, pool, debug):
     _HandleDefLiveRange(lr, pool, debug)
     if lr.cpu_reg is ir.CPU_REG_SPILL:
         # we need to spill but we still need a tmp reg
@@ -173,17 +235,18 @@ def _HandleDefLiveRangeFancy(i: int, lr: LiveRange, live_ranges: List[LiveRange]
             if debug:
                 debug(lr, "no spill scratch reg for def")
             # backtracking provides better allocation but is slow (potentially exponentially so)
-            _SpillEarlierLiveRange(lr.reg, lr.def_pos, i - 1, live_ranges, pool, [], debug)
+            active.spill(lr.reg, lr.def_pos, i - 1, [], debug)
             tmp_reg = pool.get_available_reg(tmp_lr)
             assert tmp_reg is not ir.CPU_REG_SPILL
         if debug:
             debug(lr, f"spill scratch reg for def: {tmp_reg.name}")
         pool.give_back_available_reg(tmp_reg)
+    elif lr.last_use_pos is not liveness.NO_USE:
+        active.add(i, lr)
     return i + 1
 
 
-def _HandleUseLiveRangeFancy(i: int, lr_use: LiveRange, live_ranges: List[LiveRange], pool,
-                             debug):
+def _HandleUseLiveRangeFancy(i: int, lr_use: LiveRange, active, pool, debug):
     """return are reg """
     spill_tmp_regs: List[ir.CpuReg] = []
     do_not_spill = []
@@ -203,7 +266,7 @@ def _HandleUseLiveRangeFancy(i: int, lr_use: LiveRange, live_ranges: List[LiveRa
             # backtracking provides better allocation but is slow (potentially exponentially so)
             # TODO: make a second pass to maybe undo some spilling
             # TODO: the earlier spilled reg may be a "lac" but we may request a non_lac
-            _SpillEarlierLiveRange(lr.reg, lr.def_pos, i - 1, live_ranges, pool, do_not_spill, debug)
+            active.spill(lr.reg, lr.def_pos, i - 1, do_not_spill, debug)
             tmp_reg = pool.get_available_reg(tmp_lr)
             assert tmp_reg is not ir.CPU_REG_SPILL
 
@@ -217,6 +280,20 @@ def _HandleUseLiveRangeFancy(i: int, lr_use: LiveRange, live_ranges: List[LiveRa
     return i + 1
 
 
+def _RunLinearScanFancy(live_ranges: List[LiveRange], pool: RegPool, active, debug):
+    live_ranges.sort()
+    i = 0
+    while i < len(live_ranges):
+        lr = live_ranges[i]
+        if lr.uses:
+            i = _HandleUseLiveRangeFancy(i, lr, active, pool, debug)
+        else:
+            if PRE_ALLOC in lr.flags or IGNORE in lr.flags:
+                i += 1
+                continue
+            i = _HandleDefLiveRangeFancy(i, lr, active, pool, debug)
+
+
 def RegisterAssignerLinearScanFancy(live_ranges: List[LiveRange], pool: RegPool, debug=None):
     """
     Standard Linear Scan Interval Coloring algorithm with special spill handling
@@ -234,26 +311,214 @@ def RegisterAssignerLinearScanFancy(live_ranges: List[LiveRange], pool: RegPool,
     After this function has run all liveranges which are not PRE_ALLOCATED or IGNORE should
     have lr.cpu_reg is ir.CPU_REG_INVALID
     """
-    live_ranges.sort()
-    i = 0
-    while i < len(live_ranges):
-        lr = live_ranges[i]
-        if lr.uses:
-            i = _HandleUseLiveRangeFancy(i, lr, live_ranges, pool, debug)
-        else:
-            if PRE_ALLOC in lr.flags or IGNORE in lr.flags:
-                i += 1
+    _RunLinearScanFancy(live_ranges, pool, _ActiveSet(live_ranges, pool), debug)
+
+
+def RegisterAssignerLinearScanFancyReference(live_ranges: List[LiveRange], pool: RegPool,
+                                             debug=None):
+    """Same as RegisterAssignerLinearScanFancy but scans all earlier LiveRanges
+    for spill candidates.
+
+    Kept for benchmarking and cross checking (see benchmark.py).
+    """
+    _RunLinearScanFancy(live_ranges, pool, _ScanAllSpillCandidates(live_ranges, pool), debug)
+
+
+class LocalMoveHints:
+    """Coalescing hints for the local register allocation of a bbl
+
+    A lr defined by a mov from another reg should get the cpu reg of the source
+    and a lr whose last use is a mov into a reg with a cpu reg (e.g. an argument
+    or a result reg) should get that cpu reg. Then the mov can be removed after
+    allocation. The pool still needs to check that the hinted cpu reg is available.
+    """
+
+    def __init__(self, bbl: ir.Bbl, live_ranges: List[LiveRange]):
+        self._bbl = bbl
+        self._def_lrs: Dict[ir.Reg, List[LiveRange]] = {}
+        for lr in live_ranges:
+            if not lr.is_use_lr():
+                self._def_lrs.setdefault(lr.reg, []).append(lr)
+
+    def _CpuRegAt(self, reg: ir.Reg, pos: int) -> Optional[ir.CpuReg]:
+        """Returns the cpu reg holding reg when it is used at pos"""
+        if reg.HasCpuReg():
+            return reg.cpu_reg
+        for lr in self._def_lrs.get(reg, []):
+            if lr.def_pos < pos <= lr.last_use_pos:
+                if lr.cpu_reg in (ir.CPU_REG_INVALID, ir.CPU_REG_SPILL):
+                    return None
+                return lr.cpu_reg
+        return None
+
+    def CpuRegs(self, lr: LiveRange) -> List[ir.CpuReg]:
+        out = []
+        if 0 <= lr.def_pos < len(self._bbl.inss):
+            ins = self._bbl.inss[lr.def_pos]
+            if ins.opcode is o.MOV and isinstance(ins.operands[1], ir.Reg):
+                cpu_reg = self._CpuRegAt(ins.operands[1], lr.def_pos)
+                if cpu_reg is not None:
+                    out.append(cpu_reg)
+        if 0 <= lr.last_use_pos < len(self._bbl.inss):
+            ins = self._bbl.inss[lr.last_use_pos]
+            if ins.opcode is o.MOV and ins.operands[1] is lr.reg and ins.operands[0].HasCpuReg():
+                out.append(ins.operands[0].cpu_reg)
+        return out
+
+    def Order(self, lr: LiveRange, kind, count: int) -> List[int]:
+        """Returns the numbers of the cpu regs of the given kind to try, hinted ones first"""
+        hinted = [cpu_reg.no for cpu_reg in self.CpuRegs(lr) if cpu_reg.kind == kind]
+        return hinted + [n for n in range(count) if n not in hinted]
+
+
+class GlobalMoveHints:
+    """Coalescing hints for the global register allocation
+
+    A global connected by a mov to another global or to a pre-allocated reg
+    (e.g. an argument or a result reg) may share its cpu reg if the two never
+    interfere, i.e. neither is defined while the other one is live. This includes
+    the mov itself, so the two can only share if the source dies at the mov.
+    The cpu regs of pre-allocated regs are implicitly live from their def to the next
+    call or ret and are only shared with globals not live across calls if they are
+    in shareable. overlap tells whether two cpu regs share storage (default: identity).
+    The cpu regs must be handed out to the globals live across calls first so that
+    those never share a cpu reg with a global that is not.
+    """
+
+    def __init__(self, fun: ir.Fun, regs: List[ir.Reg], shareable: Set[ir.CpuReg],
+                 overlap=None):
+        self._regs = regs
+        self._shareable = shareable
+        self._overlap = overlap or (lambda a, b: a == b)
+        self._interferes: Dict[ir.Reg, Set[ir.Reg]] = {reg: set() for reg in regs}
+        self._cpu_conflicts: Dict[ir.Reg, Set[ir.CpuReg]] = {reg: set() for reg in regs}
+        self._partners: Dict[ir.Reg, List[ir.Reg]] = {reg: [] for reg in regs}
+        for bbl in fun.bbls:
+            live = set(reg for reg in bbl.live_out if reg in self._interferes)
+            live_cpu = set(reg.cpu_reg for reg in bbl.live_out if reg.HasCpuReg())
+            for ins in reversed(bbl.inss):
+                if ins.opcode.is_call():
+                    callee: ir.Fun = cfg.InsCallee(ins)
+                    self._AddCpuInterference(callee.cpu_live_out, live)
+                    live_cpu.difference_update(callee.cpu_live_out)
+                    live_cpu.update(callee.cpu_live_in)
+                elif ins.opcode is o.RET:
+                    live_cpu.update(fun.cpu_live_out)
+                num_defs = ins.opcode.def_ops_count()
+                for reg in ins.operands[:num_defs]:
+                    if reg in self._interferes:
+                        self._AddInterference(reg, live)
+                        self._cpu_conflicts[reg].update(live_cpu)
+                    elif reg.HasCpuReg():
+                        self._AddCpuInterference([reg.cpu_reg], live)
+                        live_cpu.discard(reg.cpu_reg)
+                for reg in ins.operands[:num_defs]:
+                    live.discard(reg)
+                for reg in ins.operands[num_defs:]:
+                    if not isinstance(reg, ir.Reg):
+                        continue
+                    if reg in self._interferes:
+                        live.add(reg)
+                    elif reg.HasCpuReg():
+                        live_cpu.add(reg.cpu_reg)
+                if ins.opcode is o.MOV and isinstance(ins.operands[1], ir.Reg):
+                    if ins.operands[0].kind == ins.operands[1].kind:
+                        self._AddPartners(ins.operands[0], ins.operands[1])
+            if bbl is fun.bbls[0]:
+                # regs used without a def, all of them are live at the same time
+                for reg in live:
+                    self._AddInterference(reg, live)
+                self._AddCpuInterference(fun.cpu_live_in, live)
+
+    def _AddInterference(self, reg: ir.Reg, live: Set[ir.Reg]):
+        for other in live:
+            if other is not reg:
+                self._interferes[reg].add(other)
+                self._interferes[other].add(reg)
+
+    def _AddCpuInterference(self, cpu_regs: List[ir.CpuReg], live: Set[ir.Reg]):
+        for reg in live:
+            self._cpu_conflicts[reg].update(cpu_regs)
+
+    def _AddPartners(self, dst: ir.Reg, src: ir.Reg):
+        if dst in self._partners:
+            if src in self._partners or src.HasCpuReg():
+                self._partners[dst].append(src)
+        if src in self._partners:
+            if dst in self._partners or dst.HasCpuReg():
+                self._partners[src].append(dst)
+
+    def CpuReg(self, reg: ir.Reg) -> Optional[ir.CpuReg]:
+        """Returns the cpu reg of a partner of reg which reg can share"""
+        lac = ir.REG_FLAG.LAC in reg.flags
+        for partner in self._partners[reg]:
+            if not partner.HasCpuReg():
                 continue
-            i = _HandleDefLiveRangeFancy(i, lr, live_ranges, pool, debug)
+            cpu_reg = partner.cpu_reg
+            if partner not in self._interferes:
+                # pre-allocated
+                if lac or cpu_reg not in self._shareable:
+                    continue
+            elif lac and ir.REG_FLAG.LAC not in partner.flags:
+                continue
+            if any(self._overlap(cpu_reg, other) for other in self._cpu_conflicts[reg]):
+                continue
+            if all(other not in self._interferes[reg] for other in self._regs
+                   if other.HasCpuReg() and self._overlap(other.cpu_reg, cpu_reg)):
+                return cpu_reg
+        return None
+
 
+def _IsCheapDef(ins: ir.Ins) -> bool:
+    """Whether ins can be repeated at each use of its result instead of spilling it"""
+    if ins.opcode is o.MOV:
+        return isinstance(ins.operands[1], ir.Const)
+    elif ins.opcode is o.LEA_MEM:
+        return isinstance(ins.operands[2], ir.Const)
+    return ins.opcode is o.LEA_FUN
 
-def InsSpillRegs(ins: ir.Ins, fun: ir.Fun, zero_const, reg_to_stk) -> Optional[List[ir.Ins]]:
+
+def _BblsRematerializableDefs(bbls: List[ir.Bbl], regs: List[ir.Reg]) -> Dict[ir.Reg, ir.Ins]:
+    defs: Dict[ir.Reg, List[ir.Ins]] = {reg: [] for reg in regs}
+    for bbl in bbls:
+        for ins in bbl.inss:
+            for reg in ins.operands[:ins.opcode.def_ops_count()]:
+                if reg in defs:
+                    defs[reg].append(ins)
+    return {reg: inss[0] for reg, inss in defs.items()
+            if len(inss) == 1 and _IsCheapDef(inss[0])}
+
+
+def FunRematerializableDefs(fun: ir.Fun, regs: List[ir.Reg]) -> Dict[ir.Reg, ir.Ins]:
+    """Returns the regs to be spilled whose only def is a constant mov, lea.mem or lea.fun
+
+    Such regs do not need a stack slot, instead the def is repeated at each use
+    (see InsSpillRegs).
+    """
+    return _BblsRematerializableDefs(fun.bbls, regs)
+
+
+def BblRematerializableDefs(bbl: ir.Bbl, regs: List[ir.Reg]) -> Dict[ir.Reg, ir.Ins]:
+    """Same as FunRematerializableDefs for regs which are local to the bbl"""
+    return _BblsRematerializableDefs([bbl], regs)
+
+
+def InsSpillRegs(ins: ir.Ins, fun: ir.Fun, zero_const, reg_to_stk,
+                 remat=None) -> Optional[List[ir.Ins]]:
+    num_defs = ins.opcode.def_ops_count()
+    if remat and num_defs == 1 and remat.get(ins.operands[0]) is ins:
+        return []
     before: List[ir.Ins] = []
     after: List[ir.Ins] = []
-    num_defs = ins.opcode.def_ops_count()
     for n, reg in reversed(list(enumerate(ins.operands))):
         if not isinstance(reg, ir.Reg):
             continue
+        if remat and reg in remat:
+            assert n >= num_defs
+            scratch = fun.GetScratchReg(reg.kind, "remat", False)
+            ins.operands[n] = scratch
+            before.append(ir.Ins(remat[reg].opcode, [scratch] + remat[reg].operands[1:]))
+            continue
         stk = reg_to_stk.get(reg)
         if stk is None:
             continue
@@ -271,24 +536,31 @@ def InsSpillRegs(ins: ir.Ins, fun: ir.Fun, zero_const, reg_to_stk) -> Optional[L
         return None
 
 
-def BblSpillRegs(bbl: ir.Bbl, fun: ir.Fun, regs: List[ir.Reg], offset_kind: o.DK, prefix) -> int:
+def BblSpillRegs(bbl: ir.Bbl, fun: ir.Fun, regs: List[ir.Reg], offset_kind: o.DK, prefix,
+                 remat=None) -> int:
+    """remat (see BblRematerializableDefs) maps regs which need no stk to their def"""
     reg_to_stk: Dict[ir.Reg, ir.Stk] = {}
     for reg in regs:
+        if remat and reg in remat:
+            continue
         size = reg.kind.bitwidth() // 8
         stk = ir.Stk(f"{prefix}_{reg.name}", size, size)
         reg_to_stk[reg] = stk
         fun.AddStk(stk)
     ir.BblGenericRewrite(bbl, fun, InsSpillRegs, zero_const=ir.Const(offset_kind, 0),
-                         reg_to_stk=reg_to_stk)
+                         reg_to_stk=reg_to_stk, remat=remat)
 
 
-def FunSpillRegs(fun: ir.Fun, offset_kind: o.DK, regs: List[ir.Reg], prefix) -> int:
+def FunSpillRegs(fun: ir.Fun, offset_kind: o.DK, regs: List[ir.Reg], prefix,
+                 remat=None) -> int:
+    """remat (see FunRematerializableDefs) maps regs which need no stk to their def"""
     reg_to_stk: Dict[ir.Reg, ir.Stk] = {}
     for reg in regs:
+        if remat and reg in remat:
+            continue
         size = reg.kind.bitwidth() // 8
         stk = ir.Stk(f"{prefix}_{reg.name}", size, size)
         reg_to_stk[reg] = stk
         fun.AddStk(stk)
     return ir.FunGenericRewrite(fun, InsSpillRegs, zero_const=ir.Const(offset_kind, 0),
-                                reg_to_stk=reg_to_stk)
-
+                                reg_to_stk=reg_to_stk, remat=remat)
@@ -5,6 +5,7 @@ import unittest
 import heapq
 from typing import List, Dict
 
+from Base import cfg
 from Base import ir
 from Base import liveness
 from Base import opcode_tab as o
@@ -218,6 +219,177 @@ class TestRanges(unittest.TestCase):
             # print (lr)
             assert lr.cpu_reg != ir.CPU_REG_SPILL, f"unexpected reg {lr}"
 
+    def testSpillingMatchesReference(self):
+        lines = [".fun main NORMAL [U32] = []",
+                 f".reg U32 [{' '.join(f'r{i}' for i in range(60))}]",
+                 ".bbl start"]
+        for i in range(60):
+            if i < 10:
+                lines.append(f"    mov r{i} = {i}")
+            else:
+                # r{i-1} is mostly dead, r{i-10} is long lived
+                lines.append(f"    add r{i} = r{i - 10} r{i - 3 - i % 5}")
+        lines += ["    pusharg r59", "    ret"]
+        unit = serialize.UnitParseFromAsm(io.StringIO("\n".join(lines) + "\n"), False)
+        fun = unit.fun_syms["main"]
+        bbl = fun.bbls[0]
+
+        results = []
+        for assigner in [reg_alloc.RegisterAssignerLinearScanFancy,
+                         reg_alloc.RegisterAssignerLinearScanFancyReference]:
+            live_ranges = liveness.BblGetLiveRanges(bbl, fun, set())
+            live_ranges.sort()
+            assigner(live_ranges, TestRegPool(MakeGenericCpuRegs(4)))
+            results.append([str(lr) for lr in live_ranges])
+            assigned = [lr for lr in live_ranges
+                        if not lr.is_use_lr() and lr.cpu_reg is not ir.CPU_REG_SPILL]
+            for a in assigned:
+                for b in assigned:
+                    if a is not b and a.cpu_reg == b.cpu_reg and a.last_use_pos != liveness.NO_USE:
+                        assert not (a.def_pos < b.def_pos < a.last_use_pos), f"{a} {b}"
+        self.assertTrue(any("SPILLED" in lr for lr in results[0]))
+        self.assertEqual(results[0], results[1])
+
+
+class TestSpilling(unittest.TestCase):
+
+    def testRematerialization(self):
+        unit = serialize.UnitParseFromAsm(io.StringIO(r"""
+.mem g 4 RW
+    .data 4 [0]
+.fun main NORMAL [U32] = [U32]
+.reg U32 [x c d]
+.reg A32 [p]
+.bbl start
+    poparg x
+    mov c = 7
+    lea.mem p = g 4
+    mov d = x
+    beq x 0 other
+.bbl loop
+    add x = x c
+    st p 0 = x
+    blt x 10 loop
+.bbl other
+    add x = d c
+    pusharg x
+    ret
+"""), False)
+        fun = unit.fun_syms["main"]
+        regs = [fun.reg_syms[name] for name in ["c", "d", "p"]]
+        remat = reg_alloc.FunRematerializableDefs(fun, regs)
+        # d is a copy of another reg
+        self.assertEqual(["c", "p"], sorted(reg.name for reg in remat))
+        reg_alloc.FunSpillRegs(fun, o.DK.U32, regs, "$gspill", remat)
+        self.assertEqual(["$gspill_d"], list(fun.stk_syms))
+        inss = [serialize.InsRenderToAsm(ins).strip() for bbl in fun.bbls for ins in bbl.inss]
+        self.assertEqual(["poparg x",
+                          "mov $1_stspill x",
+                          "st.stk $gspill_d 0 $1_stspill",
+                          "beq x 0 other",
+                          "mov $2_remat 7",
+                          "add x x $2_remat",
+                          "lea.mem $3_remat g 4",
+                          "st $3_remat 0 x",
+                          "blt x 10 loop",
+                          "mov $4_remat 7",
+                          "ld.stk $5_ldspill $gspill_d 0",
+                          "add x $5_ldspill $4_remat",
+                          "pusharg x",
+                          "ret"], inss)
+
+
+class TestMoveHints(unittest.TestCase):
+
+    def testLocal(self):
+        unit = serialize.UnitParseFromAsm(io.StringIO(r"""
+.fun main NORMAL [] = []
+.reg U32 [in out a b c d]
+.bbl start
+    mov a = in
+    add b = a 1
+    mov c = a
+    add d = c b
+    mov out = d
+    ret
+"""), False)
+        fun = unit.fun_syms["main"]
+        bbl = fun.bbls[0]
+        regs = fun.reg_syms
+        regs["in"].cpu_reg = NAMES_TO_REG["r0"]
+        regs["out"].cpu_reg = NAMES_TO_REG["r3"]
+        live_ranges = liveness.BblGetLiveRanges(bbl, fun, set())
+        lrs = {lr.reg.name: lr for lr in live_ranges
+               if not lr.is_use_lr() and not lr.reg.HasCpuReg()}
+        hints = reg_alloc.LocalMoveHints(bbl, live_ranges)
+        # a is a copy of in
+        self.assertEqual([0, 1, 2, 3], hints.Order(lrs["a"], GPR_NOT_LAC, 4))
+        self.assertEqual([], hints.CpuRegs(lrs["b"]))
+        # c is a copy of a which has no cpu reg yet
+        self.assertEqual([], hints.CpuRegs(lrs["c"]))
+        lrs["a"].cpu_reg = NAMES_TO_REG["r2"]
+        self.assertEqual([2, 0, 1, 3], hints.Order(lrs["c"], GPR_NOT_LAC, 4))
+        # d is copied into out
+        self.assertEqual([3, 0, 1, 2], hints.Order(lrs["d"], GPR_NOT_LAC, 4))
+        self.assertEqual([0, 1, 2, 3], hints.Order(lrs["d"], FLT_NOT_LAC, 4))
+
+    def testGlobal(self):
+        unit = serialize.UnitParseFromAsm(io.StringIO(r"""
+.mem g 4 RW
+    .data 4 [0]
+.fun main NORMAL [U32] = [U32]
+.reg U32 [in out x y z w]
+.bbl start
+    mov x = in
+    mov y = x
+    mov z = x
+    add z = z 1
+    st.mem g 0 = z
+    beq x 0 other
+.bbl one
+    mov out = x
+    add z = y 1
+    mov w = z
+    st.mem g 0 = w
+    ret
+.bbl other
+    add z = x y
+    mov out = z
+    ret
+"""), False)
+        fun = unit.fun_syms["main"]
+        cfg.FunSplitBblsAtTerminators(fun)
+        cfg.FunInitCFG(fun)
+        regs = fun.reg_syms
+        r0, r1, r2, r3 = [NAMES_TO_REG[f"r{i}"] for i in range(4)]
+        regs["in"].cpu_reg = r0
+        regs["out"].cpu_reg = r1
+        fun.cpu_live_in = [r0]
+        fun.cpu_live_out = [r1]
+        liveness.FunComputeLivenessInfo(fun)
+        x, y, z, w = [regs[name] for name in ["x", "y", "z", "w"]]
+        hints = reg_alloc.GlobalMoveHints(fun, [x, y, z, w], {r0, r1})
+        # in is not used after the copy into x
+        self.assertEqual(r0, hints.CpuReg(x))
+        x.cpu_reg = r0
+        # x is still live after the copy into y and out is written while y is live
+        self.assertEqual(None, hints.CpuReg(y))
+        y.cpu_reg = r3
+        # z is redefined while x is live
+        self.assertEqual(None, hints.CpuReg(z))
+        z.cpu_reg = r2
+        # z dies at the copy into w
+        self.assertEqual(r2, hints.CpuReg(w))
+
+        hints = reg_alloc.GlobalMoveHints(fun, [x, y, z, w], {r1})
+        for reg in [x, y, z, w]:
+            reg.cpu_reg = None
+        # r0 is not shareable but x is dead whenever out is live
+        self.assertEqual(r1, hints.CpuReg(x))
+        x.cpu_reg = r1
+        # y is live when out is written in one
+        self.assertEqual(None, hints.CpuReg(y))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -11,8 +11,9 @@
 
 import collections
 import dataclasses
-from typing import List, Dict, Tuple, Set
+from typing import List, Dict, Tuple, Set, Optional
 
+from Base import cfg
 from Base import ir
 from Base import liveness
 from Base import opcode_tab as o
@@ -173,6 +174,68 @@ def FunGlobalRegStats(fun: ir.Fun, reg_kind_map: Dict[o.DK, o.DK]) -> Dict[KIND_
     return out
 
 
+# estimated number of iterations of a loop used to weight the references
+_LOOP_SCALE = 10
+# avoid absurd weights for deeply nested loops
+_MAX_LOOP_DEPTH = 6
+
+
+def FunComputeSpillCosts(fun: ir.Fun,
+                         bbl_freqs: Optional[Dict[str, int]] = None) -> Dict[ir.Reg, int]:
+    """Estimates the cost of spilling each reg
+
+    The cost is the number of defs and uses weighted by the execution frequency
+    of the bbls containing them. The frequency is taken from bbl_freqs (e.g. profile
+    counts) if provided, otherwise it is estimated from the loop nesting depth.
+    """
+    if bbl_freqs is None:
+        cfg.FunEnsureLoopInfo(fun)
+    costs: Dict[ir.Reg, int] = collections.defaultdict(int)
+    for bbl in fun.bbls:
+        if bbl_freqs is None:
+            freq = _LOOP_SCALE ** min(bbl.loop_depth, _MAX_LOOP_DEPTH)
+        else:
+            freq = bbl_freqs.get(bbl.name, 0)
+        for ins in bbl.inss:
+            for reg in ins.operands:
+                if isinstance(reg, ir.Reg):
+                    costs[reg] += freq
+    return costs
+
+
+class GlobalRegSpillCosts:
+    """Orders the globals by decreasing spill cost
+
+    The global allocators hand out the available cpu regs in list order and
+    spill the remainder, so the cheapest globals get spilled first.
+    The default order (by name) is remembered so that Report can tell how
+    much the ordering helped.
+    """
+
+    def __init__(self, fun: ir.Fun, global_reg_stats: Dict[KIND_AND_LAC, List[ir.Reg]],
+                 bbl_freqs: Optional[Dict[str, int]] = None):
+        self.costs = FunComputeSpillCosts(fun, bbl_freqs)
+        self.global_reg_stats = global_reg_stats
+        self.default_order = {key: list(val) for key, val in global_reg_stats.items()}
+        for val in global_reg_stats.values():
+            val.sort(key=lambda r: (-self.costs[r], r))
+
+    def Report(self) -> Tuple[int, int]:
+        """Returns the cost of the spilled globals for the default and the cost order
+
+        Must be called after the allocation but before the spilling.
+        """
+        before = 0
+        after = 0
+        for key, val in self.global_reg_stats.items():
+            spilled = [reg for reg in val if not reg.HasCpuReg()]
+            after += sum(self.costs[reg] for reg in spilled)
+            # the number of assigned regs does not depend on the order
+            default = self.default_order.get(key, [])
+            before += sum(self.costs[reg] for reg in default[len(default) - len(spilled):])
+        return before, after
+
+
 def FunDropUnreferencedRegs(fun: ir.Fun) -> int:
     """Remove all regs which are no longer referenced"""
     to_be_removed: List[ir.Reg] = []
@@ -275,6 +338,8 @@ def FunSeparateLocalRegUsage(fun: ir.Fun) -> int:
                 ins.operands[n] = new_reg
                 _BblRenameReg(bbl, pos + 1, reg, new_reg)
                 count += 1
+    if count:
+        fun.InvalidateAnalyses()
     return count
 
 
@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+
+import unittest
+
+from Base import ir
+from Base import liveness
+from Base import opcode_tab as o
+from Base import reg_stats
+from Base import testing
+
+
+_LOOP = r"""
+.fun main NORMAL [U32] = [U32 U32]
+.reg U32 [a b i sum]
+.bbl start
+    poparg a
+    poparg b
+    mov i = 0
+    mov sum = 0
+.bbl loop
+    add sum = sum i
+    add i = i 1
+    blt i 1000 loop
+.bbl done
+    add sum = sum a
+    add sum = sum a
+    add sum = sum b
+    pusharg sum
+    ret
+"""
+
+
+class TestSpillCosts(unittest.TestCase):
+
+    def testLoopWeights(self):
+        unit, fun = testing.ParseFun(_LOOP)
+        costs = reg_stats.FunComputeSpillCosts(fun)
+        regs = fun.reg_syms
+        # a: 1 def + 2 uses outside of the loop, i: 1 def before and 4 refs inside
+        self.assertEqual(3, costs[regs["a"]])
+        self.assertEqual(2, costs[regs["b"]])
+        self.assertEqual(41, costs[regs["i"]])
+        self.assertEqual(28, costs[regs["sum"]])
+
+        costs = reg_stats.FunComputeSpillCosts(fun, {"start": 1, "loop": 1000, "done": 1})
+        self.assertEqual(4001, costs[regs["i"]])
+
+    def testGlobalOrder(self):
+        unit, fun = testing.ParseFun(_LOOP)
+        reg_stats.FunComputeRegStatsExceptLAC(fun)
+        liveness.FunComputeLivenessInfo(fun)
+        reg_stats.FunComputeRegStatsLAC(fun)
+        global_reg_stats = reg_stats.FunGlobalRegStats(fun, {o.DK.U32: o.DK.U32})
+        gregs = global_reg_stats[(o.DK.U32, False)]
+        self.assertEqual(["a", "b", "i", "sum"], [reg.name for reg in gregs])
+
+        costs = reg_stats.GlobalRegSpillCosts(fun, global_reg_stats)
+        self.assertEqual(["i", "sum", "a", "b"], [reg.name for reg in gregs])
+        # pretend there are only two cpu regs
+        gregs[0].cpu_reg = ir.CpuReg("r0", 0)
+        gregs[1].cpu_reg = ir.CpuReg("r1", 1)
+        # in the default order i and sum would have been spilled
+        self.assertEqual((41 + 28, 3 + 2), costs.Report())
+
+
+if __name__ == '__main__':
+    unittest.main()
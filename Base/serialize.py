@@ -4,7 +4,7 @@
 
 import collections
 import struct
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 
 from Base import ir
 from Base import opcode_tab as o
@@ -455,27 +455,33 @@ def ProcessLine(token: List, unit: ir.Unit, fun: Optional[ir.Fun], cpu_regs: Dic
         sanity.InsCheckConstraints(ins)
 
 
+def TokenizeLineReference(line: str) -> List[Any]:
+    """Reference version of parse.ParseLineWithLists used for testing"""
+    token_raw = parse.ParseLine(line)
+    token = []
+    in_list = False
+    for t in token_raw:
+        if t.startswith("#"):
+            break
+        elif t == "]":
+            in_list = False
+        elif t == "[":
+            in_list = True
+            token.append([])
+        elif in_list:
+            token[-1].append(t)
+        else:
+            token.append(t)
+    return token
+
+
 def UnitParseFromAsm(fin, verbose=False, cpu_regs: Dict[str, ir.CpuReg] = {}) -> ir.Unit:
     out = ir.Unit("module")
     for line_num, line in enumerate(fin):
         fun = None if len(out.funs) == 0 else out.funs[-1]
 
         # print ("@@@", line[:-1])
-        token_raw = parse.ParseLine(line)
-        token = []
-        in_list = False
-        for t in token_raw:
-            if t.startswith("#"):
-                break
-            elif t == "]":
-                in_list = False
-            elif t == "[":
-                in_list = True
-                token.append([])
-            elif in_list:
-                token[-1].append(t)
-            else:
-                token.append(t)
+        token = parse.ParseLineWithLists(line)
         if not token:
             continue
         if verbose:
@@ -493,6 +499,522 @@ def UnitParseFromAsm(fin, verbose=False, cpu_regs: Dict[str, ir.CpuReg] = {}) ->
     return out
 
 
+############################################################
+# Binary Format
+############################################################
+# A compact alternative to the textual form which is much faster to load.
+# All ints are LEB128 varints (except for the opcode number of an ins which
+# is a single byte), signed ints are zigzag encoded and
+# floats are stored as 8 byte doubles. Names are indices into the string table.
+#
+# magic
+# string table: byte length followed by the NUL separated utf-8 strings
+# fun table: count, then per fun: name, kind, output types, input types,
+#            body offset (relative to the first body), body size
+# mems: count, then per mem: name, alignment, kind
+#       followed by the datas of all mems
+# fun bodies: regs, stks, jtbs, bbl names and finally the inss of each bbl
+#
+# Inside a body regs, bbls and jtbs are referred to by their index. The fun
+# table gives the location of each body, so they can be decoded on demand.
+
+BINARY_MAGIC = b"CWERGIR1"
+
+_DK_BY_VALUE = {dk.value: dk for dk in o.DK}
+_DK_FLOAT_VALUES = {dk.value for dk in o.DK if dk.flavor() is o.DK_FLAVOR_F}
+
+_DATA_BYTES = 0
+_DATA_ADDR_FUN = 1
+_DATA_ADDR_MEM = 2
+
+_CPU_REG_NONE = 0
+_CPU_REG_STK = 1
+_CPU_REG_FIRST_NAME = 2
+
+
+def _WriteVarint(out: bytearray, n: int):
+    assert n >= 0, f"unexpected negative varint {n}"
+    while n >= 0x80:
+        out.append((n & 0x7f) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _ReadVarint(data, pos: int) -> Tuple[int, int]:
+    b = data[pos]
+    if b < 0x80:
+        return b, pos + 1
+    n = b & 0x7f
+    shift = 7
+    pos += 1
+    while True:
+        b = data[pos]
+        pos += 1
+        n |= (b & 0x7f) << shift
+        if b < 0x80:
+            return n, pos
+        shift += 7
+
+
+def _WriteConstValue(out: bytearray, const: ir.Const):
+    if const.kind.flavor() is o.DK_FLAVOR_F:
+        out += struct.pack("<d", const.value)
+    else:
+        v = const.value
+        _WriteVarint(out, v << 1 if v >= 0 else ((-v) << 1) - 1)
+
+
+def _ReadConst(data, pos: int, kind_value: int) -> Tuple[ir.Const, int]:
+    kind = _DK_BY_VALUE[kind_value]
+    if kind_value in _DK_FLOAT_VALUES:
+        return ir.Const(kind, struct.unpack_from("<d", data, pos)[0]), pos + 8
+    v, pos = _ReadVarint(data, pos)
+    return ir.Const(kind, v >> 1 if v & 1 == 0 else -((v + 1) >> 1)), pos
+
+
+class _StringTable:
+
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+
+    def Add(self, s: str) -> int:
+        no = self.index.get(s)
+        if no is None:
+            assert "\0" not in s
+            no = len(self.index)
+            self.index[s] = no
+        return no
+
+    def ToBytes(self) -> bytes:
+        return "\0".join(self.index).encode("utf-8")
+
+
+def _FunWriteBinary(fun: ir.Fun, strs: _StringTable) -> bytearray:
+    out = bytearray()
+    reg_pos = {reg.name: n for n, reg in enumerate(fun.regs)}
+    bbl_pos = {bbl.name: n for n, bbl in enumerate(fun.bbls)}
+    jtb_pos = {jtb.name: n for n, jtb in enumerate(fun.jtbs)}
+
+    _WriteVarint(out, len(fun.regs))
+    for reg in fun.regs:
+        _WriteVarint(out, strs.Add(reg.name))
+        _WriteVarint(out, reg.kind.value)
+        if reg.HasCpuReg():
+            _WriteVarint(out, _CPU_REG_FIRST_NAME + strs.Add(reg.cpu_reg.name))
+        elif reg.IsSpilled():
+            _WriteVarint(out, _CPU_REG_STK)
+        else:
+            _WriteVarint(out, _CPU_REG_NONE)
+
+    _WriteVarint(out, len(fun.stk_syms))
+    for stk in fun.stk_syms.values():
+        _WriteVarint(out, strs.Add(stk.name))
+        _WriteVarint(out, stk.alignment)
+        _WriteVarint(out, stk.count)
+
+    _WriteVarint(out, len(fun.jtbs))
+    for jtb in fun.jtbs:
+        _WriteVarint(out, strs.Add(jtb.name))
+        _WriteVarint(out, jtb.size)
+        _WriteVarint(out, bbl_pos[jtb.def_bbl.name])
+        _WriteVarint(out, len(jtb.bbl_tab))
+        for key, bbl in sorted(jtb.bbl_tab.items()):
+            _WriteVarint(out, key)
+            _WriteVarint(out, bbl_pos[bbl.name])
+
+    _WriteVarint(out, len(fun.bbls))
+    for bbl in fun.bbls:
+        _WriteVarint(out, strs.Add(bbl.name))
+    for bbl in fun.bbls:
+        _WriteVarint(out, len(bbl.inss))
+        for ins in bbl.inss:
+            # opcode numbers fit into a byte
+            out.append(ins.opcode.no)
+            for ok, op in zip(ins.opcode.operand_kinds, ins.operands):
+                if ok is o.OP_KIND.REG:
+                    _WriteVarint(out, reg_pos[op.name])
+                elif ok is o.OP_KIND.REG_OR_CONST:
+                    # the lowest bit distinguishes regs from consts
+                    if isinstance(op, ir.Reg):
+                        _WriteVarint(out, reg_pos[op.name] << 1)
+                    else:
+                        _WriteVarint(out, (op.kind.value << 1) | 1)
+                        _WriteConstValue(out, op)
+                elif ok is o.OP_KIND.CONST:
+                    _WriteVarint(out, op.kind.value)
+                    _WriteConstValue(out, op)
+                elif ok is o.OP_KIND.BBL:
+                    _WriteVarint(out, bbl_pos[op.name])
+                elif ok is o.OP_KIND.JTB:
+                    _WriteVarint(out, jtb_pos[op.name])
+                elif ok in {o.OP_KIND.MEM, o.OP_KIND.FUN, o.OP_KIND.STK}:
+                    _WriteVarint(out, strs.Add(op.name))
+                elif ok is o.OP_KIND.BYTES:
+                    _WriteVarint(out, len(op))
+                    out += op
+                else:
+                    raise ir.ParseError(f"cannot write op type: {ok}")
+    return out
+
+
+def UnitWriteBinary(unit: ir.Unit) -> bytes:
+    """Returns the binary form of the unit (see BinaryUnitReader)"""
+    strs = _StringTable()
+    bodies = [_FunWriteBinary(fun, strs) for fun in unit.funs]
+
+    funs = bytearray()
+    _WriteVarint(funs, len(unit.funs))
+    offset = 0
+    for fun, body in zip(unit.funs, bodies):
+        _WriteVarint(funs, strs.Add(fun.name))
+        _WriteVarint(funs, fun.kind.value)
+        for types in (fun.output_types, fun.input_types):
+            _WriteVarint(funs, len(types))
+            for kind in types:
+                _WriteVarint(funs, kind.value)
+        _WriteVarint(funs, offset)
+        _WriteVarint(funs, len(body))
+        offset += len(body)
+
+    mems = bytearray()
+    _WriteVarint(mems, len(unit.mems))
+    for mem in unit.mems:
+        _WriteVarint(mems, strs.Add(mem.name))
+        _WriteVarint(mems, mem.alignment)
+        _WriteVarint(mems, mem.kind.value)
+    for mem in unit.mems:
+        _WriteVarint(mems, len(mem.datas))
+        for d in mem.datas:
+            if isinstance(d, ir.DataBytes):
+                _WriteVarint(mems, _DATA_BYTES)
+                _WriteVarint(mems, d.count)
+                _WriteVarint(mems, len(d.data))
+                mems += d.data
+            elif isinstance(d, ir.DataAddrFun):
+                _WriteVarint(mems, _DATA_ADDR_FUN)
+                _WriteVarint(mems, d.size)
+                _WriteVarint(mems, strs.Add(d.fun.name))
+            elif isinstance(d, ir.DataAddrMem):
+                _WriteVarint(mems, _DATA_ADDR_MEM)
+                _WriteVarint(mems, d.size)
+                _WriteVarint(mems, strs.Add(d.mem.name))
+                _WriteVarint(mems, d.offset)
+            else:
+                assert False, f"NYI {d}"
+
+    out = bytearray(BINARY_MAGIC)
+    table = strs.ToBytes()
+    _WriteVarint(out, len(table))
+    out += table
+    out += funs
+    out += mems
+    for body in bodies:
+        out += body
+    return bytes(out)
+
+
+def _FunReadBinary(data, pos: int, strs: List[str], unit: ir.Unit, fun: ir.Fun,
+                   cpu_regs: Dict[str, ir.CpuReg]) -> int:
+    regs: List[ir.Reg] = []
+    num_regs, pos = _ReadVarint(data, pos)
+    for _ in range(num_regs):
+        name, pos = _ReadVarint(data, pos)
+        kind, pos = _ReadVarint(data, pos)
+        cpu_reg, pos = _ReadVarint(data, pos)
+        reg = fun.AddReg(ir.Reg(strs[name], _DK_BY_VALUE[kind]))
+        if cpu_reg == _CPU_REG_STK:
+            reg.cpu_reg = ir.StackSlot(0)
+        elif cpu_reg != _CPU_REG_NONE:
+            cpu_reg_name = strs[cpu_reg - _CPU_REG_FIRST_NAME]
+            reg.cpu_reg = cpu_regs.get(cpu_reg_name)
+            assert reg.cpu_reg is not None, f"unknown cpu_reg {cpu_reg_name}"
+        regs.append(reg)
+
+    num_stks, pos = _ReadVarint(data, pos)
+    for _ in range(num_stks):
+        name, pos = _ReadVarint(data, pos)
+        alignment, pos = _ReadVarint(data, pos)
+        count, pos = _ReadVarint(data, pos)
+        fun.AddStk(ir.Stk(strs[name], alignment, count))
+
+    jtbs: List[Tuple] = []
+    num_jtbs, pos = _ReadVarint(data, pos)
+    for _ in range(num_jtbs):
+        name, pos = _ReadVarint(data, pos)
+        size, pos = _ReadVarint(data, pos)
+        def_bbl, pos = _ReadVarint(data, pos)
+        num_entries, pos = _ReadVarint(data, pos)
+        tab = []
+        for _ in range(num_entries):
+            key, pos = _ReadVarint(data, pos)
+            bbl, pos = _ReadVarint(data, pos)
+            tab.append((key, bbl))
+        jtbs.append((strs[name], size, def_bbl, tab))
+
+    bbls: List[ir.Bbl] = []
+    num_bbls, pos = _ReadVarint(data, pos)
+    for _ in range(num_bbls):
+        name, pos = _ReadVarint(data, pos)
+        bbls.append(fun.AddBbl(ir.Bbl(strs[name])))
+    for name, size, def_bbl, tab in jtbs:
+        fun.AddJtb(ir.Jtb(name, bbls[def_bbl], {k: bbls[b] for k, b in tab}, size))
+
+    opcodes = o.Opcode.TableByNo
+    for bbl in bbls:
+        inss = bbl.inss
+        num_inss, pos = _ReadVarint(data, pos)
+        for _ in range(num_inss):
+            opc = opcodes[data[pos]]
+            pos += 1
+            ops = []
+            for ok in opc.operand_kinds:
+                # inlined fast path of _ReadVarint
+                v = data[pos]
+                if v < 0x80:
+                    pos += 1
+                else:
+                    v, pos = _ReadVarint(data, pos)
+                if ok is o.OP_KIND.REG:
+                    ops.append(regs[v])
+                elif ok is o.OP_KIND.REG_OR_CONST:
+                    if v & 1 == 0:
+                        ops.append(regs[v >> 1])
+                    else:
+                        const, pos = _ReadConst(data, pos, v >> 1)
+                        ops.append(const)
+                elif ok is o.OP_KIND.CONST:
+                    const, pos = _ReadConst(data, pos, v)
+                    ops.append(const)
+                elif ok is o.OP_KIND.BBL:
+                    ops.append(bbls[v])
+                elif ok is o.OP_KIND.JTB:
+                    ops.append(fun.jtbs[v])
+                elif ok is o.OP_KIND.MEM:
+                    ops.append(unit.mem_syms[strs[v]])
+                elif ok is o.OP_KIND.FUN:
+                    ops.append(unit.GetFunOrAddForwardDeclaration(strs[v]))
+                elif ok is o.OP_KIND.STK:
+                    ops.append(fun.stk_syms[strs[v]])
+                elif ok is o.OP_KIND.BYTES:
+                    ops.append(data[pos:pos + v])
+                    pos += v
+                else:
+                    raise ir.ParseError(f"cannot read op type: {ok}")
+            inss.append(ir.Ins(opc, ops))
+    return pos
+
+
+class BinaryUnitReader:
+    """Reads the binary form produced by UnitWriteBinary
+
+    `data` may be anything indexable like bytes or an mmap.
+    Mems and fun signatures are decoded right away. Fun bodies are only
+    decoded by DecodeFun() or DecodeAllFuns().
+    """
+
+    def __init__(self, data, cpu_regs: Dict[str, ir.CpuReg] = {}):
+        if data[:len(BINARY_MAGIC)] != BINARY_MAGIC:
+            raise ParseError("not a binary Cwerg unit")
+        self._data = data
+        self._cpu_regs = cpu_regs
+        self.unit = ir.Unit("module")
+        unit = self.unit
+
+        size, pos = _ReadVarint(data, len(BINARY_MAGIC))
+        self._strs: List[str] = str(data[pos:pos + size], "utf-8").split("\0")
+        strs = self._strs
+        pos += size
+
+        # fun name -> (body start, body end) relative to the first body
+        self._bodies: Dict[str, Tuple[int, int]] = {}
+        num_funs, pos = _ReadVarint(data, pos)
+        for _ in range(num_funs):
+            name, pos = _ReadVarint(data, pos)
+            kind, pos = _ReadVarint(data, pos)
+            types = []
+            for _ in range(2):
+                num_types, pos = _ReadVarint(data, pos)
+                kinds = []
+                for _ in range(num_types):
+                    dk, pos = _ReadVarint(data, pos)
+                    kinds.append(_DK_BY_VALUE[dk])
+                types.append(kinds)
+            offset, pos = _ReadVarint(data, pos)
+            size, pos = _ReadVarint(data, pos)
+            fun = unit.AddFun(ir.Fun(strs[name], o.FUN_KIND(kind), types[0], types[1]))
+            self._bodies[fun.name] = (offset, offset + size)
+
+        num_mems, pos = _ReadVarint(data, pos)
+        for _ in range(num_mems):
+            name, pos = _ReadVarint(data, pos)
+            alignment, pos = _ReadVarint(data, pos)
+            kind, pos = _ReadVarint(data, pos)
+            unit.AddMem(ir.Mem(strs[name], alignment, o.MEM_KIND(kind)))
+        for mem in unit.mems:
+            num_datas, pos = _ReadVarint(data, pos)
+            for _ in range(num_datas):
+                tag, pos = _ReadVarint(data, pos)
+                if tag == _DATA_BYTES:
+                    count, pos = _ReadVarint(data, pos)
+                    size, pos = _ReadVarint(data, pos)
+                    mem.AddData(ir.DataBytes(count, bytes(data[pos:pos + size])))
+                    pos += size
+                elif tag == _DATA_ADDR_FUN:
+                    size, pos = _ReadVarint(data, pos)
+                    name, pos = _ReadVarint(data, pos)
+                    mem.AddData(ir.DataAddrFun(
+                        size, unit.GetFunOrAddForwardDeclaration(strs[name])))
+                else:
+                    assert tag == _DATA_ADDR_MEM, f"unknown data tag {tag}"
+                    size, pos = _ReadVarint(data, pos)
+                    name, pos = _ReadVarint(data, pos)
+                    offset, pos = _ReadVarint(data, pos)
+                    mem.AddData(ir.DataAddrMem(size, unit.mem_syms[strs[name]], offset))
+        self._body_start = pos
+
+    def DecodeFun(self, fun: ir.Fun) -> ir.Fun:
+        """Fills in the body of fun unless this has been done already"""
+        span = self._bodies.pop(fun.name, None)
+        if span is None:
+            return fun
+        # slicing also turns an mmap into (faster to index) bytes
+        data = self._data[self._body_start + span[0]: self._body_start + span[1]]
+        pos = _FunReadBinary(data, 0, self._strs, self.unit, fun, self._cpu_regs)
+        assert pos == len(data), f"corrupted body for {fun.name}"
+        return fun
+
+    def DecodeAllFuns(self) -> ir.Unit:
+        for fun in self.unit.funs:
+            self.DecodeFun(fun)
+        return self.unit
+
+
+def UnitReadBinary(data, cpu_regs: Dict[str, ir.CpuReg] = {}) -> ir.Unit:
+    return BinaryUnitReader(data, cpu_regs).DecodeAllFuns()
+
+
+def _FunWriteState(fun: ir.Fun, strs: _StringTable) -> bytearray:
+    out = bytearray()
+    reg_pos = {reg.name: n for n, reg in enumerate(fun.regs)}
+    bbl_pos = {bbl.name: n for n, bbl in enumerate(fun.bbls)}
+    _WriteVarint(out, fun.flags.value)
+    _WriteVarint(out, fun.scratch_reg_id)
+    _WriteVarint(out, fun.stk_size + 1)  # stk_size starts out as -1
+    # passes like lowering.FunRegWidthWidening update the signature
+    for types in (fun.output_types, fun.input_types):
+        _WriteVarint(out, len(types))
+        for kind in types:
+            _WriteVarint(out, kind.value)
+    for cpu_regs in (fun.cpu_live_in, fun.cpu_live_out, fun.cpu_live_clobber):
+        _WriteVarint(out, len(cpu_regs))
+        for cpu_reg in cpu_regs:
+            _WriteVarint(out, strs.Add(cpu_reg.name))
+    for reg in fun.regs:
+        _WriteVarint(out, reg.flags.value)
+    for bbl in fun.bbls:
+        for bbls in (bbl.edge_in, bbl.edge_out):
+            _WriteVarint(out, len(bbls))
+            for x in bbls:
+                _WriteVarint(out, bbl_pos[x.name])
+        live_out = sorted(reg_pos[reg.name] for reg in bbl.live_out)
+        _WriteVarint(out, len(live_out))
+        for n in live_out:
+            _WriteVarint(out, n)
+    return out
+
+
+def _FunReadState(data, pos: int, strs: List[str], fun: ir.Fun,
+                  cpu_regs: Dict[str, ir.CpuReg]) -> int:
+    flags, pos = _ReadVarint(data, pos)
+    # the dominator tree and loops are not part of the state
+    fun.flags = ir.FUN_FLAG(flags) & ~ir.FUN_FLAG.LOOP_INFO_VALID
+    fun.scratch_reg_id, pos = _ReadVarint(data, pos)
+    stk_size, pos = _ReadVarint(data, pos)
+    fun.stk_size = stk_size - 1
+    lists = []
+    for _ in range(2):
+        num, pos = _ReadVarint(data, pos)
+        kinds = []
+        for _ in range(num):
+            dk, pos = _ReadVarint(data, pos)
+            kinds.append(_DK_BY_VALUE[dk])
+        lists.append(kinds)
+    fun.output_types, fun.input_types = lists
+    lists = []
+    for _ in range(3):
+        num, pos = _ReadVarint(data, pos)
+        lst = []
+        for _ in range(num):
+            name, pos = _ReadVarint(data, pos)
+            lst.append(cpu_regs[strs[name]])
+        lists.append(lst)
+    fun.cpu_live_in, fun.cpu_live_out, fun.cpu_live_clobber = lists
+    for reg in fun.regs:
+        flags, pos = _ReadVarint(data, pos)
+        reg.flags = ir.REG_FLAG(flags)
+    bbls = fun.bbls
+    for bbl in bbls:
+        for edges in (bbl.edge_in, bbl.edge_out):
+            num, pos = _ReadVarint(data, pos)
+            for _ in range(num):
+                n, pos = _ReadVarint(data, pos)
+                edges.append(bbls[n])
+        num, pos = _ReadVarint(data, pos)
+        live_out = set()
+        for _ in range(num):
+            n, pos = _ReadVarint(data, pos)
+            live_out.add(fun.regs[n])
+        bbl.live_out = live_out
+    return pos
+
+
+def FunWriteBinary(fun: ir.Fun) -> bytes:
+    """Returns a self contained binary form of a single fun
+
+    Besides the body this also covers state which is not part of the text form
+    but which later passes rely on, e.g. cfg edges, live_out sets and flags.
+    Mems and other funs are referenced by name (see FunReadBinary).
+    """
+    strs = _StringTable()
+    body = _FunWriteBinary(fun, strs)
+    state = _FunWriteState(fun, strs)
+    out = bytearray(BINARY_MAGIC)
+    table = strs.ToBytes()
+    _WriteVarint(out, len(table))
+    out += table
+    out += body
+    out += state
+    return bytes(out)
+
+
+def FunReadBinary(data, unit: ir.Unit, fun: ir.Fun,
+                  cpu_regs: Dict[str, ir.CpuReg] = {}) -> ir.Fun:
+    """Replaces the body of fun with the one produced by FunWriteBinary
+
+    Mems and funs referenced by the body are looked up in unit.
+    """
+    if data[:len(BINARY_MAGIC)] != BINARY_MAGIC:
+        raise ParseError("not a binary Cwerg fun")
+    size, pos = _ReadVarint(data, len(BINARY_MAGIC))
+    strs = str(data[pos:pos + size], "utf-8").split("\0")
+    pos += size
+    fun.reg_syms = {}
+    fun.regs = []
+    fun.reg_map = []
+    fun.bbl_syms = {}
+    fun.bbls = []
+    fun.jtb_syms = {}
+    fun.jtbs = []
+    fun.stk_syms = {}
+    # the callees of the original fun are not known here
+    fun.liveness_callees = None
+    fun.loops = []
+    pos = _FunReadBinary(data, pos, strs, unit, fun, cpu_regs)
+    pos = _FunReadState(data, pos, strs, fun, cpu_regs)
+    assert pos == len(data), f"corrupted binary for {fun.name}"
+    return fun
+
+
 def SynthesizeBenchmark(unit: ir.Unit, repeats: int):
     """Re-emits a given asm file multiple times with different prefices
 
@@ -506,12 +1028,24 @@ def SynthesizeBenchmark(unit: ir.Unit, repeats: int):
 
 
 if __name__ == "__main__":
+    import mmap
     import sys
 
+    if len(sys.argv) == 3 and sys.argv[1] == "write_binary":
+        with open(sys.argv[2], "wb") as fout:
+            fout.write(UnitWriteBinary(UnitParseFromAsm(sys.stdin)))
+        sys.exit(0)
+
+    if len(sys.argv) == 3 and sys.argv[1] == "read_binary":
+        with open(sys.argv[2], "rb") as fin:
+            with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                print("\n".join(UnitRenderToASM(UnitReadBinary(data))))
+        sys.exit(0)
+
     if len(sys.argv) == 2:
         unit = UnitParseFromAsm(sys.stdin)
         SynthesizeBenchmark(unit, int(sys.argv[1]))
-        sys.exit(1)
+        sys.exit(0)
 
     def process(fin):
         unit = UnitParseFromAsm(fin)
@@ -0,0 +1,139 @@
+#!/usr/bin/python3
+
+import io
+import unittest
+
+from Base import ir
+from Base import opcode_tab as o
+from Base import serialize
+from Util import parse
+
+_CODE = r"""
+.mem COUNTER 4 RW
+    .data 4 [0]
+
+.mem TABLE 8 RO
+    .addr.mem 8 COUNTER 4
+    .addr.fun 8 foo
+
+.fun bar SIGNATURE [F64] = [S32]
+
+.fun foo NORMAL [F64] = [S32 U64]
+.reg S32 [x y]
+.reg U32 [sel]
+.reg U64 [big]
+.reg F64 [f]
+.reg A64 [addr]
+.stk buffer 8 64
+.jtb table 4 other [0 start 2 done]
+.bbl start
+    poparg x
+    poparg big
+    mov y -7
+    add big = big 18446744073709551615
+    lea.stk addr buffer 0
+    st addr 8 = y
+    conv sel x
+    switch sel table
+.bbl other
+    mov f 1.5
+    pusharg x
+    bsr bar
+    poparg f
+    bra done
+.bbl done
+    lea.mem addr COUNTER 0
+    ld y = addr 0
+    mov f -inf
+    pusharg f
+    ret
+"""
+
+
+_LINES = [
+    "",
+    "# comment only",
+    ".bbl start  # edge_out[a  b]  live_out[x]",
+    "    add x = y 1",
+    "    ld.mem x = COUNTER 0   # trailing comment",
+    ".reg S32 [x y z]",
+    ".fun foo NORMAL [] = [S32 U64]",
+    ".jtb table 4 other [0 start 2 done]",
+    '    .data 4 "a # b [c] \\" d"',
+    '    .data 1 [1 2 "x" 4]',
+    "a ' b",
+    "a,b c",
+    "a , b",
+    "[a [b]]",
+    '"unterminated',
+]
+
+
+def _Render(unit: ir.Unit) -> str:
+    return "\n".join(serialize.UnitRenderToASM(unit))
+
+
+class TestTokenizer(unittest.TestCase):
+
+    def testMatchesReference(self):
+        for line in _LINES + [_CODE]:
+            for line in line.split("\n"):
+                try:
+                    expected = serialize.TokenizeLineReference(line)
+                except (AssertionError, ValueError) as err:
+                    self.assertRaises(type(err), parse.ParseLineWithLists, line)
+                    continue
+                self.assertEqual(expected, parse.ParseLineWithLists(line), line)
+
+    def testLists(self):
+        self.assertEqual([".reg", "S32", ["x", "y"]],
+                         parse.ParseLineWithLists(".reg S32 [x y]  # [z]\n"))
+        self.assertEqual(["add", "x", "y", "1"], parse.ParseLineWithLists("    add x=y 1\n"))
+
+
+class TestBinary(unittest.TestCase):
+
+    def testRoundTrip(self):
+        unit = serialize.UnitParseFromAsm(io.StringIO(_CODE))
+        data = serialize.UnitWriteBinary(unit)
+        self.assertEqual(_Render(unit), _Render(serialize.UnitReadBinary(data)))
+        # and the binary form is stable
+        self.assertEqual(data, serialize.UnitWriteBinary(serialize.UnitReadBinary(data)))
+
+    def testLazyDecoding(self):
+        unit = serialize.UnitParseFromAsm(io.StringIO(_CODE))
+        reader = serialize.BinaryUnitReader(serialize.UnitWriteBinary(unit))
+        foo = reader.unit.GetFun("foo")
+        self.assertEqual([o.DK.S32, o.DK.U64], foo.input_types)
+        self.assertEqual(2, len(reader.unit.mems))
+        self.assertEqual([], foo.bbls)
+        self.assertIs(foo, reader.DecodeFun(foo))
+        self.assertEqual(["start", "other", "done"], [bbl.name for bbl in foo.bbls])
+        # decoding is idempotent
+        reader.DecodeFun(foo)
+        self.assertEqual(3, len(foo.bbls))
+        self.assertEqual(_Render(unit), _Render(reader.DecodeAllFuns()))
+
+    def testCpuRegs(self):
+        code = io.StringIO(r"""
+.fun foo NORMAL [] = []
+.reg U32 [x y]
+.bbl start
+    mov x@r1 7
+    mov y@STK x
+    ret
+""")
+        cpu_regs = {"r1": ir.CpuReg("r1", 1)}
+        unit = serialize.UnitParseFromAsm(code, cpu_regs=cpu_regs)
+        data = serialize.UnitWriteBinary(unit)
+        unit2 = serialize.UnitReadBinary(data, cpu_regs)
+        self.assertEqual(_Render(unit), _Render(unit2))
+        self.assertIs(cpu_regs["r1"], unit2.GetFun("foo").GetReg("x").cpu_reg)
+        self.assertTrue(unit2.GetFun("foo").GetReg("y").IsSpilled())
+
+    def testBadMagic(self):
+        self.assertRaises(serialize.ParseError, serialize.UnitReadBinary, b"CWERG")
+
+
+if __name__ == '__main__':
+    unittest.main()
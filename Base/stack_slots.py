@@ -0,0 +1,208 @@
+"""Stack slot sharing (stack slot coloring)
+
+ir.Fun.FinalizeStackSlots gives every spilled reg and every stk its own
+stack slot. Slots whose contents are never needed at the same time can
+overlap which shrinks the stack frame.
+
+The candidates are
+* spilled regs, i.e. regs with a StackSlot as cpu_reg (x64 only)
+* stks which are only accessed via ld.stk/st.stk
+Stks whose address is taken (lea.stk, cas.stk) are live for the whole fun.
+
+A candidate is live at a point if it may be read later on and, for stks,
+if it may have been written before. A st.stk only ends the liveness
+of a stk if it overwrites the whole stk.
+Two candidates must not overlap if one of them is written by an ins while the
+other one is live after the ins or read by the same ins.
+
+Slots are placed first fit in order of decreasing size respecting
+alignment. This needs to run after fun.FinalizeStackSlots and just
+changes the offsets.
+"""
+
+from typing import List, Dict, Tuple, Any
+
+from Base import ir
+from Base import opcode_tab as o
+
+
+class _Item:
+    """A spilled reg or a stk whose slot may be shared"""
+
+    def __init__(self, name: str, size: int, alignment: int, obj: Any):
+        self.name = name
+        self.size = size
+        self.alignment = alignment
+        self.obj = obj
+        self.offset = 0
+
+    def Assign(self):
+        if isinstance(self.obj, ir.Stk):
+            self.obj.slot = self.offset
+        else:
+            self.obj.cpu_reg.offset = self.offset
+
+
+def _FunItems(fun: ir.Fun) -> List[_Item]:
+    items: List[_Item] = []
+    for reg in fun.regs:
+        if reg.IsSpilled():
+            width = reg.kind.bitwidth() // 8
+            items.append(_Item(reg.name, width, width, reg))
+    for name, stk in sorted(fun.stk_syms.items()):
+        items.append(_Item(name, stk.count, stk.alignment, stk))
+    return items
+
+
+class _InsEffects:
+    """Bit masks of the items read, written and killed by an ins"""
+
+    def __init__(self, ins: ir.Ins, bits: Dict[Any, int], stk_sizes: Dict[str, int]):
+        self.read = 0
+        self.written = 0
+        self.killed = 0
+        num_defs = ins.opcode.def_ops_count()
+        for n, op in enumerate(ins.operands):
+            if isinstance(op, ir.Reg):
+                bit = bits.get(op, 0)
+                if n < num_defs:
+                    self.written |= bit
+                    self.killed |= bit
+                else:
+                    self.read |= bit
+            elif isinstance(op, ir.Stk):
+                bit = bits.get(op.name, 0)
+                if ins.opcode is o.LD_STK:
+                    self.read |= bit
+                elif ins.opcode is o.ST_STK:
+                    self.written |= bit
+                    offset = ins.operands[1]
+                    if (isinstance(offset, ir.Const) and offset.value == 0 and
+                            ins.operands[2].kind.bitwidth() // 8 == stk_sizes[op.name]):
+                        self.killed |= bit
+
+
+def _Bits(mask: int):
+    while mask:
+        bit = mask & -mask
+        mask ^= bit
+        yield bit.bit_length() - 1
+
+
+def _FunInterference(fun: ir.Fun, items: List[_Item]) -> List[int]:
+    """Returns a bit mask of the interfering items for each item"""
+    bits: Dict[Any, int] = {}
+    reg_mask = 0
+    for n, item in enumerate(items):
+        key = item.name if isinstance(item.obj, ir.Stk) else item.obj
+        bits[key] = 1 << n
+        if not isinstance(item.obj, ir.Stk):
+            reg_mask |= 1 << n
+    stk_sizes = {name: stk.count for name, stk in fun.stk_syms.items()}
+    escaped = 0
+    for name in ir.FunEscapedStks(fun):
+        escaped |= bits[name]
+        # the escaped stks are not tracked
+        bits[name] = 0
+    effects: Dict[str, List[_InsEffects]] = {
+        bbl.name: [_InsEffects(ins, bits, stk_sizes) for ins in bbl.inss] for bbl in fun.bbls}
+
+    # forward: items which may have been written (only relevant for stks)
+    written_out: Dict[str, int] = {bbl.name: 0 for bbl in fun.bbls}
+    changed = True
+    while changed:
+        changed = False
+        for bbl in fun.bbls:
+            written = 0
+            for pred in bbl.edge_in:
+                written |= written_out[pred.name]
+            for eff in effects[bbl.name]:
+                written |= eff.written
+            if written != written_out[bbl.name]:
+                written_out[bbl.name] = written
+                changed = True
+
+    # backward: items which may be read later
+    read_in: Dict[str, int] = {bbl.name: 0 for bbl in fun.bbls}
+    changed = True
+    while changed:
+        changed = False
+        for bbl in reversed(fun.bbls):
+            read = 0
+            for succ in bbl.edge_out:
+                read |= read_in[succ.name]
+            for eff in reversed(effects[bbl.name]):
+                read = (read & ~eff.killed) | eff.read
+            if read != read_in[bbl.name]:
+                read_in[bbl.name] = read
+                changed = True
+
+    conflicts = [0] * len(items)
+    for bbl in fun.bbls:
+        # written masks after each ins
+        written = 0
+        for pred in bbl.edge_in:
+            written |= written_out[pred.name]
+        written_after = []
+        for eff in effects[bbl.name]:
+            written |= eff.written
+            written_after.append(written)
+        read = 0
+        for succ in bbl.edge_out:
+            read |= read_in[succ.name]
+        for eff, written in zip(reversed(effects[bbl.name]), reversed(written_after)):
+            if eff.written:
+                others = (read & (written | reg_mask)) | eff.read
+                for n in _Bits(eff.written):
+                    conflicts[n] |= others & ~(1 << n)
+                    for m in _Bits(others & ~(1 << n)):
+                        conflicts[m] |= 1 << n
+            read = (read & ~eff.killed) | eff.read
+    everything = (1 << len(items)) - 1
+    for n in _Bits(escaped):
+        conflicts[n] = everything & ~(1 << n)
+        for m in _Bits(conflicts[n]):
+            conflicts[m] |= 1 << n
+    return conflicts
+
+
+def _Place(item: _Item, placed: List[Tuple[int, int]]) -> int:
+    """Returns the lowest aligned offset not overlapping the placed (start, end) ranges"""
+    offset = 0
+    for start, end in sorted(placed):
+        if offset + item.size <= start:
+            break
+        if end > offset:
+            offset = (end + item.alignment - 1) // item.alignment * item.alignment
+    return offset
+
+
+def FunShareStackSlots(fun: ir.Fun) -> Tuple[int, int]:
+    """Overlaps stack slots with disjoint lifetimes
+
+    Must be called right after fun.FinalizeStackSlots.
+    Returns the stk_size before and after.
+    """
+    assert ir.FUN_FLAG.STACK_FINALIZED in fun.flags
+    before = fun.stk_size
+    items = _FunItems(fun)
+    if len(items) < 2:
+        return before, before
+    conflicts = _FunInterference(fun, items)
+    order = sorted(range(len(items)), key=lambda n: (-items[n].size, items[n].name))
+    done = 0
+    size = 0
+    for n in order:
+        item = items[n]
+        placed = []
+        for m in _Bits(done & conflicts[n]):
+            placed.append((items[m].offset, items[m].offset + items[m].size))
+        item.offset = _Place(item, placed)
+        done |= 1 << n
+        size = max(size, item.offset + item.size)
+    if size >= before:
+        return before, before
+    for item in items:
+        item.Assign()
+    fun.stk_size = size
+    return before, size
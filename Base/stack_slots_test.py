@@ -0,0 +1,102 @@
+#!/usr/bin/python3
+
+import unittest
+
+from Base import ir
+from Base import stack_slots
+from Base import testing
+
+
+def _Setup(body: str, spilled=()):
+    """Like testing.ParseFun but also puts the regs in spilled into stack slots"""
+    unit, fun = testing.ParseFun(body)
+    for name in spilled:
+        fun.reg_syms[name].cpu_reg = ir.StackSlot(0)
+    fun.FinalizeStackSlots()
+    return unit, fun
+
+
+class TestStackSlots(unittest.TestCase):
+
+    def testDisjointStks(self):
+        unit, fun = _Setup(r"""
+.fun main NORMAL [U32] = [U32]
+.reg U32 [x y]
+.stk a 4 4
+.stk b 4 4
+.stk c 4 4
+.bbl start
+    poparg x
+    st.stk a 0 = x
+    ld.stk y = a 0
+    st.stk b 0 = y
+    ld.stk x = b 0
+    st.stk c 0 = x
+    add x = x 1
+    ld.stk y = c 0
+    add x = x y
+    pusharg x
+    ret
+""")
+        self.assertEqual((12, 4), stack_slots.FunShareStackSlots(fun))
+        stks = fun.stk_syms
+        self.assertEqual([0, 0, 0], [stks[n].slot for n in "abc"])
+
+    def testOverlappingLifetimes(self):
+        unit, fun = _Setup(r"""
+.fun main NORMAL [U32] = [U32]
+.reg U32 [x y]
+.reg U64 [z]
+.stk a 4 4
+.stk b 4 4
+.stk c 8 8
+.bbl start
+    poparg x
+    st.stk a 0 = x
+    st.stk b 0 = x
+    ld.stk y = a 0
+    beq y 0 other
+.bbl loop
+    st.stk c 0 = 0:U64
+    ld.stk z = c 0
+    ld.stk y = b 0
+    blt y 10 loop
+.bbl other
+    ld.stk y = b 0
+    pusharg y
+    ret
+""")
+        # b is live throughout, a and c do not overlap
+        self.assertEqual((16, 12), stack_slots.FunShareStackSlots(fun))
+        stks = fun.stk_syms
+        self.assertEqual([0, 8, 0], [stks[n].slot for n in "abc"])
+
+    def testSpilledRegsAndEscapedStks(self):
+        unit, fun = _Setup(r"""
+.fun main NORMAL [U32] = [U32]
+.reg U32 [x y z]
+.reg A64 [p]
+.stk a 4 4
+.stk e 4 4
+.bbl start
+    poparg x
+    lea.stk p = e 0
+    mov y = x
+    add x = y 1
+    mov z = x
+    st.stk a 0 = z
+    ld.stk x = a 0
+    pusharg x
+    ret
+""", spilled=["y", "z"])
+        # e is live throughout, z is read by the st.stk writing a
+        self.assertEqual((16, 12), stack_slots.FunShareStackSlots(fun))
+        regs = fun.reg_syms
+        self.assertEqual(0, fun.stk_syms["a"].slot)
+        self.assertEqual(4, fun.stk_syms["e"].slot)
+        self.assertEqual(0, regs["y"].cpu_reg.offset)
+        self.assertEqual(8, regs["z"].cpu_reg.offset)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,25 @@
+"""Helpers shared by the *_test.py files"""
+
+import io
+from typing import List, Tuple
+
+from Base import ir
+from Base import optimize
+from Base import serialize
+
+
+def ParseFun(code: str, name: str = "main") -> Tuple[ir.Unit, ir.Fun]:
+    """Parses a unit and initializes the cfg of its fun `name`"""
+    unit = serialize.UnitParseFromAsm(io.StringIO(code))
+    fun = unit.fun_syms[name]
+    optimize.FunCfgInit(fun, unit)
+    return unit, fun
+
+
+def RenderInss(bbl: ir.Bbl) -> List[str]:
+    return [serialize.InsRenderToAsm(ins).strip() for ins in bbl.inss]
+
+
+def RenderFun(fun: ir.Fun) -> List[List[str]]:
+    """The rendered inss of each bbl of fun"""
+    return [RenderInss(bbl) for bbl in fun.bbls]
@@ -8,11 +8,16 @@ See `README.md` for more details.
 import os
 import stat
 import collections
-from typing import List, Dict
+import functools
+from typing import List, Dict, Optional, Tuple
 
 from Base import cfg
+from Base import fun_cache
+from Base import inliner
 from Base import ir
 from Base import opcode_tab as o
+from Base import optimize
+from Base import parallel
 from Base import sanity
 from Base import serialize
 
@@ -28,7 +33,8 @@ from Elf import enum_tab
 from Elf import elf_unit
 
 
-def LegalizeAll(unit: ir.Unit, opt_stats, fout, verbose=False):
+def LegalizeAll(unit: ir.Unit, opt_stats, fout, verbose=False, pm=None):
+    run = optimize.PassRunner(pm)
     seeds = [f for f in [unit.fun_syms.get("_start"),
                          unit.fun_syms.get("main")] if f]
     if seeds:
@@ -37,25 +43,43 @@ def LegalizeAll(unit: ir.Unit, opt_stats, fout, verbose=False):
         sanity.FunCheck(fun, unit, check_cfg=False, check_push_pop=True)
 
         if fun.kind is o.FUN_KIND.NORMAL:
-            legalize.PhaseOptimize(fun, unit, opt_stats, fout)
+            run("PhaseOptimize", legalize.PhaseOptimize, fun, unit, opt_stats, fout)
 
     for fun in unit.funs:
-        legalize.PhaseLegalization(fun, unit, opt_stats, fout)
+        run("PhaseLegalization", legalize.PhaseLegalization, fun, unit, opt_stats, fout)
 
 
-def RegAllocGlobal(unit: ir.Unit, opt_stats, fout, verbose=False):
+def RegAllocGlobal(unit: ir.Unit, opt_stats, fout, verbose=False, pm=None,
+                   spill_costs=False, remat=False, coalesce=False) -> Dict[str, Tuple[int, int]]:
+    """Returns the spill costs (before, after) of each fun if spill_costs is set"""
+    run = optimize.PassRunner(pm)
+    report: Dict[str, Tuple[int, int]] = {}
     for fun in unit.funs:
         sanity.FunCheck(fun, unit, check_cfg=False, check_push_pop=False)
-        legalize.PhaseGlobalRegAlloc(fun, opt_stats, fout)
+        costs = run("PhaseGlobalRegAlloc", legalize.PhaseGlobalRegAlloc, fun, opt_stats, fout,
+                    spill_costs, remat, coalesce)
+        if costs is not None:
+            report[fun.name] = costs
         if verbose:
             legalize.DumpFun("after global_reg_alloc", fun)
+    return report
 
 
-def RegAllocLocal(unit: ir.Unit, opt_stats, fout, verbose=False):
+def RegAllocLocal(unit: ir.Unit, opt_stats, fout, verbose=False, pm=None,
+                  share_stack_slots=False, remat=False,
+                  coalesce=False) -> Dict[str, Tuple[int, int]]:
+    """Returns the stack sizes (before, after) of each fun if share_stack_slots is set"""
+    run = optimize.PassRunner(pm)
+    report: Dict[str, Tuple[int, int]] = {}
     for fun in unit.funs:
-        legalize.PhaseFinalizeStackAndLocalRegAlloc(fun, opt_stats, fout)
+        sizes = run("PhaseFinalizeStackAndLocalRegAlloc",
+                    legalize.PhaseFinalizeStackAndLocalRegAlloc, fun, opt_stats, fout,
+                    share_stack_slots, remat, coalesce)
+        if sizes is not None:
+            report[fun.name] = sizes
         if verbose:
             legalize.DumpFun("after stack finalization", fun)
+    return report
 
 
 ############################################################
@@ -185,8 +209,7 @@ def codegen(unit: ir.Unit) -> Unit:
 # binary emitter
 ############################################################
 
-def EmitUnitAsBinary(unit: ir.Unit) -> elf_unit.Unit:
-    elfunit = elf_unit.Unit()
+def _EmitMemsAsBinary(unit: ir.Unit, elfunit: elf_unit.Unit):
     for mem in unit.mems:
         assert mem.kind is not o.MEM_KIND.EXTERN
         if mem.kind == o.MEM_KIND.BUILTIN:
@@ -206,72 +229,275 @@ def EmitUnitAsBinary(unit: ir.Unit) -> elf_unit.Unit:
                 assert False
         elfunit.MemEnd()
 
-    sec_text = elfunit.sec_text
+
+def _EmitFunAsBinary(fun: ir.Fun, elfunit: elf_unit.Unit):
+    elfunit.FunStart(fun.name, 16, assembler.NOP_BYTES)
+    for jtb in fun.jtbs:
+        elfunit.MemStart(jtb.name, 4, "rodata", True)
+        for i in range(jtb.size):
+            bbl = jtb.bbl_tab.get(i, jtb.def_bbl)
+            elfunit.AddBblAddr(enum_tab.RELOC_TYPE_ARM.ABS32, 4, bbl.name)
+        elfunit.MemEnd()
+
+    ctx = regs.FunComputeEmitContext(fun)
+
+    for tmpl in isel_tab.EmitFunProlog(ctx):
+        assembler.AddIns(elfunit, tmpl.MakeInsFromTmpl(None, ctx))
+
+    for bbl in fun.bbls:
+        elfunit.AddLabel(bbl.name, 4, assembler.NOP_BYTES)
+        for ins in bbl.inss:
+            if ins.opcode is o.NOP1:
+                isel_tab.HandlePseudoNop1(ins, ctx)
+            elif ins.opcode is o.LINE:
+                pass
+                # TODO: add line number support
+            elif ins.opcode is o.RET:
+                for tmpl in isel_tab.EmitFunEpilog(ctx):
+                    assembler.AddIns(elfunit,
+                                     tmpl.MakeInsFromTmpl(None, ctx))
+
+            else:
+                pattern = isel_tab.FindMatchingPattern(ins)
+                assert pattern, f"could not find pattern for\n{ins} {ins.operands}"
+                for tmpl in pattern.emit:
+                    assembler.AddIns(elfunit,
+                                     tmpl.MakeInsFromTmpl(ins, ctx))
+    elfunit.FunEnd()
+
+
+def EmitUnitAsBinary(unit: ir.Unit) -> elf_unit.Unit:
+    elfunit = elf_unit.Unit()
+    _EmitMemsAsBinary(unit, elfunit)
     for fun in unit.funs:
-        elfunit.FunStart(fun.name, 16, assembler.NOP_BYTES)
-        for jtb in fun.jtbs:
-            elfunit.MemStart(jtb.name, 4, "rodata", True)
-            for i in range(jtb.size):
-                bbl = jtb.bbl_tab.get(i, jtb.def_bbl)
-                elfunit.AddBblAddr(enum_tab.RELOC_TYPE_ARM.ABS32, 4, bbl.name)
-            elfunit.MemEnd()
-
-        ctx = regs.FunComputeEmitContext(fun)
-
-        for tmpl in isel_tab.EmitFunProlog(ctx):
-            assembler.AddIns(elfunit, tmpl.MakeInsFromTmpl(None, ctx))
-
-        for bbl in fun.bbls:
-            elfunit.AddLabel(bbl.name, 4, assembler.NOP_BYTES)
-            for ins in bbl.inss:
-                if ins.opcode is o.NOP1:
-                    isel_tab.HandlePseudoNop1(ins, ctx)
-                elif ins.opcode is o.LINE:
-                    pass
-                    # TODO: add line number support
-                elif ins.opcode is o.RET:
-                    for tmpl in isel_tab.EmitFunEpilog(ctx):
-                        assembler.AddIns(elfunit,
-                                         tmpl.MakeInsFromTmpl(None, ctx))
-
-                else:
-                    pattern = isel_tab.FindMatchingPattern(ins)
-                    assert pattern, f"could not find pattern for\n{ins} {ins.operands}"
-                    for tmpl in pattern.emit:
-                        assembler.AddIns(elfunit,
-                                         tmpl.MakeInsFromTmpl(ins, ctx))
-        elfunit.FunEnd()
+        _EmitFunAsBinary(fun, elfunit)
+    elfunit.AddLinkerDefs()
+    return elfunit
+
+
+_Signature = Tuple[List[o.DK], List[o.DK]]
+
+
+def _FunSetSignature(fun: ir.Fun, signatures: Dict[ir.Fun, _Signature], legalized: bool):
+    fun.input_types, fun.output_types = list(signatures[fun][0]), list(signatures[fun][1])
+    if legalized:
+        legalize.FunWidenSignature(fun)
+        legalize.FunSetCpuLiveInOut(fun)
+    else:
+        fun.cpu_live_in = []
+        fun.cpu_live_out = []
+
+
+def _FunSetCalleeSignatures(fun: ir.Fun, signatures: Dict[ir.Fun, _Signature],
+                            fun_nos: Dict[ir.Fun, int], limit: int):
+    """Mimics which callees have been through PhaseLegalization
+
+    The pusharg/poparg conversion consults the signatures of the callees and
+    liveness their cpu_live_in/out. When all phases run over all funs
+    (see LegalizeAll) only the funs before `limit` in unit.funs have been
+    through PhaseLegalization, which widens the signature.
+    """
+    for callee in fun_cache.FunCallees(fun):
+        _FunSetSignature(callee, signatures, fun_nos[callee] < limit)
+
+
+def _FunCodeGenAsBinaryFragment(fun: ir.Fun, unit: ir.Unit,
+                                fun_nos: Dict[ir.Fun, int],
+                                signatures: Dict[ir.Fun, _Signature],
+                                spill_costs=False, share_stack_slots=False,
+                                remat=False, coalesce=False) -> elf_unit.Unit:
+    """Runs all the phases of LegalizeAll, RegAllocGlobal and RegAllocLocal for a single fun
+
+    The result is identical to running each phase over all funs because
+    the only state of other funs that is used, their signatures and
+    cpu_live_in/out, is set up by _FunSetCalleeSignatures.
+    """
+    opt_stats: Dict[str, int] = collections.defaultdict(int)
+    # fun may have been processed as a callee before
+    _FunSetSignature(fun, signatures, False)
+    _FunSetCalleeSignatures(fun, signatures, fun_nos, 0)
+    sanity.FunCheck(fun, unit, check_cfg=False, check_push_pop=True)
+    if fun.kind is o.FUN_KIND.NORMAL:
+        legalize.PhaseOptimize(fun, unit, opt_stats, None)
+    _FunSetCalleeSignatures(fun, signatures, fun_nos, fun_nos[fun])
+    legalize.PhaseLegalization(fun, unit, opt_stats, None)
+    _FunSetCalleeSignatures(fun, signatures, fun_nos, len(fun_nos))
+    sanity.FunCheck(fun, unit, check_cfg=False, check_push_pop=False)
+    legalize.PhaseGlobalRegAlloc(fun, opt_stats, None, spill_costs, remat, coalesce)
+    legalize.PhaseFinalizeStackAndLocalRegAlloc(fun, opt_stats, None, share_stack_slots,
+                                                remat, coalesce)
+    frag = elf_unit.Unit()
+    _EmitFunAsBinary(fun, frag)
+    return frag
+
+
+def _BackendVersion() -> str:
+    return fun_cache.SourceHash([ir, legalize, assembler, elf_unit])
+
+
+def _FunCacheKey(fun: ir.Fun, fun_nos: Dict[ir.Fun, int], version: str) -> str:
+    """Covers everything _FunCodeGenAsBinaryFragment looks at outside of fun"""
+    callee_infos = []
+    for callee in fun_cache.FunCallees(fun):
+        # see _FunSetCalleeSignatures for why the relative order matters
+        callee_infos.append(f"{callee.name} {callee.kind.name} {callee.output_types} "
+                            f"{callee.input_types} {fun_nos[callee] < fun_nos[fun]}")
+    return fun_cache.FunCacheKey(fun, callee_infos, version)
+
+
+def CodeGenUnitAsBinary(unit: ir.Unit, num_workers: int,
+                        cache: Optional[fun_cache.FunCache] = None,
+                        spill_costs=False, share_stack_slots=False,
+                        remat=False, coalesce=False) -> elf_unit.Unit:
+    """Same as LegalizeAll + RegAllocGlobal + RegAllocLocal + EmitUnitAsBinary
+
+    but each fun is processed to completion independently, possibly in a
+    worker process (see parallel.UnitMapFuns), resulting in a text fragment
+    with its own local symbols and relocations. The fragments are concatenated
+    afterwards and relocated by assembler.Assemble as usual.
+    If a cache is provided only funs without an entry are processed.
+    Note, the funs in unit are not usable afterwards.
+    """
+    seeds = [f for f in [unit.fun_syms.get("_start"),
+                         unit.fun_syms.get("main")] if f]
+    if seeds:
+        cfg.UnitRemoveUnreachableCode(unit, seeds)
+    fun_nos = {fun: n for n, fun in enumerate(unit.funs)}
+    signatures = {fun: (list(fun.input_types), list(fun.output_types)) for fun in unit.funs}
+    keys: Dict[ir.Fun, str] = {}
+    entries: Dict[ir.Fun, Tuple[elf_unit.Unit, parallel.ConstMems]] = {}
+    if cache is not None:
+        version = (_BackendVersion() + (" spill_costs" if spill_costs else "") +
+                   (" share_stack_slots" if share_stack_slots else "") +
+                   (" remat" if remat else "") + (" coalesce" if coalesce else ""))
+        for fun in unit.funs:
+            keys[fun] = _FunCacheKey(fun, fun_nos, version)
+            entry = cache.Get(keys[fun])
+            if entry is not None:
+                entries[fun] = entry
+    todo = [fun for fun in unit.funs if fun not in entries]
+    # const mems are added in the order of the funs below no matter
+    # which funs came from the cache, so the result is always the same
+    mems = list(unit.mems)
+    action = functools.partial(_FunCodeGenAsBinaryFragment, fun_nos=fun_nos,
+                               signatures=signatures, spill_costs=spill_costs,
+                               share_stack_slots=share_stack_slots, remat=remat,
+                               coalesce=coalesce)
+    for fun, entry in zip(todo, parallel.UnitMapFunsWithConstMems(
+            unit, todo, action, num_workers, copy_back=False)):
+        entries[fun] = entry
+        if cache is not None:
+            cache.Put(keys[fun], entry)
+    unit.mems = mems
+    unit.mem_syms = {mem.name: mem for mem in mems}
+    frags = []
+    for fun in unit.funs:
+        frag, const_mems = entries[fun]
+        parallel.MergeConstMems(unit, const_mems)
+        frags.append(frag)
+    # the mems must go first and their number may have grown by the legalization
+    elfunit = elf_unit.Unit()
+    _EmitMemsAsBinary(unit, elfunit)
+    for frag in frags:
+        elfunit.AddFragment(frag, assembler.NOP_BYTES)
     elfunit.AddLinkerDefs()
     return elfunit
 
 
 if __name__ == "__main__":
+    import atexit
     import sys
     import argparse
 
     _ALLOWED_MODES = {"normal", "binary", "legalize", "reg_alloc_global",
                       "reg_alloc_local"}
 
+    def _PrintSpillCosts(report: Dict[str, Tuple[int, int]]):
+        for name, (before, after) in report.items():
+            print(f"# SPILL_COST {name} before: {before} after: {after}")
+        if report:
+            print(f"# SPILL_COST total before: {sum(x[0] for x in report.values())} "
+                  f"after: {sum(x[1] for x in report.values())}")
+
+    def _PrintStackSizes(report: Dict[str, Tuple[int, int]]):
+        for name, (before, after) in report.items():
+            print(f"# STACK_SIZE {name} before: {before} after: {after}")
+        if report:
+            print(f"# STACK_SIZE total before: {sum(x[0] for x in report.values())} "
+                  f"after: {sum(x[1] for x in report.values())}")
+
     def main():
         parser = argparse.ArgumentParser(description='CodeGenA32')
         parser.add_argument('-mode', type=str, help='mode')
+        parser.add_argument('-jobs', type=int, default=0,
+                            help='number of worker processes for mode binary')
+        parser.add_argument('-cache_dir', type=str, default="",
+                            help='directory for caching the code of funs in mode binary')
+        parser.add_argument('-pass_stats', type=str, default="",
+                            help='write per pass timing to this .json or .csv file '
+                                 '(not with -jobs or -cache_dir)')
+        parser.add_argument('-inline_budget', type=int, default=0,
+                            help='inline leaf funs with up to this many instructions')
+        parser.add_argument('-spill_costs', action='store_true',
+                            help='assign cpu regs to globals by loop weighted spill costs '
+                                 'and report the costs per fun (no report with -jobs)')
+        parser.add_argument('-share_stack_slots', action='store_true',
+                            help='overlap stack slots with disjoint lifetimes '
+                                 'and report the stack sizes per fun (no report with -jobs)')
+        parser.add_argument('-remat', action='store_true',
+                            help='recompute spilled regs defined by a constant at each use '
+                                 'instead of reloading them (no report with -jobs)')
+        parser.add_argument('-coalesce', action='store_true',
+                            help='prefer cpu regs that turn movs into nops '
+                                 'and report the movs removed (no report with -jobs)')
         parser.add_argument('input', type=str, help='input file')
         parser.add_argument('output', type=str, help='output file')
         args = parser.parse_args()
+        if args.pass_stats and (args.jobs or args.cache_dir):
+            # the per fun fragments are not generated via the PassManager
+            parser.error("-pass_stats cannot be combined with -jobs or -cache_dir")
 
         assert args.mode in _ALLOWED_MODES
         fin = sys.stdin if args.input == "-" else open(args.input)
 
         unit = serialize.UnitParseFromAsm(fin)
+        if args.inline_budget:
+            inline_stats = inliner.UnitInline(unit, args.inline_budget)
+            print(f"# INLINE inlined: {inline_stats['inlined']}  "
+                  f"growth: {inline_stats['inline_growth']}")
         opt_stats: Dict[str, int] = collections.defaultdict(int)
+        pm = None
+        if args.pass_stats:
+            pm = optimize.PassManager()
+            # main() has many exits
+            atexit.register(pm.Save, args.pass_stats)
 
         if args.mode == "binary":
-            # we need to legalize all functions first as this may change the signature
-            # and fills in cpu reg usage which is used by subsequent interprocedural opts.
-            LegalizeAll(unit, opt_stats, None)
-            RegAllocGlobal(unit, opt_stats, None)
-            RegAllocLocal(unit, opt_stats, None)
-            armunit = EmitUnitAsBinary(unit)
+            if args.cache_dir:
+                cache = fun_cache.FunCache(args.cache_dir)
+                armunit = CodeGenUnitAsBinary(unit, max(1, args.jobs), cache,
+                                              args.spill_costs, args.share_stack_slots,
+                                              args.remat, args.coalesce)
+                print(f"# CACHE {cache.StatsString()}")
+            elif args.jobs:
+                armunit = CodeGenUnitAsBinary(unit, args.jobs, spill_costs=args.spill_costs,
+                                              share_stack_slots=args.share_stack_slots,
+                                              remat=args.remat, coalesce=args.coalesce)
+            else:
+                # we need to legalize all functions first as this may change the signature
+                # and fills in cpu reg usage which is used by subsequent interprocedural opts.
+                LegalizeAll(unit, opt_stats, None, pm=pm)
+                _PrintSpillCosts(RegAllocGlobal(unit, opt_stats, None, pm=pm,
+                                                spill_costs=args.spill_costs, remat=args.remat,
+                                                coalesce=args.coalesce))
+                _PrintStackSizes(RegAllocLocal(unit, opt_stats, None, pm=pm,
+                                               share_stack_slots=args.share_stack_slots,
+                                               remat=args.remat, coalesce=args.coalesce))
+                if args.remat:
+                    print(f"# REMAT rematerialized: {opt_stats['remat']}")
+                if args.coalesce:
+                    print(f"# COALESCE movs removed: {opt_stats['movs_removed']}")
+                armunit = EmitUnitAsBinary(unit)
             exe = assembler.Assemble(armunit, True)
             exe.save(open(args.output, "wb"))
             os.chmod(args.output, stat.S_IREAD | stat.S_IEXEC | stat.S_IWRITE)
@@ -281,17 +507,25 @@ if __name__ == "__main__":
 
         # we need to legalize all functions first as this may change the signature
         # and fills in cpu reg usage which is used by subsequent interprocedural opts.
-        LegalizeAll(unit, opt_stats, fout)
+        LegalizeAll(unit, opt_stats, fout, pm=pm)
         if args.mode == "legalize":
             print("\n".join(serialize.UnitRenderToASM(unit)), file=fout)
             return
 
-        RegAllocGlobal(unit, opt_stats, fout)
+        _PrintSpillCosts(RegAllocGlobal(unit, opt_stats, fout, pm=pm,
+                                        spill_costs=args.spill_costs, remat=args.remat,
+                                        coalesce=args.coalesce))
         if args.mode == "reg_alloc_global":
             print("\n".join(serialize.UnitRenderToASM(unit)), file=fout)
             return
 
-        RegAllocLocal(unit, opt_stats, fout)
+        _PrintStackSizes(RegAllocLocal(unit, opt_stats, fout, pm=pm,
+                                       share_stack_slots=args.share_stack_slots,
+                                       remat=args.remat, coalesce=args.coalesce))
+        if args.remat:
+            print(f"# REMAT rematerialized: {opt_stats['remat']}")
+        if args.coalesce:
+            print(f"# COALESCE movs removed: {opt_stats['movs_removed']}")
         if args.mode == "reg_alloc_local":
             print("\n".join(serialize.UnitRenderToASM(unit)), file=fout)
             return
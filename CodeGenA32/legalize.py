@@ -12,6 +12,7 @@ from Base import reg_stats
 from Base import sanity
 from Base import optimize
 from Base import serialize
+from Base import stack_slots
 from CodeGenA32 import isel_tab
 from CodeGenA32 import regs
 
@@ -217,6 +218,23 @@ def PhaseOptimize(fun: ir.Fun, unit: ir.Unit, opt_stats: Dict[str, int], fout):
     optimize.FunOptBasic(fun, opt_stats, allow_conv_conversion=True)
 
 
+# narrow reg kinds and what they are widened to by PhaseLegalization
+_REG_WIDENINGS = [(o.DK.U8, o.DK.U32), (o.DK.S8, o.DK.S32),
+                  (o.DK.S16, o.DK.S32), (o.DK.U16, o.DK.U32)]
+
+
+def FunWidenSignature(fun: ir.Fun):
+    """Changes the signature of fun like PhaseLegalization does"""
+    for narrow_kind, wide_kind in _REG_WIDENINGS:
+        fun.input_types = [wide_kind if x == narrow_kind else x for x in fun.input_types]
+        fun.output_types = [wide_kind if x == narrow_kind else x for x in fun.output_types]
+
+
+def FunSetCpuLiveInOut(fun: ir.Fun):
+    fun.cpu_live_in = regs.PushPopInterface.GetCpuRegsForInSignature(fun.input_types)
+    fun.cpu_live_out = regs.PushPopInterface.GetCpuRegsForOutSignature(fun.output_types)
+
+
 def PhaseLegalization(fun: ir.Fun, unit: ir.Unit, _opt_stats: Dict[str, int], fout):
     """
     Does a lot of the heavily lifting so that the instruction selector can remain
@@ -228,18 +246,17 @@ def PhaseLegalization(fun: ir.Fun, unit: ir.Unit, _opt_stats: Dict[str, int], fo
 
     TODO: missing is a function to change calling signature so that
     """
+    # there are no 64 bit int regs on A32, so code from passes which need them,
+    # e.g. the div_by_const pass of the optimizer, is rejected here
+    for reg in fun.regs:
+        assert reg.kind not in {o.DK.U64, o.DK.S64}, f"64 bit reg {reg.name} in {fun.name} not supported"
     # shifts on A32 are saturating but Cwerg requires (mod <bitwidth>)
     lowering.FunLimitShiftAmounts(fun, 32)
     # lift everything to 32 bit
-    lowering.FunRegWidthWidening(fun, o.DK.U8, o.DK.U32)
-    lowering.FunRegWidthWidening(fun, o.DK.S8, o.DK.S32)
-    lowering.FunRegWidthWidening(fun, o.DK.S16, o.DK.S32)
-    lowering.FunRegWidthWidening(fun, o.DK.U16, o.DK.U32)
-
-    fun.cpu_live_in = regs.PushPopInterface.GetCpuRegsForInSignature(
-        fun.input_types)
-    fun.cpu_live_out = regs.PushPopInterface.GetCpuRegsForOutSignature(
-        fun.output_types)
+    for narrow_kind, wide_kind in _REG_WIDENINGS:
+        lowering.FunRegWidthWidening(fun, narrow_kind, wide_kind)
+
+    FunSetCpuLiveInOut(fun)
     if fun.kind is not o.FUN_KIND.NORMAL:
         return
     # replaces pusharg and poparg instructions and replace them with moves
@@ -279,7 +296,7 @@ def PhaseLegalization(fun: ir.Fun, unit: ir.Unit, _opt_stats: Dict[str, int], fo
 
 def GlobalRegAllocOneKind(fun: ir.Fun, kinds: Set[regs.CpuRegKind], needed: RegsNeeded, cpu_regs_lac,
                           cpu_regs_not_lac, cpu_regs_lac_mask, global_regs_lac, global_regs_not_lac,
-                          debug) -> List[ir.Reg]:
+                          debug, hints=None) -> List[ir.Reg]:
     pre_allocated = 0
     for reg in fun.regs:
         if reg.HasCpuReg() and reg.cpu_reg.kind in kinds:
@@ -296,14 +313,16 @@ def GlobalRegAllocOneKind(fun: ir.Fun, kinds: Set[regs.CpuRegKind], needed: Regs
         print(
             f"@@ {kind_name} POOL {global_lac_pool:x} {global_not_lac_pool:x}", file=debug)
 
-    return (regs.AssignCpuRegOrMarkForSpilling(global_regs_lac, global_lac_pool, 0) +
+    return (regs.AssignCpuRegOrMarkForSpilling(global_regs_lac, global_lac_pool, 0, hints) +
             regs.AssignCpuRegOrMarkForSpilling(
                 global_regs_not_lac,
                 global_not_lac_pool & ~cpu_regs_lac_mask,
-                global_not_lac_pool & cpu_regs_lac_mask))
+                global_not_lac_pool & cpu_regs_lac_mask, hints))
 
 
-def PhaseGlobalRegAlloc(fun: ir.Fun, _opt_stats: Dict[str, int], fout):
+def PhaseGlobalRegAlloc(fun: ir.Fun, opt_stats: Dict[str, int], fout,
+                        spill_costs=False, remat=False,
+                        coalesce=False) -> Optional[Tuple[int, int]]:
     """
     These phase introduces CpuReg for globals and situations where we have no choice
     which register to use, e.g. function parameters and results ("pre-allocated" regs).
@@ -320,6 +339,18 @@ def PhaseGlobalRegAlloc(fun: ir.Fun, _opt_stats: Dict[str, int], fout):
     We separate global from local register allocation so that we can use a straight
     forward linear scan allocator for the locals. This allocator assumes that
     each register is defined exactly once and hence does not work for globals.
+
+    spill_costs hands out the cpu regs in the order of the loop weighted spill costs
+    (see reg_stats.GlobalRegSpillCosts) and returns the cost of the spilled globals
+    for the default order and for the spill cost order.
+
+    remat repeats the def of spilled globals defined by a single constant mov, lea.mem
+    or lea.fun at each use instead of storing and loading them
+    (see reg_alloc.FunRematerializableDefs).
+
+    coalesce lets a global share the cpu reg of a global or pre-allocated reg it is
+    connected to by a mov if the two do not interfere (see reg_alloc.GlobalMoveHints)
+    so that the mov can be removed after allocation.
     """
 
     if fout:
@@ -334,7 +365,7 @@ def PhaseGlobalRegAlloc(fun: ir.Fun, _opt_stats: Dict[str, int], fout):
 
     reg_stats.FunComputeRegStatsExceptLAC(fun)
     reg_stats.FunDropUnreferencedRegs(fun)
-    liveness.FunComputeLivenessInfo(fun)
+    liveness.FunEnsureLivenessInfo(fun)
     reg_stats.FunComputeRegStatsLAC(fun)
 
     # Note: REG_KIND_MAP_ARM maps all non-float to registers to S32
@@ -342,6 +373,13 @@ def PhaseGlobalRegAlloc(fun: ir.Fun, _opt_stats: Dict[str, int], fout):
         fun, REG_KIND_TO_CPU_KIND)
     #
     global_reg_stats = reg_stats.FunGlobalRegStats(fun, REG_KIND_TO_CPU_KIND)
+    costs = reg_stats.GlobalRegSpillCosts(fun, global_reg_stats) if spill_costs else None
+    hints = None
+    if coalesce:
+        hints = reg_alloc.GlobalMoveHints(
+            fun, [reg for global_regs in global_reg_stats.values() for reg in global_regs],
+            set(r for r in regs.GPR_REGS if regs.A32RegToAllocMask(r) & regs.GPR_REGS_MASK) |
+            set(regs.FLT_REGS + regs.DBL_REGS), regs.CpuRegsOverlap)
     DumpRegStats(fun, local_reg_stats, fout)
 
     debug = None
@@ -360,7 +398,7 @@ def PhaseGlobalRegAlloc(fun: ir.Fun, _opt_stats: Dict[str, int], fout):
                                                             regs.CpuRegKind.GPR, True)],
                                                         global_reg_stats[(
                                                             regs.CpuRegKind.GPR, False)],
-                                                        debug)
+                                                        debug, hints)
 
     needed_flt = RegsNeeded(len(global_reg_stats[(regs.CpuRegKind.FLT, True)]) + 2 *
                             len(global_reg_stats[(regs.CpuRegKind.DBL, True)]),
@@ -382,21 +420,43 @@ def PhaseGlobalRegAlloc(fun: ir.Fun, _opt_stats: Dict[str, int], fout):
                                            global_reg_stats[(regs.CpuRegKind.FLT, False)] +
                                            global_reg_stats[(
                                                regs.CpuRegKind.DBL, False)],
-                                           debug)
-
-    reg_alloc.FunSpillRegs(fun, o.DK.U32, to_be_spilled, prefix="$gspill")
+                                           debug, hints)
+
+    report = None if costs is None else costs.Report()
+    remat_defs = {}
+    if remat:
+        remat_defs = reg_alloc.FunRematerializableDefs(fun, to_be_spilled)
+        opt_stats["remat"] += len(remat_defs)
+    reg_alloc.FunSpillRegs(fun, o.DK.U32, to_be_spilled, prefix="$gspill", remat=remat_defs)
+    # cpu reg assignments change the liveness at calls
+    fun.InvalidateAnalyses()
+    if report is None:
+        return None
+    before, after = report
+    opt_stats["spill_cost_before"] += before
+    opt_stats["spill_cost_after"] += after
+    return report
 
 
 def PhaseFinalizeStackAndLocalRegAlloc(fun: ir.Fun,
-                                       _opt_stats: Dict[str, int], fout):
+                                       opt_stats: Dict[str, int], fout,
+                                       share_stack_slots=False,
+                                       remat=False,
+                                       coalesce=False) -> Optional[Tuple[int, int]]:
     """Finalizing the stack implies performing all transformations that
     could increase register usage.
 
+    If share_stack_slots is set, stack slots with disjoint lifetimes are overlapped
+    and the stack size (before, after) is returned.
+    remat is the same as for PhaseGlobalRegAlloc but for the spilled locals.
+    coalesce makes the local allocator prefer the cpu regs of mov sources and
+    destinations (see reg_alloc.LocalMoveHints) and counts the movs removed.
+
     """
     # Recompute Everything (TODO: make this more selective)
     reg_stats.FunComputeRegStatsExceptLAC(fun)
     reg_stats.FunDropUnreferencedRegs(fun)
-    liveness.FunComputeLivenessInfo(fun)
+    liveness.FunEnsureLivenessInfo(fun)
     reg_stats.FunComputeRegStatsLAC(fun)
     # establish per bbl SSA form by splitting liveranges
     # TODO:
@@ -408,7 +468,15 @@ def PhaseFinalizeStackAndLocalRegAlloc(fun: ir.Fun,
     # use as a scratch for the instruction immediately following the nop
     isel_tab.FunAddNop1ForCodeSel(fun)
     
-    regs.FunLocalRegAlloc(fun)
+    opt_stats["remat"] += regs.FunLocalRegAlloc(fun, remat, coalesce)
     fun.FinalizeStackSlots()
+    sizes = None
+    if share_stack_slots:
+        sizes = stack_slots.FunShareStackSlots(fun)
+        opt_stats["stack_size_before"] += sizes[0]
+        opt_stats["stack_size_after"] += sizes[1]
     # cleanup
-    FunMoveEliminationCpu(fun)
+    movs_removed = FunMoveEliminationCpu(fun)
+    if coalesce:
+        opt_stats["movs_removed"] += movs_removed
+    return sizes
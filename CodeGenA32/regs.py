@@ -52,6 +52,13 @@ def A32RegsToAllocMask(regs: List[ir.CpuReg]) -> int:
                             (A32RegToAllocMask(r) for r in regs), 0)
 
 
+def CpuRegsOverlap(a: ir.CpuReg, b: ir.CpuReg) -> bool:
+    """Whether the two regs share storage, e.g. d1 and s3"""
+    if (a.kind is CpuRegKind.GPR) != (b.kind is CpuRegKind.GPR):
+        return False
+    return (A32RegToAllocMask(a) & A32RegToAllocMask(b)) != 0
+
+
 def RenderMaskGPR(mask: int) -> str:
     out = []
     for i, name in enumerate(_GPR_REG_NAMES):
@@ -148,11 +155,13 @@ class CpuRegPool(reg_alloc.RegPool):
 
     def __init__(self, fun: ir.Fun, bbl: ir.Bbl, allow_spilling,
                  gpr_available_lac: int, gpr_available_not_lac: int, flt_available_lac: int,
-                 flt_available_not_lac: int):
+                 flt_available_not_lac: int,
+                 move_hints: Optional[reg_alloc.LocalMoveHints] = None):
         super(CpuRegPool, self).__init__()
         self._fun = fun
         self._bbl = bbl
         self._allow_spilling = allow_spilling
+        self._move_hints = move_hints
 
         # set of registers that are ready to be allocated subject to the
         # reserved regions below. Should use an ordered set here?
@@ -218,13 +227,19 @@ class CpuRegPool(reg_alloc.RegPool):
             self._flt_reserved[cpu_reg.no * 2].current = 0
             self._flt_reserved[cpu_reg.no * 2 + 1].current = 0
 
+    def _candidates(self, lr: reg_alloc.LiveRange, kind: CpuRegKind, count: int):
+        """The cpu reg numbers to try in order, coalescing hints first"""
+        if self._move_hints is None:
+            return range(count)
+        return self._move_hints.Order(lr, kind, count)
+
     def get_available_reg(self, lr: reg_alloc.LiveRange) -> ir.CpuReg:
         lac = liveness.LiveRangeFlag.LAC in lr.flags
         is_gpr = lr.reg.kind.flavor() != o.DK_FLAVOR_F
         available = self.get_available(lac, is_gpr)
         # print(f"GET {lr} {self}  avail:{available:x}")
         if lr.reg.kind == o.DK.F64:
-            for n in range(len(DBL_REGS)):
+            for n in self._candidates(lr, CpuRegKind.DBL, len(DBL_REGS)):
                 mask = 3 << (n * 2)  # two adjacent bit at an even bit pos
                 if available & mask == mask:
                     if (not self._flt_reserved[n * 2 + 0].has_conflict(lr) and
@@ -232,14 +247,14 @@ class CpuRegPool(reg_alloc.RegPool):
                         self.set_available(lac, is_gpr, available & ~mask)
                         return DBL_REGS[n]
         elif lr.reg.kind == o.DK.F32:
-            for n in range(len(FLT_REGS)):
+            for n in self._candidates(lr, CpuRegKind.FLT, len(FLT_REGS)):
                 mask = 1 << n
                 if available & mask == mask:
                     if not self._flt_reserved[n].has_conflict(lr):
                         self.set_available(lac, is_gpr, available & ~mask)
                         return FLT_REGS[n]
         else:
-            for n in range(len(GPR_REGS)):
+            for n in self._candidates(lr, CpuRegKind.GPR, len(GPR_REGS)):
                 mask = 1 << n
                 if mask & available == mask:
                     if not self._gpr_reserved[n].has_conflict(lr):
@@ -279,10 +294,11 @@ class CpuRegPool(reg_alloc.RegPool):
 def _RunLinearScan(bbl: ir.Bbl, fun: ir.Fun, live_ranges: List[liveness.LiveRange], allow_spilling,
                    gpr_regs_lac: int, gpr_regs_not_lac: int,
                    flt_regs_lac: int,
-                   flt_regs_not_lac: int):
+                   flt_regs_not_lac: int, coalesce=False):
     # print("\n".join(serialize.BblRenderToAsm(bbl)))
+    move_hints = reg_alloc.LocalMoveHints(bbl, live_ranges) if coalesce else None
     pool = CpuRegPool(fun, bbl, allow_spilling,
-                      gpr_regs_lac, gpr_regs_not_lac, flt_regs_lac, flt_regs_not_lac)
+                      gpr_regs_lac, gpr_regs_not_lac, flt_regs_lac, flt_regs_not_lac, move_hints)
     for lr in live_ranges:
         # since we are operating on a BBL we cannot change LiveRanges
         # extending beyond the BBL.
@@ -355,10 +371,13 @@ def _ComputeRegReserve(spilled_regs: List[ir.Reg], gpr_regs_not_lac, flt_regs_no
     return new_gpr_regs_not_lac, new_flt_regs_not_lac
 
 
-def _BblRegAllocOrSpill(bbl: ir.Bbl, fun: ir.Fun) -> int:
+def _BblRegAllocOrSpill(bbl: ir.Bbl, fun: ir.Fun, remat=False, coalesce=False) -> int:
     """Allocates regs to the intra bbl live ranges
 
     Note, this runs after global register allocation has occurred
+    If remat is set, spilled regs defined by a constant are rematerialized
+    at each use. Returns the number of rematerialized regs.
+    If coalesce is set, the allocator prefers cpu regs which turn movs into nops.
     """
     # print ("\n".join(serialize.BblRenderToAsm(bbl)))
 
@@ -385,11 +404,15 @@ def _BblRegAllocOrSpill(bbl: ir.Bbl, fun: ir.Fun) -> int:
 
     _RunLinearScan(bbl, fun, live_ranges, True,
                    GPR_REGS_MASK & GPR_LAC_REGS_MASK, GPR_REGS_MASK & ~GPR_LAC_REGS_MASK,
-                   FLT_REGS_MASK & FLT_LAC_REGS_MASK, FLT_REGS_MASK & ~FLT_LAC_REGS_MASK)
+                   FLT_REGS_MASK & FLT_LAC_REGS_MASK, FLT_REGS_MASK & ~FLT_LAC_REGS_MASK,
+                   coalesce)
     spilled_regs = _AssignAllocatedRegsAndReturnSpilledRegs(live_ranges)
+    remat_defs = {}
     if spilled_regs:
         # print (f"@@ adjusted spill count: {len(spilled_regs)} {spilled_regs}")
-        reg_alloc.BblSpillRegs(bbl, fun, spilled_regs, o.DK.U32, "$spill")
+        if remat:
+            remat_defs = reg_alloc.BblRematerializableDefs(bbl, spilled_regs)
+        reg_alloc.BblSpillRegs(bbl, fun, spilled_regs, o.DK.U32, "$spill", remat_defs)
 
         live_ranges = liveness.BblGetLiveRanges(bbl, fun, bbl.live_out)
         live_ranges.sort()
@@ -403,10 +426,11 @@ def _BblRegAllocOrSpill(bbl: ir.Bbl, fun: ir.Fun) -> int:
                 lr.cpu_reg = lr.reg.cpu_reg
         _RunLinearScan(bbl, fun, live_ranges, False,
                        GPR_REGS_MASK & GPR_LAC_REGS_MASK, GPR_REGS_MASK & ~GPR_LAC_REGS_MASK,
-                       FLT_REGS_MASK & FLT_LAC_REGS_MASK, FLT_REGS_MASK & ~FLT_LAC_REGS_MASK)
+                       FLT_REGS_MASK & FLT_LAC_REGS_MASK, FLT_REGS_MASK & ~FLT_LAC_REGS_MASK,
+                       coalesce)
         spilled_regs = _AssignAllocatedRegsAndReturnSpilledRegs(live_ranges)
         assert not spilled_regs
-    return 0
+    return len(remat_defs)
     # assert False
 
     # for reg
@@ -419,15 +443,17 @@ def _BblRegAllocOrSpill(bbl: ir.Bbl, fun: ir.Fun) -> int:
     # return count
 
 
-def FunLocalRegAlloc(fun):
-    return ir.FunGenericRewriteBbl(fun, _BblRegAllocOrSpill)
+def FunLocalRegAlloc(fun, remat=False, coalesce=False):
+    return ir.FunGenericRewriteBbl(fun, _BblRegAllocOrSpill, remat=remat, coalesce=coalesce)
 
 
 def AssignCpuRegOrMarkForSpilling(assign_to: List[ir.Reg],
                                   cpu_reg_mask_first_choice: int,
-                                  cpu_reg_mask_second_choice: int) -> List[ir.Reg]:
+                                  cpu_reg_mask_second_choice: int,
+                                  hints: Optional[reg_alloc.GlobalMoveHints] = None) -> List[ir.Reg]:
     """
     Returns the regs that could not be assigned.
+    If hints are provided, a reg may share the cpu reg of a mov related reg.
     Each invocation is for one register family (GPR or FLT)
     If used with family FLT, make sure the F64 regs precede the F32 regs
 
@@ -437,6 +463,12 @@ def AssignCpuRegOrMarkForSpilling(assign_to: List[ir.Reg],
     mask = cpu_reg_mask_first_choice
     pos = 0
     for reg in assign_to:
+        if hints is not None:
+            cpu_reg = hints.CpuReg(reg)
+            if cpu_reg is not None:
+                # shared with a mov related reg, does not use up a cpu reg
+                reg.cpu_reg = cpu_reg
+                continue
         if mask == 0 and cpu_reg_mask_second_choice != 0:
             mask = cpu_reg_mask_second_choice
             cpu_reg_mask_second_choice = 0
@@ -0,0 +1,68 @@
+# tail_call
+# the recursion is too deep for the stack unless the calls become jumps
+
+.fun count_down NORMAL [U32] = [U32 U32]
+.reg U32 [n acc r]
+.bbl start
+    poparg n
+    poparg acc
+    beq n 0 done
+    sub n = n 1
+    add acc = acc 3
+    pusharg acc
+    pusharg n
+    bsr count_down
+    poparg r
+    pusharg r
+    ret
+.bbl done
+    pusharg acc
+    ret
+
+# mutual recursion, the jumps go to another fun
+.fun is_even NORMAL [U32] = [U32]
+.reg U32 [n r]
+.bbl start
+    poparg n
+    beq n 0 done
+    sub n = n 1
+    pusharg n
+    bsr is_odd
+    poparg r
+    pusharg r
+    ret
+.bbl done
+    pusharg 1:U32
+    ret
+
+.fun is_odd NORMAL [U32] = [U32]
+.reg U32 [n r]
+.bbl start
+    poparg n
+    beq n 0 done
+    sub n = n 1
+    pusharg n
+    bsr is_even
+    poparg r
+    pusharg r
+    ret
+.bbl done
+    pusharg 0:U32
+    ret
+
+.fun main NORMAL [S32] = []
+.reg U32 [x]
+.bbl start
+    pusharg 0:U32
+    pusharg 10000000:U32
+    bsr count_down
+    poparg x
+    pusharg x
+    bsr print_u_ln
+    pusharg 10000001:U32
+    bsr is_even
+    poparg x
+    pusharg x
+    bsr print_u_ln
+    pusharg 0:S32
+    ret
@@ -248,7 +248,11 @@ def _HandleReloc(cpuins: a64.Ins, pos: int, ins: ir.Ins, op: PARAM):
         fun = ins.operands[0]
         assert isinstance(fun, ir.Fun), f"{ins} {fun}"
         assert fun.kind is not o.FUN_KIND.EXTERN, f"undefined fun: {fun.name}"
-        cpuins.set_reloc(_OP_TO_RELOC_KIND[op], False, pos, fun.name)
+        kind = _OP_TO_RELOC_KIND[op]
+        if cpuins.opcode.name == "b":
+            # tail call (see EmitFunTailCall)
+            kind = enum_tab.RELOC_TYPE_AARCH64.JUMP26
+        cpuins.set_reloc(kind, False, pos, fun.name)
     elif op in {PARAM.mem1_num2_prel_hi21, PARAM.mem1_num2_lo12}:
         mem = ins.operands[1]
         assert isinstance(mem, ir.Mem), f"{ins} {mem}"
@@ -476,6 +480,14 @@ def EmitFunEpilog(ctx: regs.EmitContext) -> List[InsTmpl]:
     return out
 
 
+def EmitFunTailCall(ctx: regs.EmitContext) -> List[InsTmpl]:
+    """Like EmitFunEpilog but branches to the callee (bsr) instead of returning"""
+    out = EmitFunEpilog(ctx)
+    assert out[-1].opcode.name == "ret"
+    out[-1] = InsTmpl("b", [PARAM.fun0])
+    return out
+
+
 def HandlePseudoNop1(ins: ir.Ins, ctx: regs.EmitContext):
     """This does not emit any code but copies the register assigned to the nop into the ctx
 
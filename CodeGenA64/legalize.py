@@ -12,6 +12,7 @@ from Base import reg_stats
 from Base import sanity
 from Base import optimize
 from Base import serialize
+from Base import stack_slots
 from CodeGenA64 import isel_tab
 from CodeGenA64 import regs
 
@@ -195,6 +196,11 @@ def _GetRegPoolsForGlobals(needed: RegsNeeded, regs_lac: int,
     return global_lac, global_not_lac
 
 
+# narrow reg kinds and what they are widened to by PhaseLegalizationStep1
+_REG_WIDENINGS = [(o.DK.U8, o.DK.U32), (o.DK.S8, o.DK.S32),
+                  (o.DK.S16, o.DK.S32), (o.DK.U16, o.DK.U32)]
+
+
 def PhaseOptimize(fun: ir.Fun, unit: ir.Unit, opt_stats: Dict[str, int], fout):
     optimize.FunCfgInit(fun, unit)
     optimize.FunOptBasic(fun, opt_stats, allow_conv_conversion=True)
@@ -207,10 +213,20 @@ def PhaseLegalizationStep1(fun: ir.Fun, unit: ir.Unit, _opt_stats: Dict[str, int
     topological order. If we do not do this ahead of time a call
     might processed seeing the wrong parameter types for the callee.
     """
-    lowering.FunRegWidthWidening(fun, o.DK.U8, o.DK.U32)
-    lowering.FunRegWidthWidening(fun, o.DK.S8, o.DK.S32)
-    lowering.FunRegWidthWidening(fun, o.DK.S16, o.DK.S32)
-    lowering.FunRegWidthWidening(fun, o.DK.U16, o.DK.U32)
+    for narrow_kind, wide_kind in _REG_WIDENINGS:
+        lowering.FunRegWidthWidening(fun, narrow_kind, wide_kind)
+
+
+def FunWidenSignature(fun: ir.Fun):
+    """Changes the signature of fun like PhaseLegalizationStep1 does"""
+    for narrow_kind, wide_kind in _REG_WIDENINGS:
+        fun.input_types = [wide_kind if x == narrow_kind else x for x in fun.input_types]
+        fun.output_types = [wide_kind if x == narrow_kind else x for x in fun.output_types]
+
+
+def FunSetCpuLiveInOut(fun: ir.Fun):
+    fun.cpu_live_in = regs.PushPopInterface.GetCpuRegsForInSignature(fun.input_types)
+    fun.cpu_live_out = regs.PushPopInterface.GetCpuRegsForOutSignature(fun.output_types)
 
 
 def PhaseLegalizationStep2(fun: ir.Fun, unit: ir.Unit, _opt_stats: Dict[str, int], fout):
@@ -224,10 +240,7 @@ def PhaseLegalizationStep2(fun: ir.Fun, unit: ir.Unit, _opt_stats: Dict[str, int
 
     TODO: missing is a function to change calling signature so that
     """
-    fun.cpu_live_in = regs.PushPopInterface.GetCpuRegsForInSignature(
-        fun.input_types)
-    fun.cpu_live_out = regs.PushPopInterface.GetCpuRegsForOutSignature(
-        fun.output_types)
+    FunSetCpuLiveInOut(fun)
     if fun.kind is not o.FUN_KIND.NORMAL:
         return
 
@@ -262,7 +275,8 @@ def PhaseLegalizationStep2(fun: ir.Fun, unit: ir.Unit, _opt_stats: Dict[str, int
 
 
 def GlobalRegAllocOneKind(fun: ir.Fun, kind: regs.CpuRegKind, needed: RegsNeeded, regs_lac,
-                          regs_not_lac, regs_lac_mask, global_reg_stats, debug) -> List[ir.Reg]:
+                          regs_not_lac, regs_lac_mask, global_reg_stats, debug,
+                          hints=None) -> List[ir.Reg]:
     pre_allocated = 0
     for reg in fun.regs:
         if reg.HasCpuReg() and reg.cpu_reg.kind == kind:
@@ -277,14 +291,17 @@ def GlobalRegAllocOneKind(fun: ir.Fun, kind: regs.CpuRegKind, needed: RegsNeeded
     if debug:
         print(f"@@ {kind.name} POOL {global_lac:x} {global_not_lac:x}", file=debug)
 
-    return (regs.AssignCpuRegOrMarkForSpilling(global_reg_stats[(kind, True)], global_lac, 0) +
+    return (regs.AssignCpuRegOrMarkForSpilling(global_reg_stats[(kind, True)], global_lac, 0,
+                                               hints) +
             regs.AssignCpuRegOrMarkForSpilling(
                 global_reg_stats[(kind, False)],
                 global_not_lac & ~regs_lac_mask,
-                global_not_lac & regs_lac_mask))
+                global_not_lac & regs_lac_mask, hints))
 
 
-def PhaseGlobalRegAlloc(fun: ir.Fun, _opt_stats: Dict[str, int], fout):
+def PhaseGlobalRegAlloc(fun: ir.Fun, opt_stats: Dict[str, int], fout,
+                        spill_costs=False, remat=False,
+                        coalesce=False) -> Optional[Tuple[int, int]]:
     """
     These phase introduces CpuReg for globals and situations where we have no choice
     which register to use, e.g. function parameters and results ("pre-allocated" regs).
@@ -301,6 +318,18 @@ def PhaseGlobalRegAlloc(fun: ir.Fun, _opt_stats: Dict[str, int], fout):
     We separate global from local register allocation so that we can use a straight
     forward linear scan allocator for the locals. This allocator assumes that
     each register is defined exactly once and hence does not work for globals.
+
+    spill_costs hands out the cpu regs in the order of the loop weighted spill costs
+    (see reg_stats.GlobalRegSpillCosts) and returns the cost of the spilled globals
+    for the default order and for the spill cost order.
+
+    remat repeats the def of spilled globals defined by a single constant mov, lea.mem
+    or lea.fun at each use instead of storing and loading them
+    (see reg_alloc.FunRematerializableDefs).
+
+    coalesce lets a global share the cpu reg of a global or pre-allocated reg it is
+    connected to by a mov if the two do not interfere (see reg_alloc.GlobalMoveHints)
+    so that the mov can be removed after allocation.
     """
     debug = None
     if fout:
@@ -312,7 +341,7 @@ def PhaseGlobalRegAlloc(fun: ir.Fun, _opt_stats: Dict[str, int], fout):
 
     reg_stats.FunComputeRegStatsExceptLAC(fun)
     reg_stats.FunDropUnreferencedRegs(fun)
-    liveness.FunComputeLivenessInfo(fun)
+    liveness.FunEnsureLivenessInfo(fun)
     reg_stats.FunComputeRegStatsLAC(fun)
 
     # Note: REG_KIND_MAP_ARM maps all non-float to registers to S64
@@ -321,6 +350,13 @@ def PhaseGlobalRegAlloc(fun: ir.Fun, _opt_stats: Dict[str, int], fout):
     # we  have introduced some cpu regs in previous phases - do not treat them as globals
     global_reg_stats = reg_stats.FunGlobalRegStats(
         fun, regs.REG_KIND_TO_CPU_REG_FAMILY)
+    costs = reg_stats.GlobalRegSpillCosts(fun, global_reg_stats) if spill_costs else None
+    hints = None
+    if coalesce:
+        hints = reg_alloc.GlobalMoveHints(
+            fun, [reg for global_regs in global_reg_stats.values() for reg in global_regs],
+            set(regs.MaskToGpr64Regs(regs.GPR_REGS_MASK) +
+                regs.MaskToFlt64Regs(regs.FLT_REGS_MASK)))
     DumpRegStats(fun, local_reg_stats, fout)
 
     # Handle GPR regs
@@ -334,7 +370,7 @@ def PhaseGlobalRegAlloc(fun: ir.Fun, _opt_stats: Dict[str, int], fout):
     to_be_spilled = GlobalRegAllocOneKind(fun, regs.CpuRegKind.GPR, needed_gpr,
                                           regs.GPR_REGS_MASK & regs.GPR_LAC_REGS_MASK,
                                           regs.GPR_REGS_MASK & ~regs.GPR_LAC_REGS_MASK,
-                                          regs.GPR_LAC_REGS_MASK, global_reg_stats, debug)
+                                          regs.GPR_LAC_REGS_MASK, global_reg_stats, debug, hints)
 
     # Handle Float regs
     needed_flt = RegsNeeded(len(global_reg_stats[(regs.CpuRegKind.FLT, True)]),
@@ -347,16 +383,38 @@ def PhaseGlobalRegAlloc(fun: ir.Fun, _opt_stats: Dict[str, int], fout):
     to_be_spilled += GlobalRegAllocOneKind(fun, regs.CpuRegKind.FLT, needed_flt,
                                            regs.FLT_REGS_MASK & regs.FLT_LAC_REGS_MASK,
                                            regs.FLT_REGS_MASK & ~regs.FLT_LAC_REGS_MASK,
-                                           regs.FLT_LAC_REGS_MASK, global_reg_stats, debug)
-
-    reg_alloc.FunSpillRegs(fun, o.DK.U32, to_be_spilled, prefix="$gspill")
+                                           regs.FLT_LAC_REGS_MASK, global_reg_stats, debug, hints)
+
+    report = None if costs is None else costs.Report()
+    remat_defs = {}
+    if remat:
+        remat_defs = reg_alloc.FunRematerializableDefs(fun, to_be_spilled)
+        opt_stats["remat"] += len(remat_defs)
+    reg_alloc.FunSpillRegs(fun, o.DK.U32, to_be_spilled, prefix="$gspill", remat=remat_defs)
+    # cpu reg assignments change the liveness at calls
+    fun.InvalidateAnalyses()
+    if report is None:
+        return None
+    before, after = report
+    opt_stats["spill_cost_before"] += before
+    opt_stats["spill_cost_after"] += after
+    return report
 
 
 def PhaseFinalizeStackAndLocalRegAlloc(fun: ir.Fun,
-                                       _opt_stats: Dict[str, int], fout):
+                                       opt_stats: Dict[str, int], fout,
+                                       share_stack_slots=False,
+                                       remat=False,
+                                       coalesce=False) -> Optional[Tuple[int, int]]:
     """Finalizing the stack implies performing all transformations that
     could increase register usage.
 
+    If share_stack_slots is set, stack slots with disjoint lifetimes are overlapped
+    and the stack size (before, after) is returned.
+    remat is the same as for PhaseGlobalRegAlloc but for the spilled locals.
+    coalesce makes the local allocator prefer the cpu regs of mov sources and
+    destinations (see reg_alloc.LocalMoveHints) and counts the movs removed.
+
     """
     # print("@@@@@@\n", "\n".join(serialize.FunRenderToAsm(fun)), file=fout)
 
@@ -374,15 +432,23 @@ def PhaseFinalizeStackAndLocalRegAlloc(fun: ir.Fun,
     # Recompute Everything (TODO: make this more selective to reduce work)
     reg_stats.FunComputeRegStatsExceptLAC(fun)
     reg_stats.FunDropUnreferencedRegs(fun)
-    liveness.FunComputeLivenessInfo(fun)
+    liveness.FunEnsureLivenessInfo(fun)
     reg_stats.FunComputeRegStatsLAC(fun)
     reg_stats.FunSeparateLocalRegUsage(fun)
     # DumpRegStats(fun, local_reg_stats)
 
     isel_tab.FunAddNop1ForCodeSel(fun)
 
-    regs.FunLocalRegAlloc(fun)
+    opt_stats["remat"] += regs.FunLocalRegAlloc(fun, remat, coalesce)
     fun.FinalizeStackSlots()
+    sizes = None
+    if share_stack_slots:
+        sizes = stack_slots.FunShareStackSlots(fun)
+        opt_stats["stack_size_before"] += sizes[0]
+        opt_stats["stack_size_after"] += sizes[1]
     # cleanup
-    _FunMoveEliminationCpu(fun)
+    movs_removed = _FunMoveEliminationCpu(fun)
+    if coalesce:
+        opt_stats["movs_removed"] += movs_removed
     # print ("@@@@@@\n", "\n".join(serialize.FunRenderToAsm(fun)))
+    return sizes
@@ -143,11 +143,13 @@ class CpuRegPool(reg_alloc.RegPool):
 
     def __init__(self, fun: ir.Fun, bbl: ir.Bbl, allow_spilling,
                  gpr_available_lac: int, gpr_available_not_lac: int, flt_available_lac: int,
-                 flt_available_not_lac: int):
+                 flt_available_not_lac: int,
+                 move_hints: Optional[reg_alloc.LocalMoveHints] = None):
         super(CpuRegPool, self).__init__()
         self._fun = fun
         self._bbl = bbl
         self._allow_spilling = allow_spilling
+        self._move_hints = move_hints
 
         # set of registers that are ready to be allocated subject to the
         # reserved regions below. Should use an ordered set here?
@@ -209,20 +211,26 @@ class CpuRegPool(reg_alloc.RegPool):
             assert cpu_reg.kind == CpuRegKind.FLT
             self._flt_reserved[cpu_reg.no].current = 0
 
+    def _candidates(self, lr: reg_alloc.LiveRange, kind: CpuRegKind, count: int):
+        """The cpu reg numbers to try in order, coalescing hints first"""
+        if self._move_hints is None:
+            return range(count)
+        return self._move_hints.Order(lr, kind, count)
+
     def get_available_reg(self, lr: reg_alloc.LiveRange) -> ir.CpuReg:
         lac = liveness.LiveRangeFlag.LAC in lr.flags
         is_gpr = lr.reg.kind.flavor() != o.DK_FLAVOR_F
         available = self.get_available(lac, is_gpr)
         # print(f"GET {lr} {self}  avail:{available:x}")
         if not is_gpr:
-            for n in range(len(_FLT_REGS)):
+            for n in self._candidates(lr, CpuRegKind.FLT, len(_FLT_REGS)):
                 mask = 1 << n
                 if available & mask == mask:
                     if not self._flt_reserved[n].has_conflict(lr):
                         self.set_available(lac, is_gpr, available & ~mask)
                         return _KIND_TO_CPU_REG_LIST[lr.reg.kind][n]
         else:
-            for n in range(len(_GPR_REGS)):
+            for n in self._candidates(lr, CpuRegKind.GPR, len(_GPR_REGS)):
                 mask = 1 << n
                 if mask & available == mask:
                     if not self._gpr_reserved[n].has_conflict(lr):
@@ -270,9 +278,10 @@ class CpuRegPool(reg_alloc.RegPool):
 def _RunLinearScan(bbl: ir.Bbl, fun: ir.Fun, live_ranges: List[liveness.LiveRange], allow_spilling,
                    gpr_regs_lac: int, gpr_regs_not_lac: int,
                    flt_regs_lac: int,
-                   flt_regs_not_lac: int):
+                   flt_regs_not_lac: int, coalesce=False):
+    move_hints = reg_alloc.LocalMoveHints(bbl, live_ranges) if coalesce else None
     pool = CpuRegPool(fun, bbl, allow_spilling,
-                      gpr_regs_lac, gpr_regs_not_lac, flt_regs_lac, flt_regs_not_lac)
+                      gpr_regs_lac, gpr_regs_not_lac, flt_regs_lac, flt_regs_not_lac, move_hints)
     for lr in live_ranges:
         # since we are operating on a BBL we cannot change LiveRanges
         # extending beyond the BBL.
@@ -317,10 +326,13 @@ def _AssignAllocatedRegsAndReturnSpilledRegs(live_ranges) -> List[ir.Reg]:
     return out
 
 
-def _BblRegAllocOrSpill(bbl: ir.Bbl, fun: ir.Fun) -> int:
+def _BblRegAllocOrSpill(bbl: ir.Bbl, fun: ir.Fun, remat=False, coalesce=False) -> int:
     """Allocates regs to the intra bbl live ranges
 
     Note, this runs after global register allocation has occurred
+    If remat is set, spilled regs defined by a constant are rematerialized
+    at each use. Returns the number of rematerialized regs.
+    If coalesce is set, the allocator prefers cpu regs which turn movs into nops.
     """
     # print ("\n".join(serialize.BblRenderToAsm(bbl)))
 
@@ -342,14 +354,18 @@ def _BblRegAllocOrSpill(bbl: ir.Bbl, fun: ir.Fun) -> int:
     # be respected by the allocator.
     _RunLinearScan(bbl, fun, live_ranges, True,
                    GPR_REGS_MASK & GPR_LAC_REGS_MASK, GPR_REGS_MASK & ~GPR_LAC_REGS_MASK,
-                   FLT_REGS_MASK & FLT_LAC_REGS_MASK, FLT_REGS_MASK & ~FLT_LAC_REGS_MASK)
+                   FLT_REGS_MASK & FLT_LAC_REGS_MASK, FLT_REGS_MASK & ~FLT_LAC_REGS_MASK,
+                   coalesce)
     spilled_regs = _AssignAllocatedRegsAndReturnSpilledRegs(live_ranges)
+    remat_defs = {}
     if spilled_regs:
         # print (f"@@ adjusted spill count: {len(spilled_regs)} {spilled_regs}")
         # convert all register spills to loads/stores from/to the stack
         # this introduces new temporaries so we run another register allocation pass
         # afterwards
-        reg_alloc.BblSpillRegs(bbl, fun, spilled_regs, o.DK.U32, "$spill")
+        if remat:
+            remat_defs = reg_alloc.BblRematerializableDefs(bbl, spilled_regs)
+        reg_alloc.BblSpillRegs(bbl, fun, spilled_regs, o.DK.U32, "$spill", remat_defs)
 
         live_ranges = liveness.BblGetLiveRanges(bbl, fun, bbl.live_out)
         live_ranges.sort()
@@ -363,10 +379,11 @@ def _BblRegAllocOrSpill(bbl: ir.Bbl, fun: ir.Fun) -> int:
                 lr.cpu_reg = lr.reg.cpu_reg
         _RunLinearScan(bbl, fun, live_ranges, False,
                        GPR_REGS_MASK & GPR_LAC_REGS_MASK, GPR_REGS_MASK & ~GPR_LAC_REGS_MASK,
-                       FLT_REGS_MASK & FLT_LAC_REGS_MASK, FLT_REGS_MASK & ~FLT_LAC_REGS_MASK)
+                       FLT_REGS_MASK & FLT_LAC_REGS_MASK, FLT_REGS_MASK & ~FLT_LAC_REGS_MASK,
+                       coalesce)
         spilled_regs = _AssignAllocatedRegsAndReturnSpilledRegs(live_ranges)
         assert not spilled_regs
-    return 0
+    return len(remat_defs)
     # assert False
 
     # for reg
@@ -379,8 +396,8 @@ def _BblRegAllocOrSpill(bbl: ir.Bbl, fun: ir.Fun) -> int:
     # return count
 
 
-def FunLocalRegAlloc(fun):
-    return ir.FunGenericRewriteBbl(fun, _BblRegAllocOrSpill)
+def FunLocalRegAlloc(fun, remat=False, coalesce=False):
+    return ir.FunGenericRewriteBbl(fun, _BblRegAllocOrSpill, remat=remat, coalesce=coalesce)
 
 
 def _FunCpuRegStats(fun: ir.Fun) -> Tuple[int, int]:
@@ -401,15 +418,23 @@ def _FunCpuRegStats(fun: ir.Fun) -> Tuple[int, int]:
 
 def AssignCpuRegOrMarkForSpilling(assign_to: List[ir.Reg],
                                   cpu_reg_mask_first_choice: int,
-                                  cpu_reg_mask_second_choice: int) -> List[ir.Reg]:
+                                  cpu_reg_mask_second_choice: int,
+                                  hints: Optional[reg_alloc.GlobalMoveHints] = None) -> List[ir.Reg]:
     """
     Returns the regs that could not be assigned.
+    If hints are provided, a reg may share the cpu reg of a mov related reg.
     """
     # print (f"@@ AssignCpuRegOrMarkForSpilling {len(assign_to)} {cpu_reg_mask_first_choice:x} {cpu_reg_mask_second_choice:x}")
     out: List[ir.Reg] = []
     mask = cpu_reg_mask_first_choice
     pos = 0
     for reg in assign_to:
+        if hints is not None:
+            cpu_reg = hints.CpuReg(reg)
+            if cpu_reg is not None:
+                # shared with a mov related reg, does not use up a cpu reg
+                reg.cpu_reg = cpu_reg
+                continue
         if mask == 0 and cpu_reg_mask_second_choice != 0:
             mask = cpu_reg_mask_second_choice
             cpu_reg_mask_second_choice = 0
@@ -0,0 +1,32 @@
+# tail_call
+# the recursion is too deep for the stack unless the calls become jumps
+
+.fun count_down NORMAL [U32] = [U32 U32]
+.reg U32 [n acc r]
+.bbl start
+    poparg n
+    poparg acc
+    beq n 0 done
+    sub n = n 1
+    add acc = acc 3
+    pusharg acc
+    pusharg n
+    bsr count_down
+    poparg r
+    pusharg r
+    ret
+.bbl done
+    pusharg acc
+    ret
+
+.fun main NORMAL [S32] = []
+.reg U32 [x]
+.bbl start
+    pusharg 0:U32
+    pusharg 10000000:U32
+    bsr count_down
+    poparg x
+    pusharg x
+    bsr print_u_ln
+    pusharg 0:S32
+    ret
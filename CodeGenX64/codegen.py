@@ -8,11 +8,16 @@ See `README.md` for more details.
 import os
 import stat
 import collections
-from typing import List, Dict
+import functools
+from typing import Dict, Optional, Tuple
 
 from Base import cfg
+from Base import fun_cache
+from Base import inliner
 from Base import ir
 from Base import opcode_tab as o
+from Base import optimize
+from Base import parallel
 from Base import sanity
 from Base import serialize
 
@@ -28,7 +33,8 @@ from Elf import enum_tab
 from Elf import elf_unit
 
 
-def LegalizeAll(unit, opt_stats, fout, verbose=False):
+def LegalizeAll(unit, opt_stats, fout, verbose=False, pm=None, cmov=False):
+    run = optimize.PassRunner(pm)
     seeds = [f for f in [unit.fun_syms.get("_start"),
                          unit.fun_syms.get("main")] if f]
     if seeds:
@@ -37,25 +43,42 @@ def LegalizeAll(unit, opt_stats, fout, verbose=False):
         sanity.FunCheck(fun, unit, check_cfg=False, check_push_pop=True)
 
         if fun.kind is o.FUN_KIND.NORMAL:
-            legalize.PhaseOptimize(fun, unit, opt_stats, fout)
+            run("PhaseOptimize", legalize.PhaseOptimize, fun, unit, opt_stats, fout)
 
     for fun in unit.funs:
-        legalize.PhaseLegalization(fun, unit, opt_stats, fout)
+        run("PhaseLegalization", legalize.PhaseLegalization, fun, unit, opt_stats, fout, cmov)
 
 
-def RegAllocGlobal(unit, opt_stats, fout, verbose=False):
+def RegAllocGlobal(unit, opt_stats, fout, verbose=False, pm=None,
+                   spill_costs=False, coalesce=False) -> Dict[str, Tuple[int, int]]:
+    """Returns the spill costs (before, after) of each fun if spill_costs is set"""
+    run = optimize.PassRunner(pm)
+    report: Dict[str, Tuple[int, int]] = {}
     for fun in unit.funs:
         sanity.FunCheck(fun, unit, check_cfg=False, check_push_pop=False)
-        legalize.PhaseGlobalRegAlloc(fun, opt_stats, fout)
+        costs = run("PhaseGlobalRegAlloc", legalize.PhaseGlobalRegAlloc, fun, opt_stats, fout,
+                    spill_costs, coalesce)
+        if costs is not None:
+            report[fun.name] = costs
         if verbose:
             legalize.DumpFun("after global_reg_alloc", fun)
+    return report
 
 
-def RegAllocLocal(unit, opt_stats, fout, verbose=False):
+def RegAllocLocal(unit, opt_stats, fout, verbose=False, pm=None,
+                  share_stack_slots=False, coalesce=False) -> Dict[str, Tuple[int, int]]:
+    """Returns the stack sizes (before, after) of each fun if share_stack_slots is set"""
+    run = optimize.PassRunner(pm)
+    report: Dict[str, Tuple[int, int]] = {}
     for fun in unit.funs:
-        legalize.PhaseFinalizeStackAndLocalRegAlloc(fun, opt_stats, fout)
+        sizes = run("PhaseFinalizeStackAndLocalRegAlloc",
+                    legalize.PhaseFinalizeStackAndLocalRegAlloc, fun, opt_stats, fout,
+                    share_stack_slots, coalesce)
+        if sizes is not None:
+            report[fun.name] = sizes
         if verbose:
             legalize.DumpFun("after stack finalization", fun)
+    return report
 
 
 ############################################################
@@ -110,7 +133,7 @@ def _SimplifyCpuIns(cpu_ins: x64.Ins) -> bool:
     return True
 
 
-def _FunCodeGenText(fun: ir.Fun, _mod: ir.Unit):
+def _FunCodeGenText(fun: ir.Fun, _mod: ir.Unit, tail_calls=False):
     assert ir.FUN_FLAG.STACK_FINALIZED in fun.flags
     assert fun.stk_size >= 0, f"did you call FinalizeStk?"
     # DumpFun("codegen", fun)
@@ -127,8 +150,12 @@ def _FunCodeGenText(fun: ir.Fun, _mod: ir.Unit):
     for bbl in fun.bbls:
         live_out = sorted([r.name for r in bbl.live_out])
         yield f".bbl {bbl.name} 4"
-        for ins in bbl.inss:
-            if ins.opcode is o.NOP1:
+        for n, ins in enumerate(bbl.inss):
+            if tail_calls and ir.InsIsTailCall(fun, bbl, n):
+                for tmpl in isel_tab.EmitFunTailCall(ctx):
+                    yield _RenderIns(tmpl.MakeInsFromTmpl(ins, ctx))
+                break
+            elif ins.opcode is o.NOP1:
                 isel_tab.HandlePseudoNop1(ins, ctx)
             elif ins.opcode is o.RET:
                 for tmpl in isel_tab.EmitFunEpilog(ctx):
@@ -146,7 +173,7 @@ def _FunCodeGenText(fun: ir.Fun, _mod: ir.Unit):
     yield ".endfun"
 
 
-def EmitUnitAsText(unit: ir.Unit, fout):
+def EmitUnitAsText(unit: ir.Unit, fout, tail_calls=False):
     # we emit the memory stuff AFTER the code since the code generation may add new
     # memory for Consts
     for mem in unit.mems:
@@ -158,7 +185,7 @@ def EmitUnitAsText(unit: ir.Unit, fout):
     for fun in unit.funs:
         if fun.kind in {o.FUN_KIND.SIGNATURE}:
             continue
-        for s in _FunCodeGenText(fun, unit):
+        for s in _FunCodeGenText(fun, unit, tail_calls):
             print(s, file=fout)
 
 
@@ -194,8 +221,7 @@ def codegen(unit: ir.Unit) -> Unit:
 # binary emitter
 ############################################################
 
-def EmitUnitAsBinary(unit: ir.Unit) -> elf_unit.Unit:
-    elfunit = elf_unit.Unit()
+def _EmitMemsAsBinary(unit: ir.Unit, elfunit: elf_unit.Unit):
     for mem in unit.mems:
         assert mem.kind != o.MEM_KIND.EXTERN, f"undefined symbol: {mem}"
         if mem.kind == o.MEM_KIND.BUILTIN:
@@ -215,80 +241,277 @@ def EmitUnitAsBinary(unit: ir.Unit) -> elf_unit.Unit:
                 assert False
         elfunit.MemEnd()
 
-    sec_text = elfunit.sec_text
+
+def _EmitFunAsBinary(fun: ir.Fun, elfunit: elf_unit.Unit, tail_calls=False):
+    # print (f"Processing {fun.name}")
+    elfunit.FunStart(fun.name, 16, assembler.TextPadder)
+    for jtb in fun.jtbs:
+        elfunit.MemStart(jtb.name, 8, "rodata", True)
+        for i in range(jtb.size):
+            bbl = jtb.bbl_tab.get(i, jtb.def_bbl)
+            elfunit.AddBblAddr(
+                enum_tab.RELOC_TYPE_X86_64.X_64, 8, bbl.name)
+        elfunit.MemEnd()
+    ctx = regs.FunComputeEmitContext(fun)
+
+    for tmpl in isel_tab.EmitFunProlog(ctx):
+        assembler.AddIns(elfunit, tmpl.MakeInsFromTmpl(None, ctx))
+
+    for bbl in fun.bbls:
+        elfunit.AddLabel(bbl.name, 1, assembler.TextPadder)
+        for n, ins in enumerate(bbl.inss):
+            if tail_calls and ir.InsIsTailCall(fun, bbl, n):
+                for tmpl in isel_tab.EmitFunTailCall(ctx):
+                    assembler.AddIns(elfunit, tmpl.MakeInsFromTmpl(ins, ctx))
+                break
+            elif ins.opcode is o.NOP1:
+                isel_tab.HandlePseudoNop1(ins, ctx)
+            elif ins.opcode is o.LINE:
+                # TODO
+                pass
+            elif ins.opcode is o.RET:
+                for tmpl in isel_tab.EmitFunEpilog(ctx):
+                    assembler.AddIns(elfunit,
+                                     tmpl.MakeInsFromTmpl(None, ctx))
+            elif ins.opcode is o.INLINE:
+                tokens = str(ins.operands[0], "ascii").split()
+                cpu_ins = symbolic.InsFromSymbolized(tokens[0], tokens[1:])
+                # intentionally no simplification for now
+                assembler.AddIns(elfunit, cpu_ins)
+            else:
+                pattern = isel_tab.FindMatchingPattern(ins)
+                assert pattern, f"could not find pattern in fun {fun.name}\n{ins} {ins.operands}"
+                for tmpl in pattern.emit:
+                    cpu_ins = tmpl.MakeInsFromTmpl(ins, ctx)
+                    if _SimplifyCpuIns(cpu_ins):
+                        assembler.AddIns(elfunit, cpu_ins)
+    elfunit.FunEnd()
+
+
+def EmitUnitAsBinary(unit: ir.Unit, tail_calls=False) -> elf_unit.Unit:
+    """tail_calls replaces calls in tail position by jumps (see ir.InsIsTailCall)"""
+    elfunit = elf_unit.Unit()
+    _EmitMemsAsBinary(unit, elfunit)
     for fun in unit.funs:
-        # print (f"Processing {fun.name}")
-        elfunit.FunStart(fun.name, 16, assembler.TextPadder)
-        for jtb in fun.jtbs:
-            elfunit.MemStart(jtb.name, 8, "rodata", True)
-            for i in range(jtb.size):
-                bbl = jtb.bbl_tab.get(i, jtb.def_bbl)
-                elfunit.AddBblAddr(
-                    enum_tab.RELOC_TYPE_X86_64.X_64, 8, bbl.name)
-            elfunit.MemEnd()
-        ctx = regs.FunComputeEmitContext(fun)
-
-        for tmpl in isel_tab.EmitFunProlog(ctx):
-            assembler.AddIns(elfunit, tmpl.MakeInsFromTmpl(None, ctx))
-
-        for bbl in fun.bbls:
-            elfunit.AddLabel(bbl.name, 1, assembler.TextPadder)
-            for ins in bbl.inss:
-                if ins.opcode is o.NOP1:
-                    isel_tab.HandlePseudoNop1(ins, ctx)
-                elif ins.opcode is o.LINE:
-                    # TODO
-                    pass
-                elif ins.opcode is o.RET:
-                    for tmpl in isel_tab.EmitFunEpilog(ctx):
-                        assembler.AddIns(elfunit,
-                                         tmpl.MakeInsFromTmpl(None, ctx))
-                elif ins.opcode is o.INLINE:
-                    tokens = str(ins.operands[0], "ascii").split()
-                    cpu_ins = symbolic.InsFromSymbolized(tokens[0], tokens[1:])
-                    # intentionally no simplification for now
-                    assembler.AddIns(elfunit, cpu_ins)
+        _EmitFunAsBinary(fun, elfunit, tail_calls)
+    elfunit.AddLinkerDefs()
+    return elfunit
+
+
+def _FunSetCalleeCpuLiveInOut(fun: ir.Fun, fun_nos: Dict[ir.Fun, int], limit: int):
+    """Mimics which callees had their cpu_live_in/out set by PhaseLegalization
+
+    Liveness consults these for calls. When all phases run over all funs
+    (see LegalizeAll) only the funs before `limit` in unit.funs have been
+    through PhaseLegalization.
+    """
+    for bbl in fun.bbls:
+        for ins in bbl.inss:
+            for callee in ins.operands:
+                if not isinstance(callee, ir.Fun) or callee is fun:
+                    continue
+                if fun_nos.get(callee, limit) < limit:
+                    legalize.FunSetCpuLiveInOut(callee)
                 else:
-                    pattern = isel_tab.FindMatchingPattern(ins)
-                    assert pattern, f"could not find pattern in fun {fun.name}\n{ins} {ins.operands}"
-                    for tmpl in pattern.emit:
-                        cpu_ins = tmpl.MakeInsFromTmpl(ins, ctx)
-                        if _SimplifyCpuIns(cpu_ins):
-                            assembler.AddIns(elfunit, cpu_ins)
-        elfunit.FunEnd()
+                    callee.cpu_live_in = []
+                    callee.cpu_live_out = []
+
+
+def _FunCodeGenAsBinaryFragment(fun: ir.Fun, unit: ir.Unit,
+                                fun_nos: Dict[ir.Fun, int], tail_calls=False,
+                                cmov=False, spill_costs=False,
+                                share_stack_slots=False, coalesce=False) -> elf_unit.Unit:
+    """Runs all the phases of LegalizeAll, RegAllocGlobal and RegAllocLocal for a single fun
+
+    The result is identical to running each phase over all funs because
+    X64 legalization does not change signatures and the only other state
+    of callees that is used is set up by _FunSetCalleeCpuLiveInOut.
+    """
+    opt_stats: Dict[str, int] = collections.defaultdict(int)
+    sanity.FunCheck(fun, unit, check_cfg=False, check_push_pop=True)
+    if fun.kind is o.FUN_KIND.NORMAL:
+        _FunSetCalleeCpuLiveInOut(fun, fun_nos, 0)
+        legalize.PhaseOptimize(fun, unit, opt_stats, None)
+    _FunSetCalleeCpuLiveInOut(fun, fun_nos, fun_nos[fun])
+    legalize.PhaseLegalization(fun, unit, opt_stats, None, cmov)
+    _FunSetCalleeCpuLiveInOut(fun, fun_nos, len(fun_nos))
+    sanity.FunCheck(fun, unit, check_cfg=False, check_push_pop=False)
+    legalize.PhaseGlobalRegAlloc(fun, opt_stats, None, spill_costs, coalesce)
+    legalize.PhaseFinalizeStackAndLocalRegAlloc(fun, opt_stats, None, share_stack_slots,
+                                                coalesce)
+    frag = elf_unit.Unit()
+    _EmitFunAsBinary(fun, frag, tail_calls)
+    return frag
+
+
+def _BackendVersion() -> str:
+    return fun_cache.SourceHash([ir, legalize, assembler, elf_unit])
+
+
+def _FunCacheKey(fun: ir.Fun, fun_nos: Dict[ir.Fun, int], version: str) -> str:
+    """Covers everything _FunCodeGenAsBinaryFragment looks at outside of fun"""
+    callee_infos = []
+    for callee in fun_cache.FunCallees(fun):
+        # see _FunSetCalleeCpuLiveInOut for why the relative order matters
+        callee_infos.append(f"{callee.name} {callee.kind.name} {callee.output_types} "
+                            f"{callee.input_types} {fun_nos[callee] < fun_nos[fun]}")
+    return fun_cache.FunCacheKey(fun, callee_infos, version)
+
+
+def CodeGenUnitAsBinary(unit: ir.Unit, num_workers: int,
+                        cache: Optional[fun_cache.FunCache] = None,
+                        tail_calls=False, cmov=False, spill_costs=False,
+                        share_stack_slots=False, coalesce=False) -> elf_unit.Unit:
+    """Same as LegalizeAll + RegAllocGlobal + RegAllocLocal + EmitUnitAsBinary
+
+    but each fun is processed to completion independently, possibly in a
+    worker process (see parallel.UnitMapFuns), resulting in a text fragment
+    with its own local symbols and relocations. The fragments are concatenated
+    afterwards and relocated by assembler.Assemble as usual.
+    If a cache is provided only funs without an entry are processed.
+    Note, the funs in unit are not usable afterwards.
+    """
+    seeds = [f for f in [unit.fun_syms.get("_start"),
+                         unit.fun_syms.get("main")] if f]
+    if seeds:
+        cfg.UnitRemoveUnreachableCode(unit, seeds)
+    fun_nos = {fun: n for n, fun in enumerate(unit.funs)}
+    keys: Dict[ir.Fun, str] = {}
+    entries: Dict[ir.Fun, Tuple[elf_unit.Unit, parallel.ConstMems]] = {}
+    if cache is not None:
+        version = (_BackendVersion() + (" tail_calls" if tail_calls else "") +
+                   (" cmov" if cmov else "") + (" spill_costs" if spill_costs else "") +
+                   (" share_stack_slots" if share_stack_slots else "") +
+                   (" coalesce" if coalesce else ""))
+        for fun in unit.funs:
+            keys[fun] = _FunCacheKey(fun, fun_nos, version)
+            entry = cache.Get(keys[fun])
+            if entry is not None:
+                entries[fun] = entry
+    todo = [fun for fun in unit.funs if fun not in entries]
+    # const mems are added in the order of the funs below no matter
+    # which funs came from the cache, so the result is always the same
+    mems = list(unit.mems)
+    action = functools.partial(_FunCodeGenAsBinaryFragment, fun_nos=fun_nos,
+                               tail_calls=tail_calls, cmov=cmov, spill_costs=spill_costs,
+                               share_stack_slots=share_stack_slots, coalesce=coalesce)
+    for fun, entry in zip(todo, parallel.UnitMapFunsWithConstMems(
+            unit, todo, action, num_workers, copy_back=False)):
+        entries[fun] = entry
+        if cache is not None:
+            cache.Put(keys[fun], entry)
+    unit.mems = mems
+    unit.mem_syms = {mem.name: mem for mem in mems}
+    frags = []
+    for fun in unit.funs:
+        frag, const_mems = entries[fun]
+        parallel.MergeConstMems(unit, const_mems)
+        frags.append(frag)
+    # the mems must go first and their number may have grown by the legalization
+    elfunit = elf_unit.Unit()
+    _EmitMemsAsBinary(unit, elfunit)
+    for frag in frags:
+        elfunit.AddFragment(frag, assembler.TextPadder)
     elfunit.AddLinkerDefs()
     return elfunit
 
 
 if __name__ == "__main__":
+    import atexit
     import sys
     import argparse
 
     _ALLOWED_MODES = {"normal", "binary", "legalize", "reg_alloc_global",
                       "reg_alloc_local"}
 
+    def _PrintSpillCosts(report: Dict[str, Tuple[int, int]]):
+        for name, (before, after) in report.items():
+            print(f"# SPILL_COST {name} before: {before} after: {after}")
+        if report:
+            print(f"# SPILL_COST total before: {sum(x[0] for x in report.values())} "
+                  f"after: {sum(x[1] for x in report.values())}")
+
+    def _PrintStackSizes(report: Dict[str, Tuple[int, int]]):
+        for name, (before, after) in report.items():
+            print(f"# STACK_SIZE {name} before: {before} after: {after}")
+        if report:
+            print(f"# STACK_SIZE total before: {sum(x[0] for x in report.values())} "
+                  f"after: {sum(x[1] for x in report.values())}")
+
     def main():
         parser = argparse.ArgumentParser(description='CodeGenA64')
         parser.add_argument('-mode', type=str, help='mode')
-
+        parser.add_argument('-jobs', type=int, default=0,
+                            help='number of worker processes for mode binary')
+        parser.add_argument('-cache_dir', type=str, default="",
+                            help='directory for caching the code of funs in mode binary')
+
+        parser.add_argument('-pass_stats', type=str, default="",
+                            help='write per pass timing to this .json or .csv file '
+                                 '(not with -jobs or -cache_dir)')
+        parser.add_argument('-inline_budget', type=int, default=0,
+                            help='inline leaf funs with up to this many instructions')
+        parser.add_argument('-tail_calls', action='store_true',
+                            help='replace calls in tail position by jumps')
+        parser.add_argument('-cmov', action='store_true',
+                            help='use conditional moves for the cmpXX instructions')
+        parser.add_argument('-spill_costs', action='store_true',
+                            help='assign cpu regs to globals by loop weighted spill costs '
+                                 'and report the costs per fun (no report with -jobs)')
+        parser.add_argument('-share_stack_slots', action='store_true',
+                            help='overlap stack slots with disjoint lifetimes '
+                                 'and report the stack sizes per fun (no report with -jobs)')
+        parser.add_argument('-coalesce', action='store_true',
+                            help='prefer cpu regs that turn movs into nops '
+                                 'and report the movs removed (no report with -jobs)')
         parser.add_argument('input', type=str, help='input file')
         parser.add_argument('output', type=str, help='output file')
         args = parser.parse_args()
+        if args.pass_stats and (args.jobs or args.cache_dir):
+            # the per fun fragments are not generated via the PassManager
+            parser.error("-pass_stats cannot be combined with -jobs or -cache_dir")
 
         log = None
         assert args.mode in _ALLOWED_MODES
         fin = sys.stdin if args.input == "-" else open(args.input)
 
         unit = serialize.UnitParseFromAsm(fin)
+        if args.inline_budget:
+            inline_stats = inliner.UnitInline(unit, args.inline_budget)
+            print(f"# INLINE inlined: {inline_stats['inlined']}  "
+                  f"growth: {inline_stats['inline_growth']}")
         opt_stats: Dict[str, int] = collections.defaultdict(int)
+        pm = None
+        if args.pass_stats:
+            pm = optimize.PassManager()
+            # main() has many exits
+            atexit.register(pm.Save, args.pass_stats)
 
         if args.mode == "binary":
-            # we need to legalize all functions first as this may change the signature
-            # and fills in cpu reg usage which is used by subsequent interprocedural opts.
-            LegalizeAll(unit, opt_stats, None)
-            RegAllocGlobal(unit, opt_stats, None)
-            RegAllocLocal(unit, opt_stats, None)
-            x64unit = EmitUnitAsBinary(unit)
+            if args.cache_dir:
+                cache = fun_cache.FunCache(args.cache_dir)
+                x64unit = CodeGenUnitAsBinary(unit, max(1, args.jobs), cache, args.tail_calls,
+                                              args.cmov, args.spill_costs,
+                                              args.share_stack_slots, args.coalesce)
+                print(f"# CACHE {cache.StatsString()}")
+            elif args.jobs:
+                x64unit = CodeGenUnitAsBinary(unit, args.jobs, tail_calls=args.tail_calls,
+                                              cmov=args.cmov, spill_costs=args.spill_costs,
+                                              share_stack_slots=args.share_stack_slots,
+                                              coalesce=args.coalesce)
+            else:
+                # we need to legalize all functions first as this may change the signature
+                # and fills in cpu reg usage which is used by subsequent interprocedural opts.
+                LegalizeAll(unit, opt_stats, None, pm=pm, cmov=args.cmov)
+                _PrintSpillCosts(RegAllocGlobal(unit, opt_stats, None, pm=pm,
+                                                spill_costs=args.spill_costs,
+                                                coalesce=args.coalesce))
+                _PrintStackSizes(RegAllocLocal(unit, opt_stats, None, pm=pm,
+                                               share_stack_slots=args.share_stack_slots,
+                                               coalesce=args.coalesce))
+                if args.coalesce:
+                    print(f"# COALESCE movs removed: {opt_stats['movs_removed']}")
+                x64unit = EmitUnitAsBinary(unit, args.tail_calls)
             exe = assembler.Assemble(x64unit, True)
             exe.save(open(args.output, "wb"))
             os.chmod(args.output, stat.S_IREAD | stat.S_IEXEC | stat.S_IWRITE)
@@ -298,23 +521,28 @@ if __name__ == "__main__":
 
         # we need to legalize all functions first as this may change the signature
         # and fills in cpu reg usage which is used by subsequent interprocedural opts.
-        LegalizeAll(unit, opt_stats, log)
+        LegalizeAll(unit, opt_stats, log, pm=pm, cmov=args.cmov)
         if args.mode == "legalize":
             print("\n".join(serialize.UnitRenderToASM(unit)), file=fout)
             return
 
-        RegAllocGlobal(unit, opt_stats, log)
+        _PrintSpillCosts(RegAllocGlobal(unit, opt_stats, log, pm=pm,
+                                        spill_costs=args.spill_costs, coalesce=args.coalesce))
         if args.mode == "reg_alloc_global":
             print("\n".join(serialize.UnitRenderToASM(unit)), file=fout)
             return
 
-        RegAllocLocal(unit, opt_stats, log)
+        _PrintStackSizes(RegAllocLocal(unit, opt_stats, log, pm=pm,
+                                       share_stack_slots=args.share_stack_slots,
+                                       coalesce=args.coalesce))
+        if args.coalesce:
+            print(f"# COALESCE movs removed: {opt_stats['movs_removed']}")
         if args.mode == "reg_alloc_local":
             print("\n".join(serialize.UnitRenderToASM(unit)), file=fout)
             return
 
         assert args.mode == "normal"
-        EmitUnitAsText(unit, fout)
+        EmitUnitAsText(unit, fout, args.tail_calls)
         if False:
             print(f"# STATS:")
             for key, val in sorted(opt_stats.items()):
@@ -236,7 +236,7 @@ def _ExtractTmplArgOp(ins: ir.Ins, arg: P, ctx: regs.EmitContext) -> int:
         assert isinstance(reg, ir.Reg)
         assert reg.HasCpuReg()
         return reg.cpu_reg.no
-    elif arg in {P.reg0, P.reg1, P.reg2, P.reg3}:
+    elif arg in {P.reg0, P.reg1, P.reg2, P.reg3, P.reg4}:
         pos = arg.value - P.reg0.value
         reg = ops[pos]
         assert isinstance(
@@ -306,7 +306,7 @@ class InsTmpl:
             elif field in {x64.OK.MODRM_REG8, x64.OK.MODRM_REG16, x64.OK.MODRM_REG32, x64.OK.MODRM_REG64,
                            x64.OK.MODRM_RM_REG8, x64.OK.MODRM_RM_REG16, x64.OK.MODRM_RM_REG32,
                            x64.OK.MODRM_RM_REG64}:
-                assert op in {P.reg0, P.reg1, P.reg2, P.reg01,
+                assert op in {P.reg0, P.reg1, P.reg2, P.reg3, P.reg4, P.reg01,
                               P.tmp_gpr, P.scratch_gpr} or op in F_REGS, f"{op}"
             elif field in {x64.OK.MODRM_XREG32, x64.OK.MODRM_XREG64,
                            x64.OK.MODRM_RM_XREG32, x64.OK.MODRM_RM_XREG64}:
@@ -326,7 +326,7 @@ class InsTmpl:
             elif field is x64.OK.OFFABS8:
                 assert op in {0}, f"{op}"
             elif field in {x64.OK.IMM8, x64.OK.IMM16, x64.OK.IMM32, x64.OK.IMM32_64, x64.OK.IMM64}:
-                assert op in {P.num0, P.num1, P.num2} or isinstance(
+                assert op in {P.num0, P.num1, P.num2, P.num4} or isinstance(
                     op, int), f"{op}"
             elif field is x64.OK.OFFPCREL32:
                 assert op in {P.bbl0, P.bbl2, P.fun0}, f"{op}"
@@ -547,6 +547,14 @@ def EmitFunEpilog(ctx: regs.EmitContext) -> List[InsTmpl]:
     return out
 
 
+def EmitFunTailCall(ctx: regs.EmitContext) -> List[InsTmpl]:
+    """Like EmitFunEpilog but jumps to the callee (bsr) instead of returning"""
+    out = EmitFunEpilog(ctx)
+    assert out[-1].opcode.name == "ret"
+    out[-1] = InsTmpl("jmp_32", [P.fun0])
+    return out
+
+
 def _InsAddNop1ForCodeSel(ins: ir.Ins, fun: ir.Fun) -> Optional[List[ir.Ins]]:
     opc = ins.opcode
     if opc in {o.ST, o.SWITCH}:
@@ -991,6 +999,40 @@ def InitCondBraInt():
                      InsTmpl(f"{x64_jmp_swp}_32", [P.bbl2])])
 
 
+def _GetCmovInverted(dk: o.DK, opc):
+    """cmov condition under which src2 is selected, i.e. the inverted condition"""
+    if opc is o.CMPEQ:
+        return "cmovne"
+    assert opc is o.CMPLT
+    if dk in {o.DK.S8, o.DK.S16, o.DK.S32, o.DK.S64}:
+        return "cmovge"
+    else:
+        return "cmovae"  # above or equal
+
+
+def InitCmov():
+    """Only used with legalize.PhaseLegalization(cmov=True)
+
+    dst and src1 are the same (two address form) and all regs are locals
+    so no spilled variants are needed.
+    """
+    for kind1 in [o.DK.U32, o.DK.S32, o.DK.U64, o.DK.S64, o.DK.A64]:
+        bw = kind1.bitwidth()
+        for kind2 in [o.DK.U32, o.DK.S32, o.DK.U64, o.DK.S64, o.DK.A64]:
+            cbw = kind2.bitwidth()
+            ciw = 32 if cbw == 64 else cbw
+            for opc in [o.CMPEQ, o.CMPLT]:
+                x64_cmov = _GetCmovInverted(kind2, opc)
+                Pattern(opc, [kind1] * 3 + [kind2] * 2,
+                        [C.REG] * 5,
+                        [InsTmpl(f"cmp_{cbw}_r_mr", [P.reg3, P.reg4]),
+                         InsTmpl(f"{x64_cmov}_{bw}_r_mr", [P.reg01, P.reg2])])
+                Pattern(opc, [kind1] * 3 + [kind2] * 2,
+                        [C.REG] * 4 + [_KIND_TO_IMM[kind2]],
+                        [InsTmpl(f"cmp_{cbw}_mr_imm{ciw}", [P.reg3, P.num4]),
+                         InsTmpl(f"{x64_cmov}_{bw}_r_mr", [P.reg01, P.reg2])])
+
+
 def InitCondBraFlt():
     for kind1, suffix in [(o.DK.F32, "s"), (o.DK.F64, "d")]:
         for opc, x64_jmp, x64_jmp_swp in [(o.BEQ, "je", "je"),
@@ -1491,6 +1533,7 @@ InitMovInt()
 InitMovFlt()
 InitCondBraInt()
 InitCondBraFlt()
+InitCmov()
 InitLea()
 InitLoad()
 InitStore()
@@ -7,9 +7,11 @@ from Base import liveness
 from Base import lowering
 from Base import opcode_tab as o
 from Base import optimize
+from Base import reg_alloc
 from Base import reg_stats
 from Base import sanity
 from Base import serialize
+from Base import stack_slots
 from CodeGenX64 import isel_tab
 from CodeGenX64 import regs
 
@@ -160,6 +162,54 @@ def _FunRewriteIntoAABForm(fun: ir.Fun, unit: ir.Unit) -> int:
     return ir.FunGenericRewrite(fun, _InsRewriteIntoAABForm)
 
 
+# cmpXX with these kinds are implemented via cmp + cmov if requested
+_CMOV_KINDS = {o.DK.U32, o.DK.S32, o.DK.U64, o.DK.S64, o.DK.A64}
+
+
+def InsIsCmov(ins: ir.Ins) -> bool:
+    ops = ins.operands
+    return ops[0].kind in _CMOV_KINDS and ops[3].kind in _CMOV_KINDS
+
+
+def _InsRewriteCmpForCmov(ins: ir.Ins, fun: ir.Fun) -> Optional[List[ir.Ins]]:
+    """Brings cmpXX into the form expected by the cmov patterns
+
+    cmpXX dst = src1 src2 cmp1 cmp2
+    =>
+    mov t = src1
+    cmpXX t = t src2' cmp1' cmp2'
+    mov dst = t
+
+    The primed operands are copied into fresh regs, except for cmp2 if it
+    is a suitable immediate. Since these regs are local they are never
+    spilled which keeps the number of patterns small.
+    """
+    if ins.opcode.kind is not o.OPC_KIND.CMP:
+        return None
+    ops = ins.operands
+    out = []
+
+    def copy(op, purpose):
+        reg = fun.GetScratchReg(op.kind, purpose, False)
+        out.append(ir.Ins(o.MOV, [reg, op]))
+        return reg
+
+    src2 = copy(ops[2], "cmov_src")
+    cmp1 = copy(ops[3], "cmov_cmp")
+    cmp2 = ops[4]
+    if isinstance(cmp2, ir.Reg) or IsOutOfBoundImmediate(ins.opcode, cmp2, 4):
+        cmp2 = copy(cmp2, "cmov_cmp")
+    dst = copy(ops[1], "cmov")
+    dst.flags |= ir.REG_FLAG.TWO_ADDRESS
+    out.append(ir.Ins(ins.opcode, [dst, dst, src2, cmp1, cmp2]))
+    out.append(ir.Ins(o.MOV, [ops[0], dst]))
+    return out
+
+
+def _FunRewriteCmpForCmov(fun: ir.Fun) -> int:
+    return ir.FunGenericRewrite(fun, _InsRewriteCmpForCmov)
+
+
 def _InsMoveEliminationCpu(ins: ir.Ins, _fun: ir.Fun) -> Optional[List[ir.Ins]]:
     # TODO: handle conv
     if ins.opcode not in {o.MOV}:
@@ -182,7 +232,13 @@ def PhaseOptimize(fun: ir.Fun, unit: ir.Unit, opt_stats: Dict[str, int], fout):
     optimize.FunOptBasic(fun, opt_stats, allow_conv_conversion=True)
 
 
-def PhaseLegalization(fun: ir.Fun, unit: ir.Unit, _opt_stats: Dict[str, int], fout):
+def FunSetCpuLiveInOut(fun: ir.Fun):
+    fun.cpu_live_in = regs.PushPopInterface.GetCpuRegsForInSignature(fun.input_types)
+    fun.cpu_live_out = regs.PushPopInterface.GetCpuRegsForOutSignature(fun.output_types)
+
+
+def PhaseLegalization(fun: ir.Fun, unit: ir.Unit, _opt_stats: Dict[str, int], fout,
+                      cmov=False):
     """
     Does a lot of the heavily lifting so that the instruction selector can remain
     simple and table driven.
@@ -191,6 +247,9 @@ def PhaseLegalization(fun: ir.Fun, unit: ir.Unit, _opt_stats: Dict[str, int], fo
     * rewrite immediates that cannot be expanded except stack offsets which are dealt with in
       another pass
 
+    cmov keeps the int cmpXX instructions (see InsIsCmov) instead of turning
+    them into branches.
+
     TODO: missing is a function to change calling signature so that
     """
     if fout:
@@ -198,8 +257,7 @@ def PhaseLegalization(fun: ir.Fun, unit: ir.Unit, _opt_stats: Dict[str, int], fo
         print(f"# Legalize {fun.name}", file=fout)
         print("#" * 60, file=fout)
 
-    fun.cpu_live_in = regs.PushPopInterface.GetCpuRegsForInSignature(fun.input_types)
-    fun.cpu_live_out = regs.PushPopInterface.GetCpuRegsForOutSignature(fun.output_types)
+    FunSetCpuLiveInOut(fun)
     if fun.kind is not o.FUN_KIND.NORMAL:
         return
 
@@ -219,7 +277,7 @@ def PhaseLegalization(fun: ir.Fun, unit: ir.Unit, _opt_stats: Dict[str, int], fo
 
     lowering.FunEliminateCopySign(fun)
     # TODO: support a few special cases in the isel, e.g. cmpXX a 0, 1, x, y
-    lowering.FunEliminateCmp(fun)
+    lowering.FunEliminateCmp(fun, InsIsCmov if cmov else None)
 
     canonicalize.FunCanonicalize(fun)
     # TODO: add a cfg linearization pass to improve control flow
@@ -232,6 +290,9 @@ def PhaseLegalization(fun: ir.Fun, unit: ir.Unit, _opt_stats: Dict[str, int], fo
     # mul/div/rem need special treatment
     _FunRewriteDivRemShiftsCAS(fun)
 
+    if cmov:
+        _FunRewriteCmpForCmov(fun)
+
     _FunRewriteIntoAABForm(fun, unit)
 
     # Recompute Everything (TODO: make this more selective to reduce work)
@@ -366,7 +427,7 @@ def _GetRegPoolsForGlobals(needed: RegsNeeded, regs_lac: int,
 
 
 def GlobalRegAllocOneKind(fun: ir.Fun, kind: regs.CpuRegKind, needed: RegsNeeded, regs_lac,
-                          regs_not_lac, regs_lac_mask, global_reg_stats, debug):
+                          regs_not_lac, regs_lac_mask, global_reg_stats, debug, hints=None):
     pre_allocated = 0
     for reg in fun.regs:
         if reg.HasCpuReg() and reg.cpu_reg.kind == kind:
@@ -382,17 +443,18 @@ def GlobalRegAllocOneKind(fun: ir.Fun, kind: regs.CpuRegKind, needed: RegsNeeded
         print(f"@@ {kind.name} POOL {global_lac:x} {global_not_lac:x}", file=debug)
 
     if True:
-        regs.AssignCpuRegOrMarkForSpilling(global_reg_stats[(kind, True)], global_lac, 0)
+        regs.AssignCpuRegOrMarkForSpilling(global_reg_stats[(kind, True)], global_lac, 0, hints)
         regs.AssignCpuRegOrMarkForSpilling(
             global_reg_stats[(kind, False)],
             global_not_lac & ~regs_lac_mask,
-            global_not_lac & regs_lac_mask)
+            global_not_lac & regs_lac_mask, hints)
     else:
         regs.AssignCpuRegOrMarkForSpilling(global_reg_stats[(kind, True)], 0, 0)
         regs.AssignCpuRegOrMarkForSpilling(global_reg_stats[(kind, False)], 0, 0)
 
 
-def PhaseGlobalRegAlloc(fun: ir.Fun, _opt_stats: Dict[str, int], fout):
+def PhaseGlobalRegAlloc(fun: ir.Fun, opt_stats: Dict[str, int], fout,
+                        spill_costs=False, coalesce=False) -> Optional[Tuple[int, int]]:
     """
     These phase introduces CpuReg for globals and situations where we have no choice
     which register to use, e.g. function parameters and results ("pre-allocated" regs).
@@ -409,6 +471,14 @@ def PhaseGlobalRegAlloc(fun: ir.Fun, _opt_stats: Dict[str, int], fout):
     We separate global from local register allocation so that we can use a straight
     forward linear scan allocator for the locals. This allocator assumes that
     each register is defined exactly once and hence does not work for globals.
+
+    spill_costs hands out the cpu regs in the order of the loop weighted spill costs
+    (see reg_stats.GlobalRegSpillCosts) and returns the cost of the spilled globals
+    for the default order and for the spill cost order.
+
+    coalesce lets a global share the cpu reg of a global or pre-allocated reg it is
+    connected to by a mov if the two do not interfere (see reg_alloc.GlobalMoveHints)
+    so that the mov can be removed after allocation.
     """
     debug = None
     if fout:
@@ -420,13 +490,20 @@ def PhaseGlobalRegAlloc(fun: ir.Fun, _opt_stats: Dict[str, int], fout):
 
     reg_stats.FunComputeRegStatsExceptLAC(fun)
     reg_stats.FunDropUnreferencedRegs(fun)
-    liveness.FunComputeLivenessInfo(fun)
+    liveness.FunEnsureLivenessInfo(fun)
     reg_stats.FunComputeRegStatsLAC(fun)
 
     local_reg_stats = reg_stats.FunComputeBblRegUsageStats(fun,
                                                            regs.REG_KIND_TO_CPU_REG_FAMILY)
     # we  have introduced some cpu regs in previous phases - do not treat them as globals
     global_reg_stats = reg_stats.FunGlobalRegStats(fun, regs.REG_KIND_TO_CPU_REG_FAMILY)
+    costs = reg_stats.GlobalRegSpillCosts(fun, global_reg_stats) if spill_costs else None
+    hints = None
+    if coalesce:
+        hints = reg_alloc.GlobalMoveHints(
+            fun, [reg for global_regs in global_reg_stats.values() for reg in global_regs],
+            set(regs.MaskToGprRegs(regs.GPR_REGS_MASK & ~regs.GPR_REG_IMPLICIT_MASK) +
+                regs.MaskToFltRegs(regs.FLT_REGS_MASK)))
     if fout:
         DumpRegStats(fun, local_reg_stats, fout)
 
@@ -438,7 +515,7 @@ def PhaseGlobalRegAlloc(fun: ir.Fun, _opt_stats: Dict[str, int], fout):
     GlobalRegAllocOneKind(fun, regs.CpuRegKind.GPR, needed_gpr,
                           regs.GPR_REGS_MASK & regs.GPR_LAC_REGS_MASK & ~regs.GPR_REG_IMPLICIT_MASK,
                           regs.GPR_REGS_MASK & ~regs.GPR_LAC_REGS_MASK & ~regs.GPR_REG_IMPLICIT_MASK,
-                          regs.GPR_LAC_REGS_MASK, global_reg_stats, debug)
+                          regs.GPR_LAC_REGS_MASK, global_reg_stats, debug, hints)
 
     needed_flt = RegsNeeded(len(global_reg_stats[(regs.CpuRegKind.FLT, True)]),
                             len(global_reg_stats[(regs.CpuRegKind.FLT, False)]),
@@ -447,14 +524,29 @@ def PhaseGlobalRegAlloc(fun: ir.Fun, _opt_stats: Dict[str, int], fout):
     GlobalRegAllocOneKind(fun, regs.CpuRegKind.FLT, needed_flt,
                           regs.FLT_REGS_MASK & regs.FLT_LAC_REGS_MASK,
                           regs.FLT_REGS_MASK & ~regs.FLT_LAC_REGS_MASK,
-                          regs.FLT_LAC_REGS_MASK, global_reg_stats, debug)
+                          regs.FLT_LAC_REGS_MASK, global_reg_stats, debug, hints)
+    # cpu reg assignments change the liveness at calls
+    fun.InvalidateAnalyses()
+    if costs is None:
+        return None
+    before, after = costs.Report()
+    opt_stats["spill_cost_before"] += before
+    opt_stats["spill_cost_after"] += after
+    return before, after
 
 
 def PhaseFinalizeStackAndLocalRegAlloc(fun: ir.Fun,
-                                       _opt_stats: Dict[str, int], fout):
+                                       opt_stats: Dict[str, int], fout,
+                                       share_stack_slots=False,
+                                       coalesce=False) -> Optional[Tuple[int, int]]:
     """Finalizing the stack implies performing all transformations that
     could increase register usage.
 
+    If share_stack_slots is set, stack slots with disjoint lifetimes are overlapped
+    and the stack size (before, after) is returned.
+    coalesce makes the local allocator prefer the cpu regs of mov sources and
+    destinations (see reg_alloc.LocalMoveHints) and counts the movs removed.
+
     """
     # print("@@@@@@\n", "\n".join(serialize.FunRenderToAsm(fun)), file=fout)
 
@@ -473,14 +565,14 @@ def PhaseFinalizeStackAndLocalRegAlloc(fun: ir.Fun,
 
     reg_stats.FunComputeRegStatsExceptLAC(fun)
     reg_stats.FunDropUnreferencedRegs(fun)
-    liveness.FunComputeLivenessInfo(fun)
+    liveness.FunEnsureLivenessInfo(fun)
     reg_stats.FunComputeRegStatsLAC(fun)
     # DumpRegStats(fun, local_reg_stats)
     # DumpFun("after global alloc", fun)
 
     isel_tab.FunAddNop1ForCodeSel(fun)
     if True:
-        regs.FunLocalRegAlloc(fun)
+        regs.FunLocalRegAlloc(fun, coalesce)
     else:
         for reg in fun.regs:
             if reg.IsSpilled() or reg.HasCpuReg():
@@ -491,8 +583,16 @@ def PhaseFinalizeStackAndLocalRegAlloc(fun: ir.Fun,
             else:
                 reg.cpu_reg = ir.StackSlot(0)
     fun.FinalizeStackSlots()
+    sizes = None
+    if share_stack_slots:
+        sizes = stack_slots.FunShareStackSlots(fun)
+        opt_stats["stack_size_before"] += sizes[0]
+        opt_stats["stack_size_after"] += sizes[1]
     # if fun.name == "fibonacci": DumpFun("after local alloc", fun)
     # DumpFun("after local alloc", fun)
     # cleanup
-    _FunMoveEliminationCpu(fun)
+    movs_removed = _FunMoveEliminationCpu(fun)
+    if coalesce:
+        opt_stats["movs_removed"] += movs_removed
     # print ("@@@@@@\n", "\n".join(serialize.FunRenderToAsm(fun)))
+    return sizes
@@ -65,6 +65,8 @@ _RELOC_KIND_MAP = {
     "condbr19": (enum_tab.RELOC_TYPE_AARCH64.CONDBR19, True),
     #
     "call26": (enum_tab.RELOC_TYPE_AARCH64.CALL26, False),
+    # tail calls
+    "fun_jump26": (enum_tab.RELOC_TYPE_AARCH64.JUMP26, False),
     "abs32": (enum_tab.RELOC_TYPE_AARCH64.ABS32, False),
     "abs64": (enum_tab.RELOC_TYPE_AARCH64.ABS64, False),
     "adr_prel_pg_hi21": (enum_tab.RELOC_TYPE_AARCH64.ADR_PREL_PG_HI21, False),
@@ -87,7 +89,8 @@ _RELOC_OK = {
 
 def _EmitReloc(ins: a64.Ins, pos: int) -> str:
     if ins.reloc_kind == enum_tab.RELOC_TYPE_AARCH64.JUMP26:
-        assert ins.is_local_sym, f"expected local symbol"
+        if not ins.is_local_sym:
+            return f"expr:fun_jump26:{ins.reloc_symbol}"
         return f"expr:jump26:{ins.reloc_symbol}"
     elif ins.reloc_kind == enum_tab.RELOC_TYPE_AARCH64.ADR_PREL_PG_HI21:
         loc = "loc_" if ins.is_local_sym else ""
@@ -112,6 +112,48 @@ class Unit:
         assert self.current_fun is not None
         self.AddSymbol(name, self.sec_text, True)
 
+    def AddFragment(self, frag: "Unit", text_padder: Any):
+        """Appends the sections, symbols and relocations of another unit
+
+        frag usually contains a single function which was emitted independently,
+        e.g. by a worker process. Each section of frag is appended at an offset
+        aligned to the largest alignment used inside it, so the first item in
+        each section of frag must also be the one with the largest alignment.
+        Global symbols are unified by name. Local symbols stay separate.
+        """
+        assert self.current_fun is None and self.mem_sec is None
+        sec_map = {}
+        for frag_sec, sec, padder in [(frag.sec_text, self.sec_text, text_padder),
+                                      (frag.sec_rodata, self.sec_rodata, ZERO_BYTE),
+                                      (frag.sec_data, self.sec_data, ZERO_BYTE),
+                                      (frag.sec_bss, self.sec_bss, ZERO_BYTE)]:
+            if frag_sec.sh_addralign > 1:
+                sec.PadData(frag_sec.sh_addralign, padder)
+            sec_map[id(frag_sec)] = (sec, len(sec.data))
+            sec.AddData(frag_sec.data)
+
+        sym_map = {}
+        for frag_sym in frag.symbols:
+            sec, offset = sec_map.get(id(frag_sym.section), (None, 0))
+            is_local = frag_sym.st_bind == elf.ST_INFO_BIND.LOCAL
+            sym = None if is_local else self.global_symbol_map.get(frag_sym.name)
+            if sym is None:
+                sym = elf.Symbol.Init(frag_sym.name, is_local, sec, frag_sym.st_value + offset)
+                self.symbols.append(sym)
+                if not is_local:
+                    self.global_symbol_map[sym.name] = sym
+            elif sec is not None:
+                # the symbol was forward declared and now we are filling in the missing info
+                assert sym.is_undefined(), f"{sym} already defined"
+                sym.section = sec
+                sym.st_value = frag_sym.st_value + offset
+            sym_map[id(frag_sym)] = sym
+
+        for rel in frag.relocations:
+            sec, offset = sec_map[id(rel.section)]
+            self.relocations.append(elf.Reloc.Init(
+                rel.r_type, sec, rel.r_offset + offset, sym_map[id(rel.symbol)], rel.r_addend))
+
     def AddLinkerDefs(self):
         """must be called last - do we really need linkerdefs?"""
         if self.sec_bss.sh_size > 0:
@@ -0,0 +1,276 @@
+# many addresses that are live across calls, the allocator has to spill them
+# and -remat recomputes them instead of reloading them
+# requires std_lib.asm
+
+.mem table 4 RW
+.data 128 [0]
+
+.fun bump NORMAL [U32] = [A32 U32]
+.bbl start
+  poparg p:A32
+  poparg d:U32
+  ld v:U32 = p 0
+  add v = v d
+  st p 0 = v
+  pusharg v
+  ret
+
+.fun mix NORMAL [U32] = [U32]
+.reg U32 [n acc i d v]
+.reg A32 [p00 p01 p02 p03 p04 p05 p06 p07 p08 p09 p10 p11 p12 p13 p14 p15 p16 p17 p18 p19 p20 p21 p22 p23 p24 p25 p26 p27 p28 p29 p30 p31]
+
+.bbl start
+  poparg n
+  lea.mem p00 = table 0
+  lea.mem p01 = table 4
+  lea.mem p02 = table 8
+  lea.mem p03 = table 12
+  lea.mem p04 = table 16
+  lea.mem p05 = table 20
+  lea.mem p06 = table 24
+  lea.mem p07 = table 28
+  lea.mem p08 = table 32
+  lea.mem p09 = table 36
+  lea.mem p10 = table 40
+  lea.mem p11 = table 44
+  lea.mem p12 = table 48
+  lea.mem p13 = table 52
+  lea.mem p14 = table 56
+  lea.mem p15 = table 60
+  lea.mem p16 = table 64
+  lea.mem p17 = table 68
+  lea.mem p18 = table 72
+  lea.mem p19 = table 76
+  lea.mem p20 = table 80
+  lea.mem p21 = table 84
+  lea.mem p22 = table 88
+  lea.mem p23 = table 92
+  lea.mem p24 = table 96
+  lea.mem p25 = table 100
+  lea.mem p26 = table 104
+  lea.mem p27 = table 108
+  lea.mem p28 = table 112
+  lea.mem p29 = table 116
+  lea.mem p30 = table 120
+  lea.mem p31 = table 124
+  mov acc = 0
+  mov i = 0
+
+.bbl loop
+  add d = i 0
+  pusharg d
+  pusharg p00
+  bsr bump
+  poparg v
+  add acc = acc v
+  add d = i 1
+  pusharg d
+  pusharg p01
+  bsr bump
+  poparg v
+  xor acc = acc v
+  add d = i 2
+  pusharg d
+  pusharg p02
+  bsr bump
+  poparg v
+  add acc = acc v
+  add d = i 3
+  pusharg d
+  pusharg p03
+  bsr bump
+  poparg v
+  xor acc = acc v
+  add d = i 4
+  pusharg d
+  pusharg p04
+  bsr bump
+  poparg v
+  add acc = acc v
+  add d = i 5
+  pusharg d
+  pusharg p05
+  bsr bump
+  poparg v
+  xor acc = acc v
+  add d = i 6
+  pusharg d
+  pusharg p06
+  bsr bump
+  poparg v
+  add acc = acc v
+  add d = i 7
+  pusharg d
+  pusharg p07
+  bsr bump
+  poparg v
+  xor acc = acc v
+  add d = i 8
+  pusharg d
+  pusharg p08
+  bsr bump
+  poparg v
+  add acc = acc v
+  add d = i 9
+  pusharg d
+  pusharg p09
+  bsr bump
+  poparg v
+  xor acc = acc v
+  add d = i 10
+  pusharg d
+  pusharg p10
+  bsr bump
+  poparg v
+  add acc = acc v
+  add d = i 11
+  pusharg d
+  pusharg p11
+  bsr bump
+  poparg v
+  xor acc = acc v
+  add d = i 12
+  pusharg d
+  pusharg p12
+  bsr bump
+  poparg v
+  add acc = acc v
+  add d = i 13
+  pusharg d
+  pusharg p13
+  bsr bump
+  poparg v
+  xor acc = acc v
+  add d = i 14
+  pusharg d
+  pusharg p14
+  bsr bump
+  poparg v
+  add acc = acc v
+  add d = i 15
+  pusharg d
+  pusharg p15
+  bsr bump
+  poparg v
+  xor acc = acc v
+  add d = i 16
+  pusharg d
+  pusharg p16
+  bsr bump
+  poparg v
+  add acc = acc v
+  add d = i 17
+  pusharg d
+  pusharg p17
+  bsr bump
+  poparg v
+  xor acc = acc v
+  add d = i 18
+  pusharg d
+  pusharg p18
+  bsr bump
+  poparg v
+  add acc = acc v
+  add d = i 19
+  pusharg d
+  pusharg p19
+  bsr bump
+  poparg v
+  xor acc = acc v
+  add d = i 20
+  pusharg d
+  pusharg p20
+  bsr bump
+  poparg v
+  add acc = acc v
+  add d = i 21
+  pusharg d
+  pusharg p21
+  bsr bump
+  poparg v
+  xor acc = acc v
+  add d = i 22
+  pusharg d
+  pusharg p22
+  bsr bump
+  poparg v
+  add acc = acc v
+  add d = i 23
+  pusharg d
+  pusharg p23
+  bsr bump
+  poparg v
+  xor acc = acc v
+  add d = i 24
+  pusharg d
+  pusharg p24
+  bsr bump
+  poparg v
+  add acc = acc v
+  add d = i 25
+  pusharg d
+  pusharg p25
+  bsr bump
+  poparg v
+  xor acc = acc v
+  add d = i 26
+  pusharg d
+  pusharg p26
+  bsr bump
+  poparg v
+  add acc = acc v
+  add d = i 27
+  pusharg d
+  pusharg p27
+  bsr bump
+  poparg v
+  xor acc = acc v
+  add d = i 28
+  pusharg d
+  pusharg p28
+  bsr bump
+  poparg v
+  add acc = acc v
+  add d = i 29
+  pusharg d
+  pusharg p29
+  bsr bump
+  poparg v
+  xor acc = acc v
+  add d = i 30
+  pusharg d
+  pusharg p30
+  bsr bump
+  poparg v
+  add acc = acc v
+  add d = i 31
+  pusharg d
+  pusharg p31
+  bsr bump
+  poparg v
+  xor acc = acc v
+  add i = i 1
+  blt i n loop
+
+.bbl exit
+  pusharg acc
+  ret
+
+
+.fun main NORMAL [S32] = []
+
+.bbl start
+  pusharg 10:U32
+  bsr mix
+  poparg x:U32
+  pusharg x
+  bsr print_u_ln
+
+  pusharg 1000:U32
+  bsr mix
+  poparg y:U32
+  pusharg y
+  bsr print_u_ln
+
+  pusharg 0:S32
+  ret
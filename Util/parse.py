@@ -2,7 +2,7 @@ import codecs
 import re
 import struct
 
-from typing import List, Optional, BinaryIO
+from typing import List, Optional, BinaryIO, Any
 
 
 def read_leb128(r: BinaryIO, signed: bool = False) -> int:
@@ -235,3 +235,94 @@ def ToHexString(key, n):
 def FltToHexString(n):
     x = struct.pack('<d', n)
     return ToHexString('F', int.from_bytes(x, "little"))
+
+
+# chars ending a name/num token
+_TOKEN_END = frozenset('=[];"#\' \r\n\t')
+# chars only _ScanLine deals with
+_RE_NEEDS_SCAN = re.compile(r"[,;']")
+
+
+def _ScanLine(line: str) -> List[Any]:
+    """Character at a time version of ParseLineWithLists for the general case"""
+    out: List[Any] = []
+    tokens = out
+    end = len(line)
+    i = 0
+    while i < end:
+        c = line[i]
+        if c in " \r\n\t'=":
+            i += 1
+        elif c == "#":
+            break
+        elif c == '"':
+            j = i + 1
+            while j < end:
+                c = line[j]
+                if c == '"':
+                    j += 1
+                    break
+                j += 2 if c == "\\" else 1
+            else:
+                # unterminated strings extend to the end of the line
+                j = end
+                assert line.endswith('"'), f"unterminated string {line}"
+            tokens.append(line[i:j])
+            i = j
+        elif c == "[":
+            assert tokens is out, f"nested list {line}"
+            tokens = []
+            out.append(tokens)
+            i += 1
+        elif c == "]":
+            assert tokens is not out, f"unbalanced list {line}"
+            tokens = out
+            i += 1
+        elif c == "," or c == ";":
+            raise ValueError(f"commas and semicolons are not allowed {line}")
+        else:
+            j = i + 1
+            while j < end and line[j] not in _TOKEN_END:
+                j += 1
+            tokens.append(line[i:j])
+            i = j
+    assert tokens is out, f"bad line {line}"
+    return out
+
+
+def _NestLists(tokens: List[str], line: str) -> List[Any]:
+    out: List[Any] = []
+    current = out
+    for t in tokens:
+        if t == "[":
+            assert current is out, f"nested list {line}"
+            current = []
+            out.append(current)
+        elif t == "]":
+            assert current is not out, f"unbalanced list {line}"
+            current = out
+        else:
+            current.append(t)
+    assert current is out, f"bad line {line}"
+    return out
+
+
+def ParseLineWithLists(line: str) -> List[Any]:
+    """Tokenizes line in a single pass
+
+    Unlike ParseLine (which is kept as the reference) comments and `=` are
+    dropped and each `[...]` becomes a list of tokens.
+    """
+    if ('"' not in line and "#" not in line and "[" not in line and "]" not in line and
+            "," not in line and ";" not in line and "'" not in line):
+        # fast path: opcode and .bbl lines (chained `in` beat a regex here)
+        return line.replace("=", " ").split()
+    if '"' not in line:
+        pos = line.find("#")
+        if pos >= 0:
+            line = line[:pos]
+        if _RE_NEEDS_SCAN.search(line) is None:
+            # lines with lists like .reg
+            line = line.replace("=", " ").replace("[", " [ ").replace("]", " ] ")
+            return _NestLists(line.split(), line)
+    return _ScanLine(line)